@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+JSON Backend Benchmark'ı
+/predict ve /metrics endpoint'lerinin Flask test client üzerinden
+throughput'unu stdlib ve orjson JSON backend'leri ile karşılaştırır.
+
+Kullanım:
+    python benchmarks/bench_json.py [--requests 5000]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+# Src dizinini path'e ekle
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from app import app  # noqa: E402
+from json_provider import create_json_provider, orjson  # noqa: E402
+
+PREDICT_BODY = json.dumps({"value": 42, "name": "Test User"})
+
+
+def run_endpoint(client, endpoint, count):
+    """Endpoint'e count kadar istek at, saniyedeki istek sayısını döndür"""
+    if endpoint == "/predict":
+
+        def call():
+            return client.post(
+                "/predict", data=PREDICT_BODY, content_type="application/json"
+            )
+
+    else:
+
+        def call():
+            return client.get(endpoint)
+
+    # Isınma
+    for _ in range(min(100, count)):
+        call()
+
+    start = time.perf_counter()
+    for _ in range(count):
+        response = call()
+        assert response.status_code == 200
+    return count / (time.perf_counter() - start)
+
+
+def main():
+    """Benchmark'ı çalıştır ve sonuçları JSON olarak yazdır"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=5000)
+    args = parser.parse_args()
+
+    backends = ["stdlib"] + (["orjson"] if orjson is not None else [])
+    results = {"requests": args.requests, "backends": {}}
+
+    original_provider = app.json
+    try:
+        for backend in backends:
+            app.json = create_json_provider(app, backend)
+            client = app.test_client()
+            results["backends"][backend] = {
+                endpoint: round(run_endpoint(client, endpoint, args.requests), 1)
+                for endpoint in ("/predict", "/metrics")
+            }
+    finally:
+        app.json = original_provider
+
+    if "orjson" in results["backends"]:
+        results["speedup"] = {
+            endpoint: round(
+                results["backends"]["orjson"][endpoint]
+                / results["backends"]["stdlib"][endpoint],
+                2,
+            )
+            for endpoint in ("/predict", "/metrics")
+        }
+
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Tahmin Tablosu Benchmark'ı
+Analitik tahmin yolu ile tam sayı value'lar için önceden hesaplanmış
+tabloyu (PREDICTION_TABLE=exact) karşılaştırır: doğruluk (analitik sonuçla
+fark) ve kayıt başına süre (tekil tahmin + kategori, uçtan uca predict +
+format_response). Tablo sadece tekil predict() içindir; predict_batch
+analitik hesaplar.
+
+Kullanım:
+    python benchmarks/bench_prediction_table.py [--records 10000] [--repeat 5]
+"""
+
+import argparse
+import json
+import os
+import sys
+import timeit
+
+import numpy as np
+
+# Src dizinini path'e ekle
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from model import SimpleModel  # noqa: E402
+from utils import format_response, prediction_category  # noqa: E402
+
+
+def make_values(count, integers, seed=42):
+    """0-100 aralığında tam sayı veya (3 ondalıklı) ondalıklı value'lar"""
+    rng = np.random.default_rng(seed)
+    if integers:
+        return rng.integers(0, 101, count).astype(np.float64)
+    return np.round(rng.uniform(0, 100, count), 3)
+
+
+def analytic_single(value):
+    """Tablo öncesi tekil yol: tahmin + format_response kategorisi"""
+    prediction = round(SimpleModel._score_values(value), 4)
+    return prediction, prediction_category(prediction)
+
+
+def bench(func, count, repeat):
+    """Kayıt başına en iyi süreyi (mikro saniye) döndür"""
+    return min(timeit.repeat(func, number=1, repeat=repeat)) / count * 1e6
+
+
+def accuracy(table, values):
+    """Tablonun analitik sonuçlardan farkı"""
+    pairs = [
+        (entry, analytic_single(value))
+        for value, entry in ((value, table.lookup(value)) for value in values)
+        if entry is not None
+    ]
+    return {
+        "coverage": round(len(pairs) / len(values), 4),
+        "max_abs_error": max(
+            (abs(entry[0] - reference[0]) for entry, reference in pairs), default=0.0
+        ),
+        "mismatches": sum(entry[0] != reference[0] for entry, reference in pairs),
+        "category_mismatches": sum(
+            entry[1] != reference[1] for entry, reference in pairs
+        ),
+    }
+
+
+def run_mode(mode, values, records, repeat):
+    """Bir tablo modu için doğruluk ve süreler"""
+    model = SimpleModel(table_mode=mode)
+    table = model.table
+    value_list = values.tolist()
+    result = {"table": table.describe() if table is not None else None}
+
+    if table is None:
+        single = lambda: [analytic_single(value) for value in value_list]  # noqa
+    else:
+        result["accuracy"] = accuracy(table, value_list)
+        single = lambda: [  # noqa
+            table.lookup(value) or analytic_single(value) for value in value_list
+        ]
+
+    def end_to_end():
+        for record in records:
+            format_response(model.predict(record), record)
+
+    count = len(values)
+    result["single_us_per_record"] = round(bench(single, count, repeat), 4)
+    result["end_to_end_us_per_record"] = round(bench(end_to_end, count, repeat), 4)
+    return result
+
+
+def main():
+    """Benchmark'ı çalıştır ve sonuçları JSON olarak yazdır"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--records", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    results = {"records": args.records}
+    for name, integers in (("integer_values", True), ("float_values", False)):
+        values = make_values(args.records, integers)
+        records = [{"value": value} for value in values.tolist()]
+        modes = {
+            mode: run_mode(mode, values, records, args.repeat)
+            for mode in ("off", "exact")
+        }
+        for key in ("single", "end_to_end"):
+            modes["exact"][f"{key}_speedup"] = round(
+                modes["off"][f"{key}_us_per_record"]
+                / modes["exact"][f"{key}_us_per_record"],
+                2,
+            )
+        results[name] = modes
+
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
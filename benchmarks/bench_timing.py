@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+İstek Süresi Kaydı Benchmark'ı
+RequestTimingRecorder.record çağrısının istek başına maliyetini farklı
+örnekleme oranlarında ölçer (mikrosaniye).
+
+Kullanım:
+    python benchmarks/bench_timing.py [--iterations 200000]
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+import time
+
+# Src dizinini path'e ekle
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from timing import RequestTimingRecorder  # noqa: E402
+
+PAYLOAD = {"value": 42, "name": "Test User"}
+
+
+def measure(sample_rate, iterations):
+    """record() çağrısı başına ortalama süre (mikrosaniye)"""
+    recorder = RequestTimingRecorder(sample_rate=sample_rate, slow_threshold_ms=500)
+    start = time.perf_counter()
+    for _ in range(iterations):
+        recorder.record("/predict", "POST", 200, 0.0012, data=PAYLOAD)
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def main():
+    """Benchmark'ı çalıştır ve sonuçları JSON olarak yazdır"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=200000)
+    args = parser.parse_args()
+
+    results = {"iterations": args.iterations, "per_request_us": {}}
+    for log_level in ("WARNING", "INFO"):
+        # Loglar kuyruğa gider; ölçüm sadece request thread'indeki maliyettir
+        logging.getLogger().setLevel(log_level)
+        for sample_rate in (1.0, 0.1, 0.01):
+            key = f"log={log_level},sample_rate={sample_rate}"
+            results["per_request_us"][key] = round(
+                measure(sample_rate, args.iterations), 3
+            )
+
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Validasyon Micro-Benchmark'ı
+Tüm hataları döndüren validate_input ile ilk hatada duran eski
+implementasyonun (regex her çağrıda re.match ile aranır) kayıt başına
+maliyetini karşılaştırır.
+
+Kullanım:
+    python benchmarks/bench_validation.py [--records 10000] [--repeat 5]
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+import timeit
+
+# Src dizinini path'e ekle
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from utils import validate_input, validate_records  # noqa: E402
+
+
+def legacy_validate_input(data):
+    """Önceki implementasyon (karşılaştırma için)"""
+    if not isinstance(data, dict):
+        return {
+            "valid": False,
+            "message": "Veri dictionary formatında olmalı",
+            "reason": "not_dict",
+        }
+
+    if "value" in data:
+        try:
+            value = float(data["value"])
+            if value < 0 or value > 100:
+                return {
+                    "valid": False,
+                    "message": "Value 0-100 arasında olmalı",
+                    "reason": "value_range",
+                }
+        except (ValueError, TypeError):
+            return {
+                "valid": False,
+                "message": "Value sayısal bir değer olmalı",
+                "reason": "value_type",
+            }
+
+    if "email" in data:
+        email = data["email"]
+        pattern = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
+        if not isinstance(email, str) or re.match(pattern, email) is None:
+            return {
+                "valid": False,
+                "message": "Geçersiz email formatı",
+                "reason": "email_format",
+            }
+
+    if "name" in data:
+        name = data["name"]
+        if not isinstance(name, str) or len(name.strip()) < 2:
+            return {
+                "valid": False,
+                "message": "Name en az 2 karakter olmalı",
+                "reason": "name_length",
+            }
+
+    return {"valid": True, "message": "Veri doğrulaması başarılı"}
+
+
+def make_records(count):
+    """Karışık (geçerli/geçersiz) test kayıtları üret"""
+    templates = [
+        {"value": 50},
+        {"value": 75.5, "name": "Test User", "email": "test@example.com"},
+        {"value": 150},
+        {"value": "abc"},
+        {"value": 10, "email": "invalid-email"},
+        {},
+    ]
+    return [dict(templates[i % len(templates)]) for i in range(count)]
+
+
+def bench(func, records, repeat):
+    """Kayıt başına en iyi süreyi (mikro saniye) döndür"""
+    timings = timeit.repeat(lambda: func(records), number=1, repeat=repeat)
+    return min(timings) / len(records) * 1e6
+
+
+def main():
+    """Benchmark'ı çalıştır ve sonuçları JSON olarak yazdır"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--records", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    records = make_records(args.records)
+
+    results = {
+        "records": args.records,
+        "legacy_us_per_record": bench(
+            lambda rs: [legacy_validate_input(r) for r in rs], records, args.repeat
+        ),
+        "current_us_per_record": bench(
+            lambda rs: [validate_input(r) for r in rs], records, args.repeat
+        ),
+        "current_batch_us_per_record": bench(validate_records, records, args.repeat),
+    }
+    results["speedup"] = round(
+        results["legacy_us_per_record"] / results["current_us_per_record"], 2
+    )
+
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
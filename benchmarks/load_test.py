@@ -0,0 +1,315 @@
+#!/usr/bin/env python3
+"""
+API Yük Testi ve Benchmark Aracı
+/predict, geçersiz input ile /predict, /health ve /metrics endpoint'lerine
+eşzamanlı istek atar; throughput ve latency yüzdeliklerini JSON olarak
+raporlar. Kayıtlı bir baseline ile karşılaştırıp regresyon varsa hata
+koduyla çıkar.
+
+Kullanım:
+    # Flask test client ile (ağ yok)
+    python benchmarks/load_test.py --mode client --concurrency 8
+
+    # Gerçek local sunucu ile (werkzeug, rastgele port)
+    python benchmarks/load_test.py --mode server --requests 2000
+
+    # Dışarıda çalışan bir sunucuya karşı (örn. gunicorn)
+    python benchmarks/load_test.py --url http://localhost:5000
+
+    # Baseline kaydet / karşılaştır
+    python benchmarks/load_test.py --save-baseline benchmarks/baseline.json
+    python benchmarks/load_test.py --baseline benchmarks/baseline.json --threshold 20
+"""
+
+import argparse
+import http.client
+import json
+import math
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+from urllib.parse import urlparse
+
+# Src dizinini path'e ekle
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Senaryo adı -> (method, path, body, beklenen status kodları)
+SCENARIOS = {
+    "predict": ("POST", "/predict", json.dumps({"value": 42}), (200,)),
+    "predict_invalid": ("POST", "/predict", json.dumps({"value": 150}), (400,)),
+    "health": ("GET", "/health", None, (200,)),
+    "metrics": ("GET", "/metrics", None, (200,)),
+}
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Sıralı listeden yüzdelik değer (nearest-rank)"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def summarize(latencies: List[float], errors: int, duration: float) -> Dict[str, Any]:
+    """Latency listesinden rapor oluştur (latency'ler saniye cinsinden)"""
+    ordered = sorted(latencies)
+    total = len(ordered) + errors
+    return {
+        "requests": total,
+        "errors": errors,
+        "duration_s": round(duration, 3),
+        "throughput_rps": round(total / duration, 1) if duration > 0 else 0.0,
+        "latency_ms": {
+            "mean": round(sum(ordered) / len(ordered) * 1000, 3) if ordered else 0.0,
+            "p50": round(percentile(ordered, 50) * 1000, 3),
+            "p90": round(percentile(ordered, 90) * 1000, 3),
+            "p95": round(percentile(ordered, 95) * 1000, 3),
+            "p99": round(percentile(ordered, 99) * 1000, 3),
+            "max": round(ordered[-1] * 1000, 3) if ordered else 0.0,
+        },
+    }
+
+
+def client_requester(scenario: str) -> Callable[[], Callable[[], int]]:
+    """Flask test client ile istek atan fonksiyon üreticisi (thread başına)"""
+    from app import app
+
+    method, path, body, _ = SCENARIOS[scenario]
+
+    def factory():
+        client = app.test_client()
+
+        def request():
+            response = client.open(
+                path, method=method, data=body, headers=JSON_HEADERS if body else None
+            )
+            return response.status_code
+
+        return request
+
+    return factory
+
+
+def http_requester(base_url: str, scenario: str) -> Callable[[], Callable[[], int]]:
+    """HTTP üzerinden (keep-alive bağlantı ile) istek atan fonksiyon üreticisi"""
+    parsed = urlparse(base_url)
+    method, path, body, _ = SCENARIOS[scenario]
+
+    def factory():
+        state = {"connection": None}
+
+        def request():
+            if state["connection"] is None:
+                state["connection"] = http.client.HTTPConnection(
+                    parsed.hostname, parsed.port or 80, timeout=30
+                )
+            connection = state["connection"]
+            try:
+                connection.request(
+                    method, path, body=body, headers=JSON_HEADERS if body else {}
+                )
+                response = connection.getresponse()
+                response.read()
+                if response.getheader("Connection", "").lower() == "close":
+                    connection.close()
+                    state["connection"] = None
+                return response.status
+            except (OSError, http.client.HTTPException):
+                connection.close()
+                state["connection"] = None
+                raise
+
+        return request
+
+    return factory
+
+
+def run_scenario(
+    factory: Callable[[], Callable[[], int]],
+    expected: tuple,
+    total_requests: int,
+    concurrency: int,
+    warmup: int = 50,
+) -> Dict[str, Any]:
+    """Senaryoyu verilen eşzamanlılıkla çalıştır"""
+    per_worker = [total_requests // concurrency] * concurrency
+    for i in range(total_requests % concurrency):
+        per_worker[i] += 1
+
+    barrier = threading.Barrier(concurrency + 1)
+
+    def worker(count):
+        try:
+            request = factory()
+            for _ in range(min(warmup, count)):
+                request()
+        except BaseException:
+            # Hedefe ulaşılamıyorsa diğer thread'ler barrier'da beklemesin
+            barrier.abort()
+            raise
+        latencies, errors = [], 0
+        barrier.wait()
+        for _ in range(count):
+            start = time.perf_counter()
+            try:
+                ok = request() in expected
+            except Exception:
+                ok = False
+            elapsed = time.perf_counter() - start
+            if ok:
+                latencies.append(elapsed)
+            else:
+                errors += 1
+        return latencies, errors
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        futures = [executor.submit(worker, count) for count in per_worker]
+        try:
+            barrier.wait()
+        except threading.BrokenBarrierError:
+            # Isınma hatasını (örn. bağlantı reddedildi) olduğu gibi yükselt
+            for future in futures:
+                error = future.exception()
+                if not isinstance(error, threading.BrokenBarrierError):
+                    raise error
+            raise
+        start = time.perf_counter()
+        results = [future.result() for future in futures]
+        duration = time.perf_counter() - start
+
+    latencies = [
+        latency for worker_latencies, _ in results for latency in worker_latencies
+    ]
+    errors = sum(worker_errors for _, worker_errors in results)
+    return summarize(latencies, errors, duration)
+
+
+def start_local_server():
+    """Flask uygulamasını rastgele portta thread'li werkzeug sunucusunda başlat"""
+    from werkzeug.serving import make_server
+
+    from app import app
+
+    server = make_server("127.0.0.1", 0, app, threaded=True)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server, f"http://127.0.0.1:{server.server_port}"
+
+
+def compare_to_baseline(
+    report: Dict[str, Any], baseline: Dict[str, Any], threshold_pct: float
+) -> List[str]:
+    """
+    Raporu baseline ile karşılaştırır
+
+    Throughput threshold'dan fazla düştüyse veya p99 latency threshold'dan
+    fazla arttıysa regresyon sayılır.
+
+    Returns:
+        Regresyon açıklamaları (boşsa regresyon yok)
+    """
+    regressions = []
+    factor = threshold_pct / 100
+    for scenario, current in report["scenarios"].items():
+        previous = baseline.get("scenarios", {}).get(scenario)
+        if previous is None:
+            continue
+
+        old_rps, new_rps = previous["throughput_rps"], current["throughput_rps"]
+        if old_rps > 0 and new_rps < old_rps * (1 - factor):
+            regressions.append(
+                f"{scenario}: throughput {old_rps} -> {new_rps} rps "
+                f"({(new_rps / old_rps - 1) * 100:.1f}%)"
+            )
+
+        old_p99 = previous["latency_ms"]["p99"]
+        new_p99 = current["latency_ms"]["p99"]
+        if old_p99 > 0 and new_p99 > old_p99 * (1 + factor):
+            regressions.append(
+                f"{scenario}: p99 latency {old_p99} -> {new_p99} ms "
+                f"(+{(new_p99 / old_p99 - 1) * 100:.1f}%)"
+            )
+    return regressions
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="API yük testi",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("--mode", choices=("client", "server"), default="client")
+    parser.add_argument("--url", help="Dışarıda çalışan sunucu (mode'u ezer)")
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument(
+        "--scenarios", default=",".join(SCENARIOS), help="Virgülle ayrılmış liste"
+    )
+    parser.add_argument("--output", help="Raporun yazılacağı dosya")
+    parser.add_argument("--baseline", help="Karşılaştırılacak baseline dosyası")
+    parser.add_argument("--save-baseline", help="Raporu baseline olarak kaydet")
+    parser.add_argument(
+        "--threshold", type=float, default=20.0, help="İzin verilen regresyon (%%)"
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Ana fonksiyon - regresyon varsa 1 döndürür"""
+    args = parse_args(argv)
+    scenarios = [name.strip() for name in args.scenarios.split(",") if name.strip()]
+    unknown = set(scenarios) - set(SCENARIOS)
+    if unknown:
+        print(f"❌ Bilinmeyen senaryo: {', '.join(sorted(unknown))}", file=sys.stderr)
+        return 2
+
+    server = None
+    base_url = args.url
+    mode = "external" if args.url else args.mode
+    if mode == "server":
+        server, base_url = start_local_server()
+
+    try:
+        report = {
+            "mode": mode,
+            "concurrency": args.concurrency,
+            "scenarios": {},
+        }
+        for scenario in scenarios:
+            if base_url:
+                factory = http_requester(base_url, scenario)
+            else:
+                factory = client_requester(scenario)
+            report["scenarios"][scenario] = run_scenario(
+                factory, SCENARIOS[scenario][3], args.requests, args.concurrency
+            )
+    finally:
+        if server is not None:
+            server.shutdown()
+
+    output = json.dumps(report, indent=2)
+    print(output)
+    for path in filter(None, (args.output, args.save_baseline)):
+        with open(path, "w") as f:
+            f.write(output + "\n")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare_to_baseline(report, baseline, args.threshold)
+        if regressions:
+            print("❌ Performans regresyonu:", file=sys.stderr)
+            for regression in regressions:
+                print(f"   - {regression}", file=sys.stderr)
+            return 1
+        print(f"✅ Baseline'a göre regresyon yok (eşik: %{args.threshold})")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Başlangıç Süresi Raporu
+Container soğuk başlangıcını temiz bir Python process'inde ölçer:
+modül bazında import süreleri (python -X importtime), uygulama import
+süresi, ilk request süresi ve model ısıtma süresi.
+
+Kullanım:
+    python benchmarks/startup_report.py [--runs 5] [--top 15] [--budget-ms 2000]
+
+--budget-ms verilirse import + ilk request medyanı bütçeyi aştığında
+çıkış kodu 1 olur (CI'da regresyon kontrolü için).
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src")
+
+# Ölçüm process'inde çalışan script; sonuçları JSON olarak yazar
+MEASURE_SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+import app as app_module
+imported = time.perf_counter()
+client = app_module.app.test_client()
+response = client.post("/predict", json={"value": 42})
+assert response.status_code == 200, response.get_data(as_text=True)
+first_request = time.perf_counter()
+lazy_modules = [name for name in ("numpy", "asyncio") if name in sys.modules]
+app_module.model_warmup.run()
+warmed_up = time.perf_counter()
+response = client.post("/predict/batch", json=[{"value": 42}] * 10)
+assert response.status_code == 200, response.get_data(as_text=True)
+first_batch = time.perf_counter()
+print(json.dumps({
+    "import_ms": (imported - start) * 1000,
+    "first_request_ms": (first_request - imported) * 1000,
+    "warmup_ms": (warmed_up - first_request) * 1000,
+    "first_batch_ms": (first_batch - warmed_up) * 1000,
+    "loaded_before_warmup": lazy_modules,
+}))
+"""
+
+
+def run_python(args, env=None):
+    """src dizininde yeni bir Python process'i çalıştır"""
+    process_env = dict(os.environ, LOG_LEVEL="WARNING", **(env or {}))
+    return subprocess.run(
+        [sys.executable, *args],
+        cwd=SRC_DIR,
+        env=process_env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def parse_importtime(output):
+    """
+    -X importtime çıktısını ayrıştır
+
+    Returns:
+        {'module', 'self_ms', 'cumulative_ms', 'depth'} listesi
+    """
+    modules = []
+    for line in output.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        depth = (len(name) - len(name.lstrip())) // 2
+        modules.append(
+            {
+                "module": name.strip(),
+                "self_ms": int(self_us) / 1000,
+                "cumulative_ms": int(cumulative_us) / 1000,
+                "depth": depth,
+            }
+        )
+    return modules
+
+
+def profile_imports(top):
+    """'import app' için en pahalı doğrudan import'lar ve self süreleri"""
+    result = run_python(["-X", "importtime", "-c", "import app"])
+    modules = parse_importtime(result.stderr)
+    app_entry = next(m for m in modules if m["module"] == "app")
+    # depth 1: app'in (dolaylı olarak ilk kez) yüklediği üst seviye modüller
+    direct = [m for m in modules if m["depth"] == 1]
+    return {
+        "app_cumulative_ms": app_entry["cumulative_ms"],
+        "direct_imports": [
+            {"module": m["module"], "cumulative_ms": round(m["cumulative_ms"], 2)}
+            for m in sorted(direct, key=lambda m: -m["cumulative_ms"])[:top]
+        ],
+        "self_time": [
+            {"module": m["module"], "self_ms": round(m["self_ms"], 2)}
+            for m in sorted(modules, key=lambda m: -m["self_ms"])[:top]
+        ],
+    }
+
+
+def measure_startup(runs):
+    """Import, ilk request ve ısıtma sürelerinin medyanları (ms)"""
+    samples = [
+        json.loads(run_python(["-c", MEASURE_SCRIPT]).stdout.splitlines()[-1])
+        for _ in range(runs)
+    ]
+    keys = ("import_ms", "first_request_ms", "warmup_ms", "first_batch_ms")
+    results = {
+        key: round(statistics.median(sample[key] for sample in samples), 2)
+        for key in keys
+    }
+    results["time_to_first_request_ms"] = round(
+        results["import_ms"] + results["first_request_ms"], 2
+    )
+    results["loaded_before_warmup"] = samples[-1]["loaded_before_warmup"]
+    return results
+
+
+def main():
+    """Raporu JSON olarak yazdır"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--budget-ms", type=float, default=None)
+    args = parser.parse_args()
+
+    report = {
+        "python": sys.version.split()[0],
+        "runs": args.runs,
+        "startup": measure_startup(args.runs),
+        "imports": profile_imports(args.top),
+    }
+    print(json.dumps(report, indent=2))
+
+    if args.budget_ms is not None:
+        elapsed = report["startup"]["time_to_first_request_ms"]
+        if elapsed > args.budget_ms:
+            print(
+                f"❌ Başlangıç süresi bütçeyi aştı: {elapsed}ms > {args.budget_ms}ms",
+                file=sys.stderr,
+            )
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
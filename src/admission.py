@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+"""
+Admission Control - CI/CD Örneği
+Yük altında tahmin isteklerini kuyrukta bekletmek yerine hızlıca reddeder:
+istemci başına token bucket hız limiti (429) ve global eşzamanlılık
+limiti ile kuyruk bekleme süresi eşiği (503). Reddedilen isteklere
+Retry-After süresi döndürülür; kabul edilen isteklerin gecikmesi sınırlı
+kalır ve sağlık endpoint'leri yanıt vermeye devam eder.
+
+Limitler process başınadır; gunicorn'da container limiti worker sayısı
+ile çarpılarak ayarlanmalıdır.
+"""
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import NamedTuple, Optional
+
+from metrics import ShardedCounter
+
+
+class Rejection(NamedTuple):
+    """Reddedilen istek için HTTP yanıt bilgisi"""
+
+    status: int
+    reason: str
+    retry_after: float
+    message: str
+
+
+class TokenBucket:
+    """Tek istemcinin token bucket durumu"""
+
+    __slots__ = ("tokens", "updated")
+
+    def __init__(self, tokens: float, updated: float):
+        self.tokens = tokens
+        self.updated = updated
+
+
+class RateLimiter:
+    """
+    İstemci başına token bucket hız limiti
+
+    Her istemci saniyede `rate` token kazanır, en fazla `burst` token
+    biriktirir; her istek bir token harcar. En fazla max_clients istemci
+    tutulur, en uzun süredir görülmeyen istemci atılır (LRU). rate 0 ise
+    limit kapalıdır.
+    """
+
+    def __init__(
+        self,
+        rate: Optional[float] = None,
+        burst: Optional[float] = None,
+        max_clients: Optional[int] = None,
+    ):
+        self.rate = (
+            float(os.environ.get("RATE_LIMIT_PER_SECOND", 0)) if rate is None else rate
+        )
+        if burst is None:
+            burst = float(os.environ.get("RATE_LIMIT_BURST", max(1.0, self.rate)))
+        self.burst = burst
+        self.max_clients = max_clients or int(
+            os.environ.get("RATE_LIMIT_MAX_CLIENTS", 10000)
+        )
+        if self.rate < 0 or self.burst < 1:
+            raise ValueError("rate negatif, burst 1'den küçük olamaz")
+        self._buckets: "OrderedDict[str, TokenBucket]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        """Hız limiti açık mı"""
+        return self.rate > 0
+
+    def check(self, client: str, now: Optional[float] = None) -> float:
+        """
+        İstemci için bir token harca
+
+        Returns:
+            İzin verildiyse 0; verilmediyse bir sonraki token'a kalan saniye
+        """
+        if not self.enabled:
+            return 0.0
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            bucket = self._buckets.get(client)
+            if bucket is None:
+                bucket = self._buckets[client] = TokenBucket(self.burst, now)
+                if len(self._buckets) > self.max_clients:
+                    self._buckets.popitem(last=False)
+            else:
+                self._buckets.move_to_end(client)
+                bucket.tokens = min(
+                    self.burst, bucket.tokens + (now - bucket.updated) * self.rate
+                )
+                bucket.updated = now
+            if bucket.tokens >= 1:
+                bucket.tokens -= 1
+                return 0.0
+            return (1 - bucket.tokens) / self.rate
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+
+class ConcurrencyLimiter:
+    """
+    Aynı anda işlenen istek sayısı limiti
+
+    Limit doluysa istek en fazla verilen süre kadar yer bekler; limit 0 ise
+    kapalıdır.
+    """
+
+    def __init__(self, limit: Optional[int] = None):
+        self.limit = (
+            int(os.environ.get("MAX_CONCURRENT_PREDICTIONS", 0))
+            if limit is None
+            else limit
+        )
+        if self.limit < 0:
+            raise ValueError("limit negatif olamaz")
+        self._semaphore = threading.BoundedSemaphore(max(self.limit, 1))
+        self._in_flight = ShardedCounter()
+
+    @property
+    def enabled(self) -> bool:
+        """Eşzamanlılık limiti açık mı"""
+        return self.limit > 0
+
+    def acquire(self, timeout: float) -> bool:
+        """Yer al; timeout saniye içinde alınamazsa False"""
+        if not self.enabled:
+            return True
+        if not self._semaphore.acquire(timeout=max(timeout, 0)):
+            return False
+        self._in_flight.add(1)
+        return True
+
+    def release(self):
+        """acquire() ile alınan yeri bırak"""
+        if self.enabled:
+            self._in_flight.add(-1)
+            self._semaphore.release()
+
+    @property
+    def in_flight(self) -> int:
+        """Limit altında işlenen istek sayısı"""
+        return self._in_flight.value()
+
+
+def parse_request_start(value: Optional[str]) -> Optional[float]:
+    """
+    Proxy'nin eklediği X-Request-Start başlığını unix zamanına çevir
+
+    "t=1700000000.123" (saniye, nginx $msec), milisaniye veya mikrosaniye
+    formatları kabul edilir. Okunamazsa None.
+    """
+    if not value:
+        return None
+    try:
+        timestamp = float(value.strip().removeprefix("t="))
+    except ValueError:
+        return None
+    if timestamp > 1e14:
+        return timestamp / 1e6
+    if timestamp > 1e11:
+        return timestamp / 1e3
+    return timestamp
+
+
+class AdmissionController:
+    """
+    Kuyruk bekleme süresi, hız limiti ve eşzamanlılık limitini sırayla uygular
+
+    max_queue_wait (saniye) hem proxy'de geçen süre (X-Request-Start) hem de
+    eşzamanlılık limitinde yer beklemek için toplam bütçedir. Varsayılan 0:
+    kuyruk süresi eşiği kapalıdır, eşzamanlılık limiti (açıksa) beklemeden
+    reddeder.
+    """
+
+    def __init__(
+        self,
+        rate_limiter: Optional[RateLimiter] = None,
+        concurrency: Optional[ConcurrencyLimiter] = None,
+        max_queue_wait: Optional[float] = None,
+        retry_after: Optional[float] = None,
+    ):
+        self.rate_limiter = RateLimiter() if rate_limiter is None else rate_limiter
+        self.concurrency = ConcurrencyLimiter() if concurrency is None else concurrency
+        self.max_queue_wait = (
+            float(os.environ.get("MAX_QUEUE_WAIT_MS", 0)) / 1000
+            if max_queue_wait is None
+            else max_queue_wait
+        )
+        self.retry_after = (
+            float(os.environ.get("SHED_RETRY_AFTER", 1))
+            if retry_after is None
+            else retry_after
+        )
+
+    def admit(
+        self, client: str, request_start: Optional[float] = None
+    ) -> Optional[Rejection]:
+        """
+        İsteği kabul et veya reddet
+
+        Kabul edilen her istek için işi bitince release() çağrılmalıdır.
+
+        Args:
+            client: İstemci anahtarı (API key veya IP)
+            request_start: İsteğin proxy'ye ulaştığı unix zamanı (biliniyorsa)
+
+        Returns:
+            Kabul edildiyse None, değilse Rejection
+        """
+        waited = 0.0
+        if request_start is not None:
+            waited = max(0.0, time.time() - request_start)
+            if self.max_queue_wait > 0 and waited > self.max_queue_wait:
+                return Rejection(
+                    503,
+                    "queue_timeout",
+                    self.retry_after,
+                    "İstek kuyrukta çok bekledi",
+                )
+
+        retry_after = self.rate_limiter.check(client)
+        if retry_after > 0:
+            return Rejection(429, "rate_limited", retry_after, "İstek limiti aşıldı")
+
+        if not self.concurrency.acquire(self.max_queue_wait - waited):
+            return Rejection(
+                503, "concurrency", self.retry_after, "Sunucu kapasitesi dolu"
+            )
+        return None
+
+    def release(self):
+        """Kabul edilen isteğin eşzamanlılık yerini bırak"""
+        self.concurrency.release()
+
+    def describe(self):
+        """Limit ayarları ve anlık durum"""
+        return {
+            "rate_limit_per_second": self.rate_limiter.rate,
+            "rate_limit_burst": self.rate_limiter.burst,
+            "tracked_clients": len(self.rate_limiter),
+            "max_concurrent": self.concurrency.limit,
+            "in_flight": self.concurrency.in_flight,
+            "max_queue_wait_ms": round(self.max_queue_wait * 1000, 3),
+        }
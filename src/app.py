@@ -4,22 +4,396 @@ Basit Flask API - CI/CD Örneği
 Bu uygulama CI/CD pipeline'ını test etmek için kullanılır.
 """
 
-from flask import Flask, request, jsonify
+from flask import Flask, Response, g, request, jsonify, stream_with_context
+import heapq
+import hmac
+import math
 import os
 import logging
+import time
 from datetime import datetime
-from model import SimpleModel
-from utils import validate_input, format_response
+from admission import AdmissionController, parse_request_start
+from batching import BATCH_SIZE_BUCKETS, QUEUE_WAIT_BUCKETS, MicroBatcher
+from cache import ResponseCache, SingleFlight, make_cache_key
+from health import HealthMonitor
+from json_provider import create_json_provider
+from logging_setup import configure_logging
+from metrics import (
+    DEFAULT_LATENCY_BUCKETS,
+    REGISTRY,
+    PROMETHEUS_CONTENT_TYPE,
+    CallbackMetric,
+    Counter,
+    Gauge,
+    Histogram,
+)
+from registry import ActiveModel, ModelFileWatcher, ModelRegistry, ModelWarmup
+from routing import MODEL_LATENCY, SHADOW_DIVERGENCE, SHADOW_PREDICTIONS, TrafficRouter
+from shared_metrics import SharedMetrics
+from timing import RequestTimingRecorder
+from utils import validate_input, validate_records, format_response
 
 # Flask uygulamasını oluştur
 app = Flask(__name__)
 
+# JSON encode/decode (orjson yüklüyse orjson, değilse stdlib)
+app.json = create_json_provider(app)
+
 # Logging konfigürasyonu
-logging.basicConfig(level=logging.INFO)
+configure_logging()
 logger = logging.getLogger(__name__)
 
-# Model instance
-model = SimpleModel()
+# Model registry - aktif model process yeniden başlatılmadan değiştirilebilir
+# Başlangıçta model ısıtılmadan yüklenir; ısıtma model_warmup ile yapılır
+model_registry = ModelRegistry()
+model_registry.activate(os.environ.get("MODEL_VERSION", "1.0.0"), warm_up=False)
+
+
+# Aktif modele yönlendiren vekil (sağlık kontrolü ve metrikler için)
+model = ActiveModel(model_registry)
+
+# MODEL_CONFIG_PATH verilirse dosyadaki versiyona geçilir (main/serve başlatır)
+MODEL_CONFIG_PATH = os.environ.get("MODEL_CONFIG_PATH")
+model_watcher = (
+    ModelFileWatcher(model_registry, MODEL_CONFIG_PATH) if MODEL_CONFIG_PATH else None
+)
+
+# Canary/shadow yönlendirme (CANARY_VERSION verilirse başlangıçta ayarlanır)
+traffic_router = TrafficRouter(model_registry)
+if os.environ.get("CANARY_VERSION"):
+    traffic_router.configure(
+        os.environ["CANARY_VERSION"],
+        canary_percent=float(os.environ.get("CANARY_PERCENT", 0)),
+        shadow=os.environ.get("SHADOW_ENABLED", "false").lower() == "true",
+    )
+
+# Admin endpoint'leri için token (verilmezse admin endpoint'leri kapalı)
+ADMIN_TOKEN = os.environ.get("ADMIN_TOKEN")
+
+# Bağımlılık sağlık kontrolleri (main/serve tarafından başlatılır)
+health_monitor = HealthMonitor()
+
+# Isıtma (main/serve/asgi başlatır): sentetik tahminler (WARMUP_ITERATIONS) ve
+# bağımlılık probe'ları; /readyz ancak ısıtma bitince 200 döner
+model_warmup = ModelWarmup(model_registry)
+model_warmup.add_step("dependencies", health_monitor.refresh)
+
+# /livez için process başlangıç zamanı
+STARTED_AT = time.monotonic()
+
+# Tahmin endpoint'leri için admission control (RATE_LIMIT_PER_SECOND,
+# MAX_CONCURRENT_PREDICTIONS, MAX_QUEUE_WAIT_MS); varsayılan limitler kapalı
+admission = AdmissionController()
+ADMISSION_ENDPOINTS = frozenset({"predict", "predict_batch", "predict_stream"})
+
+# Hız limitinde ayrı istemci sayılan API key'ler (virgülle ayrılmış); tanımlı
+# olmayan X-API-Key başlıkları yok sayılır ve istemci IP'si kullanılır
+API_KEYS = frozenset(key for key in os.environ.get("API_KEYS", "").split(",") if key)
+
+# Endpoint bazında istek süreleri ve yavaş istekler
+request_timings = RequestTimingRecorder()
+
+# Batch endpoint'inde tek istekte kabul edilen maksimum kayıt sayısı
+BATCH_MAX_SIZE = int(os.environ.get("BATCH_MAX_SIZE", 1000))
+
+# Stream endpoint'inde tek seferde tahmin edilen kayıt sayısı ve satır limiti
+STREAM_CHUNK_SIZE = int(os.environ.get("STREAM_CHUNK_SIZE", 500))
+STREAM_MAX_LINE_BYTES = int(os.environ.get("STREAM_MAX_LINE_BYTES", 64 * 1024))
+NDJSON_MIMETYPES = ("application/x-ndjson", "application/jsonl")
+
+# Deterministik tahminler için response cache (0 = kapalı)
+RESPONSE_CACHE_SIZE = int(os.environ.get("RESPONSE_CACHE_SIZE", 0))
+RESPONSE_CACHE_TTL = float(os.environ.get("RESPONSE_CACHE_TTL", 60))
+response_cache = (
+    ResponseCache(RESPONSE_CACHE_SIZE, RESPONSE_CACHE_TTL)
+    if RESPONSE_CACHE_SIZE > 0
+    else None
+)
+
+# REQUEST_COALESCING=true ise aynı anda gelen aynı /predict istekleri tek
+# tahmin ve tek serialize edilmiş response'u paylaşır (cache anahtarı ile aynı
+# normalizasyon); varsayılan kapalı
+request_coalescer = (
+    SingleFlight()
+    if os.environ.get("REQUEST_COALESCING", "false").lower() == "true"
+    else None
+)
+
+
+def _clear_response_cache(old_model, new_model):
+    """Model değişince eski versiyonun response'ları cache'ten silinir"""
+    if response_cache is not None:
+        response_cache.clear()
+
+
+model_registry.add_listener(_clear_response_cache)
+
+# Prometheus metrikleri
+REQUESTS_TOTAL = REGISTRY.register(
+    Counter(
+        "http_requests_total",
+        "Endpoint, method ve status bazında HTTP istek sayısı",
+        ("endpoint", "method", "status"),
+    )
+)
+REQUESTS_IN_FLIGHT = REGISTRY.register(
+    Gauge("http_requests_in_flight", "İşlenmekte olan HTTP istek sayısı")
+)
+REQUEST_DURATION = REGISTRY.register(
+    Histogram(
+        "http_request_duration_seconds",
+        "Endpoint bazında HTTP istek süresi",
+        ("endpoint",),
+    )
+)
+PREDICTION_LATENCY = REGISTRY.register(
+    Histogram(
+        "prediction_latency_seconds",
+        "Model tahmin süresi (batch çağrıları dahil)",
+        ("endpoint",),
+    )
+)
+REQUESTS_SHED = REGISTRY.register(
+    Counter(
+        "http_requests_shed_total",
+        "Admission control tarafından reddedilen istek sayısı",
+        ("endpoint", "reason"),
+    )
+)
+MICRO_BATCH_SIZE = REGISTRY.register(
+    Histogram(
+        "predict_micro_batch_size",
+        "Micro-batching ile tek predict_batch çağrısında toplanan istek sayısı",
+        buckets=BATCH_SIZE_BUCKETS,
+    )
+)
+MICRO_BATCH_QUEUE_WAIT = REGISTRY.register(
+    Histogram(
+        "predict_micro_batch_queue_wait_seconds",
+        "Micro-batching kuyruğunda tahmine kadar geçen ek bekleme süresi",
+        buckets=QUEUE_WAIT_BUCKETS,
+    )
+)
+VALIDATION_FAILURES = REGISTRY.register(
+    Counter(
+        "validation_failures_total",
+        "Sebep bazında input validasyon hataları",
+        ("reason",),
+    )
+)
+
+# Worker'lar arası paylaşımlı (container geneli) metrikler. Tek process'te
+# import sırasında slot alınır; gunicorn'da master slot'u bırakır ve her
+# worker'a fork'tan önce slot atar (bkz. serve.py). Prometheus sayaç, gauge
+# ve histogramları da burada tutulur; /metrics/prometheus hangi worker'a
+# düşerse düşsün container toplamını döndürür
+shared_metrics = SharedMetrics(
+    counters=(
+        "predictions",
+        "requests",
+        "errors",
+        "shed",
+        "cache_hits",
+        "cache_misses",
+        "cache_evictions",
+        "cache_expirations",
+        "coalescing_leaders",
+        "coalescing_followers",
+    ),
+    gauges=("in_flight",),
+    histograms={"request_duration": DEFAULT_LATENCY_BUCKETS},
+    families=(
+        REQUESTS_TOTAL,
+        REQUESTS_IN_FLIGHT,
+        REQUEST_DURATION,
+        PREDICTION_LATENCY,
+        REQUESTS_SHED,
+        MICRO_BATCH_SIZE,
+        MICRO_BATCH_QUEUE_WAIT,
+        VALIDATION_FAILURES,
+        MODEL_LATENCY,
+        SHADOW_DIVERGENCE,
+        SHADOW_PREDICTIONS,
+    ),
+)
+shared_metrics.attach()
+SHARED_PREDICTIONS = shared_metrics.counter("predictions")
+SHARED_REQUESTS = shared_metrics.counter("requests")
+SHARED_ERRORS = shared_metrics.counter("errors")
+SHARED_SHED = shared_metrics.counter("shed")
+SHARED_IN_FLIGHT = shared_metrics.counter("in_flight")
+SHARED_REQUEST_DURATION = shared_metrics.histogram("request_duration")
+
+# Cache ve birleştirme sayaçları da container toplamı (cache içeriği ve
+# devam eden çağrılar worker başınadır)
+if response_cache is not None:
+    response_cache.hits = shared_metrics.counter("cache_hits")
+    response_cache.misses = shared_metrics.counter("cache_misses")
+    response_cache.evictions = shared_metrics.counter("cache_evictions")
+    response_cache.expirations = shared_metrics.counter("cache_expirations")
+if request_coalescer is not None:
+    request_coalescer.leaders = shared_metrics.counter("coalescing_leaders")
+    request_coalescer.followers = shared_metrics.counter("coalescing_followers")
+
+# Eşzamanlı tekil /predict isteklerini tek vektörel tahminde toplar
+# (MICRO_BATCH_MAX_SIZE, MICRO_BATCH_MAX_WAIT_MS; varsayılan kapalı)
+micro_batcher = MicroBatcher(
+    batch_sizes=MICRO_BATCH_SIZE, queue_wait=MICRO_BATCH_QUEUE_WAIT
+)
+
+REGISTRY.register(
+    CallbackMetric(
+        "model_predictions_total",
+        "Tüm worker'larda API'nin yaptığı toplam tahmin sayısı",
+        lambda: SHARED_PREDICTIONS.value(),
+        metric_type="counter",
+    )
+)
+REGISTRY.register(
+    CallbackMetric(
+        "workers_active",
+        "Paylaşımlı metriklere yazan worker process sayısı",
+        lambda: len(shared_metrics.workers()),
+    )
+)
+REGISTRY.register(
+    CallbackMetric(
+        "model_uptime_seconds",
+        "Model uptime süresi",
+        lambda: model.get_uptime(),
+    )
+)
+
+
+def _cache_stat(name):
+    """Response cache istatistiğini döndür (cache kapalıysa 0)"""
+    return response_cache.stats()[name] if response_cache is not None else 0
+
+
+for _stat, _metric_type in (
+    ("hits", "counter"),
+    ("misses", "counter"),
+    ("evictions", "counter"),
+    ("size", "gauge"),
+):
+    REGISTRY.register(
+        CallbackMetric(
+            f"response_cache_{_stat}" + ("_total" if _metric_type == "counter" else ""),
+            f"Response cache {_stat}",
+            lambda stat=_stat: _cache_stat(stat),
+            metric_type=_metric_type,
+        )
+    )
+
+
+def _coalescing_stat(name):
+    """Birleştirme istatistiğini döndür (kapalıysa 0)"""
+    return request_coalescer.stats()[name] if request_coalescer is not None else 0
+
+
+REGISTRY.register(
+    CallbackMetric(
+        "predict_coalesced_requests_total",
+        "Devam eden aynı tahmini bekleyip onun response'unu alan istek sayısı",
+        lambda: _coalescing_stat("coalesced"),
+        metric_type="counter",
+    )
+)
+REGISTRY.register(
+    CallbackMetric(
+        "predict_coalescing_ratio",
+        "Birleştirilen isteklerin birleştirmeye uygun isteklere oranı",
+        lambda: _coalescing_stat("coalescing_ratio"),
+    )
+)
+
+
+@app.before_request
+def start_request_metrics():
+    """İstek başlangıç zamanını kaydet"""
+    g.request_start = time.perf_counter()
+    REQUESTS_IN_FLIGHT.inc()
+    SHARED_IN_FLIGHT.add(1)
+
+
+def _rate_limit_client():
+    """
+    Hız limiti için istemci anahtarı
+
+    X-API-Key sadece API_KEYS içindeyse kullanılır; doğrulanmamış başlık her
+    istekte değiştirilerek limit aşılabileceği için istemci IP'si kullanılır.
+    """
+    api_key = request.headers.get("X-API-Key")
+    if api_key and any(
+        hmac.compare_digest(api_key.encode("utf-8"), key.encode("utf-8"))
+        for key in API_KEYS
+    ):
+        return f"key:{api_key}"
+    return request.remote_addr or "unknown"
+
+
+@app.before_request
+def admission_control():
+    """Tahmin endpoint'lerinde hız/eşzamanlılık limiti; aşılırsa hızlı red"""
+    if request.endpoint not in ADMISSION_ENDPOINTS:
+        return None
+    rejection = admission.admit(
+        _rate_limit_client(),
+        parse_request_start(request.headers.get("X-Request-Start")),
+    )
+    if rejection is None:
+        g.admitted = True
+        return None
+
+    g.shed_reason = rejection.reason
+    REQUESTS_SHED.labels(request.url_rule.rule, rejection.reason).add()
+    SHARED_SHED.add()
+    response = jsonify(
+        {"error": rejection.message, "reason": rejection.reason, "status": "error"}
+    )
+    response.status_code = rejection.status
+    response.headers["Retry-After"] = str(max(1, math.ceil(rejection.retry_after)))
+    return response
+
+
+@app.after_request
+def record_request_metrics(response):
+    """İstek sayısı ve süresini kaydet"""
+    start = g.get("request_start")
+    if start is not None:
+        duration = time.perf_counter() - start
+        # Bilinmeyen path'ler cardinality patlamasın diye tek label altında
+        endpoint = request.url_rule.rule if request.url_rule else "unmatched"
+        REQUEST_DURATION.labels(endpoint).observe(duration)
+        REQUESTS_TOTAL.labels(endpoint, request.method, response.status_code).add()
+        SHARED_REQUEST_DURATION.observe(duration)
+        SHARED_REQUESTS.add()
+        # Yük nedeniyle reddedilen istekler hata sayılmaz (ayrıca sayılır)
+        if response.status_code >= 500 and "shed_reason" not in g:
+            SHARED_ERRORS.add()
+
+        # Request gövdesi sadece örneklenen istekler için (log'a) alınır
+        sampled = request_timings.should_sample()
+        request_timings.record(
+            endpoint,
+            request.method,
+            response.status_code,
+            duration,
+            data=request.get_json(silent=True) if sampled and request.is_json else None,
+            sampled=sampled,
+        )
+    return response
+
+
+@app.teardown_request
+def finish_request_metrics(exc):
+    """İşlemdeki istek sayısını azalt (hata olsa bile)"""
+    if g.pop("request_start", None) is not None:
+        REQUESTS_IN_FLIGHT.dec()
+        SHARED_IN_FLIGHT.add(-1)
+    # Stream response'larda teardown stream bitince çalışır
+    if g.pop("admitted", False):
+        admission.release()
 
 
 @app.route("/", methods=["GET"])
@@ -33,50 +407,123 @@ def home():
             "endpoints": {
                 "GET /": "API bilgileri",
                 "GET /health": "Sağlık kontrolü",
+                "GET /livez": "Liveness (process ayakta mı)",
+                "GET /readyz": "Readiness (ısıtma bitti ve trafik alabilir mi)",
                 "POST /predict": "ML tahmin",
+                "POST /predict/batch": "Toplu ML tahmin",
+                "POST /predict/stream": "NDJSON stream ile toplu ML tahmin",
                 "GET /metrics": "API metrikleri",
+                "GET /metrics/history": "Son 1/5/15 dakikalık tahmin istatistikleri",
+                "GET /metrics/prometheus": "Prometheus formatında metrikler",
+                "GET /debug/slow-requests": "Son yavaş istekler",
             },
             "timestamp": datetime.now().isoformat(),
         }
     )
 
 
-@app.route("/health", methods=["GET"])
-def health_check():
-    """Sağlık kontrolü endpoint'i"""
+def health_report():
+    """
+    /health raporu (WSGI ve ASGI /health ortak)
+
+    Probe çalıştırmaz; bağımlılık sonuçları health_monitor snapshot'ından
+    okunur.
+
+    Returns:
+        (rapor, HTTP status kodu)
+    """
     try:
         # Basit sağlık kontrolleri
         model_status = model.is_healthy()
+        healthy = model_status
 
         health_status = {
-            "status": "healthy" if model_status else "unhealthy",
             "model_loaded": model_status,
+            "model_warmed_up": model_warmup.is_ready(),
             "timestamp": datetime.now().isoformat(),
             "version": "1.0.0",
         }
 
-        return jsonify(health_status), 200 if model_status else 503
+        # Bağımlılık kontrolleri arka planda yenilenir, burada sadece okunur;
+        # informational probe'lar sadece raporda görünür
+        dependencies = health_monitor.snapshot()
+        if dependencies is not None:
+            healthy = healthy and health_monitor.is_ready(dependencies)
+            health_status["dependencies"] = dependencies
+
+        health_status["status"] = "healthy" if healthy else "unhealthy"
+        return health_status, 200 if healthy else 503
 
     except Exception as e:
-        logger.error(f"Health check failed: {e}")
+        logger.error("Health check failed: %s", e)
         return (
-            jsonify(
-                {
-                    "status": "unhealthy",
-                    "error": str(e),
-                    "timestamp": datetime.now().isoformat(),
-                }
-            ),
+            {
+                "status": "unhealthy",
+                "error": str(e),
+                "timestamp": datetime.now().isoformat(),
+            },
             503,
         )
 
 
+@app.route("/health", methods=["GET"])
+def health_check():
+    """Sağlık kontrolü endpoint'i"""
+    report, status = health_report()
+    return jsonify(report), status
+
+
+@app.route("/livez", methods=["GET"])
+def liveness():
+    """Liveness - process istek işleyebiliyor mu (model ve bağımlılıklara bakmaz)"""
+    return jsonify(
+        {
+            "status": "alive",
+            "uptime_seconds": round(time.monotonic() - STARTED_AT, 3),
+            "timestamp": datetime.now().isoformat(),
+        }
+    )
+
+
+@app.route("/readyz", methods=["GET"])
+def readiness():
+    """Readiness - ısıtma bitti, model sağlıklı ve bağımlılıklar erişilebilir mi
+
+    Load balancer soğuk replikaya trafik göndermesin diye ısıtma bitene
+    kadar 503 döner.
+    """
+    model_loaded = model.is_healthy()
+    warmup = model_warmup.status()
+    ready = model_loaded and warmup["ready"]
+
+    checks = {"model_loaded": model_loaded, "warmup": warmup}
+    # Informational (simülasyon) probe'ları readiness'i etkilemez
+    dependencies = health_monitor.snapshot()
+    if dependencies is not None:
+        dependencies_healthy = health_monitor.is_ready(dependencies)
+        checks["dependencies"] = dependencies_healthy
+        ready = ready and dependencies_healthy
+
+    return (
+        jsonify(
+            {
+                "status": "ready" if ready else "not_ready",
+                "model_version": model_registry.active_version,
+                "checks": checks,
+                "timestamp": datetime.now().isoformat(),
+            }
+        ),
+        200 if ready else 503,
+    )
+
+
 @app.route("/predict", methods=["POST"])
 def predict():
     """ML tahmin endpoint'i"""
     try:
         # Request verilerini al
         if not request.is_json:
+            VALIDATION_FAILURES.labels("content_type").add()
             return (
                 jsonify(
                     {"error": "Content-Type application/json olmalı", "status": "error"}
@@ -89,22 +536,188 @@ def predict():
         # Input validasyonu
         validation_result = validate_input(data)
         if not validation_result["valid"]:
+            VALIDATION_FAILURES.labels(validation_result["reason"]).add()
+            return (
+                jsonify(
+                    {
+                        "error": validation_result["message"],
+                        "errors": validation_result["errors"],
+                        "status": "error",
+                    }
+                ),
+                400,
+            )
+
+        # Model seçimi (aktif veya canary); cache ve birleştirme sadece aktif
+        # model için
+        with traffic_router.route() as (routed_model, role):
+            key = make_cache_key(data) if role == "primary" else None
+            # Cache'te serialize edilmiş response varsa direkt döndür
+            if key is not None and response_cache is not None:
+                body = response_cache.get(key)
+                if body is not None:
+                    return Response(body, mimetype="application/json")
+
+            def compute():
+                return _predict_response_body(routed_model, role, data, key)
+
+            if key is not None and request_coalescer is not None:
+                # Versiyon anahtarda: model değişimi sırasında eski ve yeni
+                # modelin istekleri birleştirilmez
+                start = time.perf_counter()
+                (body, prediction), shared = request_coalescer.do(
+                    (routed_model.get_version(), key), compute
+                )
+                if shared:
+                    # Bekleyen istek de tahmin almış sayılır (toplam tahmin ve
+                    # shadow karşılaştırması servis edilen trafikle orantılı)
+                    SHARED_PREDICTIONS.add()
+                    traffic_router.observe(
+                        routed_model,
+                        role,
+                        time.perf_counter() - start,
+                        data,
+                        prediction,
+                    )
+            else:
+                body, _ = compute()
+
+        return Response(body, mimetype="application/json")
+
+    except Exception as e:
+        logger.error("Prediction error: %s", e)
+        return (
+            jsonify(
+                {
+                    "error": "İç server hatası",
+                    "status": "error",
+                    "timestamp": datetime.now().isoformat(),
+                }
+            ),
+            500,
+        )
+
+
+def _predict_response_body(routed_model, role, data, cache_key):
+    """
+    Tek tahmin yap, response'u serialize et ve (varsa) cache'e yaz
+
+    Returns:
+        (serialize edilmiş response, tahmin sonucu)
+    """
+    start = time.perf_counter()
+    prediction = micro_batcher.predict(routed_model, data)
+    latency = time.perf_counter() - start
+    PREDICTION_LATENCY.labels("/predict").observe(latency)
+    SHARED_PREDICTIONS.add()
+    traffic_router.observe(routed_model, role, latency, data, prediction)
+
+    body = jsonify(format_response(prediction, data)).get_data()
+    # Cache'e yazma da aynı model versiyonu altında (acquire süresince)
+    if cache_key is not None and response_cache is not None:
+        response_cache.put(cache_key, body)
+
+    logger.info("Prediction made: %s", prediction, extra={"sampled": True})
+    return body, prediction
+
+
+def _score_records(records, endpoint, indices=None):
+    """
+    Kayıtları doğrulayıp geçerli olanları tek seferde tahmin eder
+
+    Geçersiz kayıtlar diğerlerini bozmaz, yerlerinde hata sonucu döner.
+
+    Args:
+        records: Kayıt listesi
+        endpoint: Metrik label'ı
+        indices: Sonuçlara yazılacak index'ler (varsayılan 0..n-1)
+
+    Returns:
+        (kayıtlarla aynı sırada sonuçlar, geçerli kayıt sayısı)
+    """
+    if indices is None:
+        indices = range(len(records))
+
+    results = [None] * len(records)
+    valid_positions = []
+    for position, validation_result in enumerate(validate_records(records)):
+        if validation_result["valid"]:
+            valid_positions.append(position)
+        else:
+            VALIDATION_FAILURES.labels(validation_result["reason"]).add()
+            results[position] = {
+                "index": indices[position],
+                "error": validation_result["message"],
+                "errors": validation_result["errors"],
+                "status": "error",
+            }
+
+    # Geçerli kayıtları tek seferde tahmin et
+    valid_records = [records[position] for position in valid_positions]
+    with model_registry.acquire() as active_model:
+        start = time.perf_counter()
+        predictions = active_model.predict_batch(valid_records)
+        PREDICTION_LATENCY.labels(endpoint).observe(time.perf_counter() - start)
+    SHARED_PREDICTIONS.add(len(valid_records))
+
+    for position, record, prediction in zip(
+        valid_positions, valid_records, predictions
+    ):
+        response = format_response(prediction, record)
+        response["index"] = indices[position]
+        results[position] = response
+
+    return results, len(valid_positions)
+
+
+@app.route("/predict/batch", methods=["POST"])
+def predict_batch():
+    """Toplu ML tahmin endpoint'i"""
+    try:
+        if not request.is_json:
+            VALIDATION_FAILURES.labels("content_type").add()
             return (
-                jsonify({"error": validation_result["message"], "status": "error"}),
+                jsonify(
+                    {"error": "Content-Type application/json olmalı", "status": "error"}
+                ),
                 400,
             )
 
-        # Model ile tahmin yap
-        prediction = model.predict(data)
+        records = request.get_json()
 
-        # Response formatla
-        response = format_response(prediction, data)
+        if not isinstance(records, list):
+            VALIDATION_FAILURES.labels("not_list").add()
+            return (
+                jsonify({"error": "Veri liste formatında olmalı", "status": "error"}),
+                400,
+            )
+
+        if len(records) > BATCH_MAX_SIZE:
+            return (
+                jsonify(
+                    {
+                        "error": f"En fazla {BATCH_MAX_SIZE} kayıt gönderilebilir",
+                        "status": "error",
+                    }
+                ),
+                413,
+            )
 
-        logger.info(f"Prediction made: {prediction}")
-        return jsonify(response)
+        results, valid_count = _score_records(records, "/predict/batch")
+
+        logger.info("Batch prediction made: %d/%d valid", valid_count, len(records))
+        return jsonify(
+            {
+                "status": "success",
+                "count": len(records),
+                "valid_count": valid_count,
+                "error_count": len(records) - valid_count,
+                "results": results,
+            }
+        )
 
     except Exception as e:
-        logger.error(f"Prediction error: {e}")
+        logger.error("Batch prediction error: %s", e)
         return (
             jsonify(
                 {
@@ -117,20 +730,328 @@ def predict():
         )
 
 
+def _read_ndjson_lines(stream, max_line_bytes):
+    """
+    Stream'den satır satır okur, gövdeyi asla tamamen belleğe almaz
+
+    Yields:
+        (satır index'i, satır byte'ları veya limiti aşan satırlar için None)
+    """
+    index = 0
+    while True:
+        line = stream.readline(max_line_bytes + 1)
+        if not line:
+            return
+        if len(line) > max_line_bytes and not line.endswith(b"\n"):
+            # Satırın geri kalanını okuyup at
+            while line and not line.endswith(b"\n"):
+                line = stream.readline(max_line_bytes)
+            yield index, None
+        elif line.strip():
+            yield index, line
+        else:
+            continue
+        index += 1
+
+
+def _line_error(index, message, reason):
+    """Stream'de tek bir satır için hata sonucu"""
+    VALIDATION_FAILURES.labels(reason).add()
+    return {"index": index, "error": message, "status": "error"}
+
+
+@app.route("/predict/stream", methods=["POST"])
+def predict_stream():
+    """
+    NDJSON toplu tahmin endpoint'i
+
+    Her satır bir kayıttır. Kayıtlar okundukça STREAM_CHUNK_SIZE'lık
+    parçalar halinde tahmin edilir ve sonuçlar aynı sırayla NDJSON olarak
+    geri stream edilir; bellek kullanımı girdi boyutundan bağımsızdır.
+    Son satır toplam sayıları içeren özettir.
+    """
+    if request.mimetype not in NDJSON_MIMETYPES:
+        VALIDATION_FAILURES.labels("content_type").add()
+        return (
+            jsonify(
+                {"error": "Content-Type application/x-ndjson olmalı", "status": "error"}
+            ),
+            400,
+        )
+
+    input_stream = request.stream
+    dumps = app.json.dumps
+
+    def encode(results):
+        return "".join(dumps(result) + "\n" for result in results).encode("utf-8")
+
+    def generate():
+        count = valid_count = 0
+        indices, records, errors = [], [], []
+
+        def flush():
+            scored, valid = _score_records(records, "/predict/stream", indices)
+            merged = heapq.merge(scored, errors, key=lambda result: result["index"])
+            chunk = encode(merged)
+            indices.clear()
+            records.clear()
+            errors.clear()
+            return chunk, valid
+
+        try:
+            for index, line in _read_ndjson_lines(input_stream, STREAM_MAX_LINE_BYTES):
+                count += 1
+                if line is None:
+                    errors.append(
+                        _line_error(
+                            index,
+                            f"Satır {STREAM_MAX_LINE_BYTES} byte sınırını aşıyor",
+                            "line_too_long",
+                        )
+                    )
+                else:
+                    try:
+                        record = app.json.loads(line)
+                    except ValueError:
+                        errors.append(
+                            _line_error(index, "Geçersiz JSON satırı", "invalid_json")
+                        )
+                    else:
+                        indices.append(index)
+                        records.append(record)
+
+                if len(indices) + len(errors) >= STREAM_CHUNK_SIZE:
+                    chunk, valid = flush()
+                    valid_count += valid
+                    yield chunk
+
+            if indices or errors:
+                chunk, valid = flush()
+                valid_count += valid
+                yield chunk
+
+            logger.info("Stream prediction made: %d/%d valid", valid_count, count)
+            yield encode(
+                [
+                    {
+                        "status": "complete",
+                        "count": count,
+                        "valid_count": valid_count,
+                        "error_count": count - valid_count,
+                    }
+                ]
+            )
+        except Exception as e:
+            # Status kodu gönderildi; hata son satır olarak bildirilir
+            logger.error("Stream prediction error: %s", e)
+            yield encode([{"error": "İç server hatası", "status": "error"}])
+
+    return Response(stream_with_context(generate()), mimetype="application/x-ndjson")
+
+
 @app.route("/metrics", methods=["GET"])
 def metrics():
-    """API metrikleri"""
+    """API metrikleri
+
+    total_predictions, uptime_seconds ve workers tüm worker process'lerin
+    (container) toplamıdır; diğer alanlar isteği karşılayan worker'a aittir.
+    """
+    workers = shared_metrics.summary()
+    duration = SHARED_REQUEST_DURATION.snapshot()
     return jsonify(
         {
-            "total_predictions": model.get_prediction_count(),
-            "uptime_seconds": model.get_uptime(),
+            "total_predictions": SHARED_PREDICTIONS.value(),
+            "uptime_seconds": workers["uptime_seconds"],
+            "requests": {
+                "total": SHARED_REQUESTS.value(),
+                "errors": SHARED_ERRORS.value(),
+                "shed": SHARED_SHED.value(),
+                "in_flight": SHARED_IN_FLIGHT.value(),
+                "mean_duration_ms": (
+                    round(duration["sum"] / duration["count"] * 1000, 3)
+                    if duration["count"]
+                    else None
+                ),
+            },
+            "workers": workers,
+            "admission": admission.describe(),
+            "micro_batching": micro_batcher.stats(),
+            "coalescing": (
+                request_coalescer.stats() if request_coalescer is not None else None
+            ),
             "last_prediction": model.get_last_prediction_time(),
             "model_version": model.get_version(),
+            "prediction_stats": model.get_prediction_stats(),
+            "prediction_table": (
+                model.table.describe() if getattr(model, "table", None) else None
+            ),
+            "response_cache": (
+                response_cache.stats() if response_cache is not None else None
+            ),
+            "timestamp": datetime.now().isoformat(),
+        }
+    )
+
+
+@app.route("/metrics/history", methods=["GET"])
+def metrics_history():
+    """Son 1/5/15 dakikalık pencerelerde tahmin istatistikleri"""
+    history = model.get_prediction_history()
+    history["timestamp"] = datetime.now().isoformat()
+    return jsonify(history)
+
+
+@app.route("/metrics/prometheus", methods=["GET"])
+def metrics_prometheus():
+    """Prometheus text formatında metrikler"""
+    return Response(REGISTRY.render(), content_type=PROMETHEUS_CONTENT_TYPE)
+
+
+@app.route("/debug/slow-requests", methods=["GET"])
+def debug_slow_requests():
+    """Eşiği aşan son istekler ve endpoint bazında süre özeti"""
+    limit = request.args.get("limit", default=50, type=int)
+    return jsonify(
+        {
+            "threshold_ms": request_timings.slow_threshold_ms,
+            "sample_rate": request_timings.sample_rate,
+            "slow_requests": request_timings.slow_requests(limit),
+            "endpoints": request_timings.endpoint_stats(),
             "timestamp": datetime.now().isoformat(),
         }
     )
 
 
+def _admin_authorized():
+    """Authorization: Bearer <ADMIN_TOKEN> kontrolü"""
+    if not ADMIN_TOKEN:
+        return False
+    header = request.headers.get("Authorization", "")
+    scheme, _, token = header.partition(" ")
+    return scheme.lower() == "bearer" and hmac.compare_digest(
+        token.encode("utf-8"), ADMIN_TOKEN.encode("utf-8")
+    )
+
+
+def _admin_error():
+    """Admin kapalıysa 404, token yanlışsa 401"""
+    if not ADMIN_TOKEN:
+        return jsonify({"error": "Endpoint bulunamadı", "status": "error"}), 404
+    return jsonify({"error": "Yetkisiz", "status": "error"}), 401
+
+
+@app.route("/admin/models", methods=["GET"])
+def admin_list_models():
+    """Yüklü model versiyonları"""
+    if not _admin_authorized():
+        return _admin_error()
+    return jsonify(
+        {
+            "active": model_registry.active_version,
+            "models": model_registry.versions(),
+        }
+    )
+
+
+@app.route("/admin/models", methods=["POST"])
+def admin_load_model():
+    """
+    Model versiyonu yükle ve (varsayılan olarak) aktif yap
+
+    Body: {"version": "1.1.0", "activate": true, "drain_timeout": 30}
+    """
+    if not _admin_authorized():
+        return _admin_error()
+
+    data = request.get_json(silent=True)
+    version = data.get("version") if isinstance(data, dict) else None
+    if not isinstance(version, str) or not version:
+        return jsonify({"error": "version alanı zorunlu", "status": "error"}), 400
+
+    drain_timeout = data.get("drain_timeout")
+    if drain_timeout is not None and (
+        isinstance(drain_timeout, bool) or not isinstance(drain_timeout, (int, float))
+    ):
+        return jsonify({"error": "drain_timeout sayı olmalı", "status": "error"}), 400
+
+    try:
+        if data.get("activate", True):
+            result = model_registry.activate(version, drain_timeout)
+        else:
+            model_registry.load(version)
+            result = {"active": model_registry.active_version, "loaded": version}
+    except Exception as e:
+        logger.error("Model load failed: %s", e)
+        return jsonify({"error": str(e), "status": "error"}), 500
+
+    result["status"] = "success"
+    return jsonify(result)
+
+
+@app.route("/admin/models/<version>", methods=["DELETE"])
+def admin_unload_model(version):
+    """Aktif olmayan model versiyonunu çıkar"""
+    if not _admin_authorized():
+        return _admin_error()
+
+    try:
+        unloaded = model_registry.unload(version)
+    except ValueError as e:
+        return jsonify({"error": str(e), "status": "error"}), 409
+
+    if not unloaded:
+        return jsonify({"error": "Model çıkarılamadı", "status": "error"}), 404
+    return jsonify({"status": "success", "unloaded": version})
+
+
+@app.route("/admin/routing", methods=["GET"])
+def admin_get_routing():
+    """Canary/shadow ayarı ve shadow sonuçları"""
+    if not _admin_authorized():
+        return _admin_error()
+    return jsonify(traffic_router.describe())
+
+
+@app.route("/admin/routing", methods=["PUT"])
+def admin_set_routing():
+    """
+    Canary/shadow ayarını değiştir
+
+    Body: {"candidate": "1.1.0", "canary_percent": 10, "shadow": true}
+    (candidate null ise yönlendirme kapanır)
+    """
+    if not _admin_authorized():
+        return _admin_error()
+
+    data = request.get_json(silent=True)
+    if not isinstance(data, dict):
+        return (
+            jsonify({"error": "Veri dictionary formatında olmalı", "status": "error"}),
+            400,
+        )
+
+    candidate = data.get("candidate")
+    canary_percent = data.get("canary_percent", 0)
+    if candidate is not None and not isinstance(candidate, str):
+        return jsonify({"error": "candidate string olmalı", "status": "error"}), 400
+    if isinstance(canary_percent, bool) or not isinstance(canary_percent, (int, float)):
+        return jsonify({"error": "canary_percent sayı olmalı", "status": "error"}), 400
+
+    try:
+        traffic_router.configure(
+            candidate, canary_percent=canary_percent, shadow=bool(data.get("shadow"))
+        )
+    except ValueError as e:
+        return jsonify({"error": str(e), "status": "error"}), 400
+    except Exception as e:
+        logger.error("Routing update failed: %s", e)
+        return jsonify({"error": str(e), "status": "error"}), 500
+
+    result = traffic_router.describe()
+    result["status"] = "success"
+    return jsonify(result)
+
+
 @app.errorhandler(404)
 def not_found(error):
     """404 hata işleyicisi"""
@@ -139,7 +1060,19 @@ def not_found(error):
             {
                 "error": "Endpoint bulunamadı",
                 "status": "error",
-                "available_endpoints": ["/", "/health", "/predict", "/metrics"],
+                "available_endpoints": [
+                    "/",
+                    "/health",
+                    "/livez",
+                    "/readyz",
+                    "/predict",
+                    "/predict/batch",
+                    "/predict/stream",
+                    "/metrics",
+                    "/metrics/history",
+                    "/metrics/prometheus",
+                    "/debug/slow-requests",
+                ],
             }
         ),
         404,
@@ -166,9 +1099,13 @@ def main():
     port = int(os.environ.get("PORT", 5000))
     debug = os.environ.get("DEBUG", "False").lower() == "true"
 
-    logger.info(f"Starting API on port {port}")
-    logger.info(f"Debug mode: {debug}")
+    logger.info("Starting API on port %s", port)
+    logger.info("Debug mode: %s", debug)
 
+    model_warmup.start()
+    health_monitor.start()
+    if model_watcher is not None:
+        model_watcher.start()
     app.run(host="0.0.0.0", port=port, debug=debug)
 
 
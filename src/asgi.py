@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+"""
+ASGI Uygulaması - CI/CD Örneği
+/health endpoint'i event loop'ta cevaplanır (bağımlılık sonuçları arka
+planda yenilenen health_monitor snapshot'ından okunur); diğer tüm
+endpoint'ler Flask uygulamasına thread pool üzerinden aktarılır. İstek ve
+response gövdeleri stream edilir, /predict/stream ASGI altında da sabit
+bellekle çalışır.
+
+Kullanım (uvicorn config/requirements-asgi.txt ile kurulur):
+    pip install -r config/requirements-asgi.txt
+    uvicorn asgi:app --app-dir src --host 0.0.0.0 --port 5000
+"""
+
+import asyncio
+import contextvars
+import io
+import json
+import logging
+import sys
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from app import (
+    app as flask_app,
+    health_monitor,
+    health_report,
+    model_warmup,
+    model_watcher,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class _RequestBody(io.RawIOBase):
+    """
+    ASGI receive kanalından okunan wsgi.input
+
+    Flask'i çalıştıran worker thread'inden kullanılır; ilk parça bittikten
+    sonra her okuma gerektiğinde event loop'tan bir sonraki http.request
+    mesajını ister. Gövde bellekte biriktirilmez (/predict/stream girdisi
+    okundukça işlenir).
+    """
+
+    def __init__(self, receive, loop: asyncio.AbstractEventLoop, first: bytes):
+        self._receive = receive
+        self._loop = loop
+        self._chunk = memoryview(first)
+        self._more_body = True
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        while not self._chunk and self._more_body:
+            message = asyncio.run_coroutine_threadsafe(
+                self._receive(), self._loop
+            ).result()
+            if message["type"] == "http.disconnect":
+                self._more_body = False
+                break
+            self._chunk = memoryview(message.get("body", b""))
+            self._more_body = message.get("more_body", False)
+        count = min(len(buffer), len(self._chunk))
+        buffer[:count] = self._chunk[:count]
+        self._chunk = self._chunk[count:]
+        return count
+
+
+def _build_environ(scope: Dict[str, Any], input_stream) -> Dict[str, Any]:
+    """ASGI scope'undan WSGI environ oluştur"""
+    server = scope.get("server") or ("localhost", 80)
+    client = scope.get("client") or ("", 0)
+    environ = {
+        "REQUEST_METHOD": scope["method"],
+        "SCRIPT_NAME": scope.get("root_path", ""),
+        "PATH_INFO": scope["path"].encode("utf-8").decode("latin-1"),
+        "QUERY_STRING": scope.get("query_string", b"").decode("latin-1"),
+        "SERVER_NAME": str(server[0]),
+        "SERVER_PORT": str(server[1]),
+        "SERVER_PROTOCOL": f"HTTP/{scope.get('http_version', '1.1')}",
+        "REMOTE_ADDR": client[0],
+        "wsgi.version": (1, 0),
+        "wsgi.url_scheme": scope.get("scheme", "http"),
+        "wsgi.input": input_stream,
+        # Gövdenin sonu ASGI more_body ile bilinir; Content-Length
+        # olmayan (chunked) istekler de okunabilir
+        "wsgi.input_terminated": True,
+        "wsgi.errors": sys.stderr,
+        "wsgi.multithread": True,
+        "wsgi.multiprocess": False,
+        "wsgi.run_once": False,
+    }
+    for raw_name, raw_value in scope.get("headers", []):
+        name = raw_name.decode("latin-1").upper().replace("-", "_")
+        value = raw_value.decode("latin-1")
+        if name == "CONTENT_TYPE" or name == "CONTENT_LENGTH":
+            key = name
+        else:
+            key = f"HTTP_{name}"
+        environ[key] = f"{environ[key]},{value}" if key in environ else value
+    return environ
+
+
+def _start_message(status: int, headers) -> Dict[str, Any]:
+    """http.response.start mesajı"""
+    return {
+        "type": "http.response.start",
+        "status": status,
+        "headers": [
+            (name.lower().encode("latin-1"), value.encode("latin-1"))
+            for name, value in headers
+        ],
+    }
+
+
+class _WsgiStream:
+    """
+    Content-Length'i olmayan (stream) WSGI response'unun kalan parçaları
+
+    Parçalar uygulamanın çağrıldığı contextvars context'inde okunur;
+    stream_with_context ile açılan Flask request context'i sonraki
+    to_thread çağrılarında da görünür ve aynı context'te kapatılır.
+    """
+
+    def __init__(self, iterable, iterator: Iterator[bytes], context):
+        self._iterable = iterable
+        self._iterator = iterator
+        self._context = context
+
+    def next_chunk(self) -> Optional[bytes]:
+        """Sonraki parça, bittiyse None (worker thread'inde çağrılır)"""
+        return self._context.run(next, self._iterator, None)
+
+    def close(self) -> None:
+        """Response iterable'ını kapat (worker thread'inde çağrılır)"""
+        self._context.run(_close_wsgi, self._iterable)
+
+
+def _close_wsgi(iterable) -> None:
+    """WSGI response iterable'ını kapat"""
+    if hasattr(iterable, "close"):
+        iterable.close()
+
+
+def _call_wsgi(
+    environ: Dict[str, Any],
+) -> Tuple[int, List[Tuple[str, str]], bytes, Optional[_WsgiStream]]:
+    """
+    Flask uygulamasını çağır
+
+    Content-Length'i olan (tamamı hazır) response'lar bu thread'de
+    toplanır. Olmayanlar için sadece ilk parça okunur, kalanı dönen
+    _WsgiStream'den okunur.
+
+    Returns:
+        (status, headers, gövde veya ilk parça, stream veya None)
+    """
+    response: Dict[str, Any] = {}
+
+    def start_response(status, headers, exc_info=None):
+        response["status"] = int(status.split(" ", 1)[0])
+        response["headers"] = headers
+
+    def start():
+        iterable = flask_app.wsgi_app(environ, start_response)
+        try:
+            iterator = iter(iterable)
+            # start_response ilk parçaya kadar ertelenebilir (WSGI)
+            return iterable, iterator, next(iterator, b"")
+        except BaseException:
+            _close_wsgi(iterable)
+            raise
+
+    # Stream parçaları da bu context'te okunur (bkz. _WsgiStream)
+    context = contextvars.copy_context()
+    iterable, iterator, first = context.run(start)
+    headers = response["headers"]
+    if not any(name.lower() == "content-length" for name, _ in headers):
+        stream = _WsgiStream(iterable, iterator, context)
+        return response["status"], headers, first, stream
+    try:
+        body = first + context.run(b"".join, iterator)
+    finally:
+        context.run(_close_wsgi, iterable)
+    return response["status"], headers, body, None
+
+
+async def _send_stream(
+    send, start: Dict[str, Any], first: bytes, stream: _WsgiStream
+) -> None:
+    """Stream response'un parçalarını bellekte biriktirmeden gönder"""
+    chunk: Optional[bytes] = first
+    try:
+        await send(start)
+        while chunk is not None:
+            if chunk:
+                await send(
+                    {"type": "http.response.body", "body": chunk, "more_body": True}
+                )
+            chunk = await asyncio.to_thread(stream.next_chunk)
+        await send({"type": "http.response.body", "body": b""})
+    finally:
+        await asyncio.to_thread(stream.close)
+
+
+async def health(scope, receive, send):
+    """Sağlık kontrolü - WSGI /health ile aynı rapor, probe çalıştırmaz"""
+    report, status = health_report()
+    body = json.dumps(report).encode("utf-8")
+    await send(
+        _start_message(
+            status,
+            [
+                ("Content-Type", "application/json"),
+                ("Content-Length", str(len(body))),
+            ],
+        )
+    )
+    await send({"type": "http.response.body", "body": body})
+
+
+async def _lifespan(receive, send):
+    """Lifespan olayları (startup/shutdown)"""
+    while True:
+        message = await receive()
+        if message["type"] == "lifespan.startup":
+            # /readyz ısıtma bitene kadar 503 döner; bağımlılık snapshot'ı
+            # eskimesin diye health monitor arka planda yenilenir
+            model_warmup.start()
+            health_monitor.start()
+            if model_watcher is not None:
+                model_watcher.start()
+            logger.info("ASGI app started")
+            await send({"type": "lifespan.startup.complete"})
+        elif message["type"] == "lifespan.shutdown":
+            # Thread'lerin durmasını beklerken event loop bloklanmasın
+            await asyncio.to_thread(health_monitor.stop, 5)
+            if model_watcher is not None:
+                await asyncio.to_thread(model_watcher.stop, 5)
+            logger.info("ASGI app stopped")
+            await send({"type": "lifespan.shutdown.complete"})
+            return
+
+
+async def app(scope, receive, send):
+    """ASGI giriş noktası"""
+    if scope["type"] == "lifespan":
+        await _lifespan(receive, send)
+        return
+    if scope["type"] != "http":
+        raise RuntimeError(f"Desteklenmeyen scope tipi: {scope['type']}")
+
+    if scope["path"] == "/health" and scope["method"] == "GET":
+        await health(scope, receive, send)
+        return
+
+    # Diğer endpoint'ler Flask'e (event loop'u bloklamadan). Tek mesajlık
+    # istek gövdesi doğrudan, çok parçalı gövde okundukça aktarılır.
+    message = await receive()
+    first = message.get("body", b"") if message["type"] == "http.request" else b""
+    if message.get("more_body", False):
+        input_stream = io.BufferedReader(
+            _RequestBody(receive, asyncio.get_running_loop(), first)
+        )
+    else:
+        input_stream = io.BytesIO(first)
+    environ = _build_environ(scope, input_stream)
+    status, headers, body, stream = await asyncio.to_thread(_call_wsgi, environ)
+
+    if stream is None:
+        await send(_start_message(status, headers))
+        await send({"type": "http.response.body", "body": body})
+    else:
+        await _send_stream(send, _start_message(status, headers), body, stream)
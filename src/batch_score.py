@@ -0,0 +1,308 @@
+#!/usr/bin/env python3
+"""
+Offline Toplu Tahmin - CI/CD Örneği
+CSV, NDJSON veya Parquet dosyalarını HTTP'ye gitmeden, parçalar halinde
+okuyup process pool üzerinde tahmin eder ve sonuçları girdi sırasıyla yazar.
+
+Kullanım:
+    python src/batch_score.py input.csv -o results.ndjson --workers 4
+    python src/batch_score.py input.ndjson --output-format csv > results.csv
+    python src/batch_score.py input.parquet -o results.ndjson
+        (pyarrow gerekir: pip install -r config/requirements-parquet.txt)
+"""
+
+import argparse
+import csv
+import io
+import json
+import logging
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+# "python -m src.batch_score" ile çalıştırıldığında da src modülleri bulunsun
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from model import SimpleModel  # noqa: E402
+from utils import format_response, validate_input  # noqa: E402
+
+try:
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - pyarrow opsiyonel
+    pq = None
+
+logger = logging.getLogger(__name__)
+
+INPUT_FORMATS = ("csv", "ndjson", "parquet")
+OUTPUT_FORMATS = ("ndjson", "csv")
+CSV_FIELDS = (
+    "index",
+    "status",
+    "prediction",
+    "confidence",
+    "category",
+    "model_version",
+    "input_value",
+    "error",
+)
+
+_EXTENSIONS = {
+    ".csv": "csv",
+    ".ndjson": "ndjson",
+    ".jsonl": "ndjson",
+    ".parquet": "parquet",
+}
+
+
+def detect_format(path: str, choices: Tuple[str, ...]) -> Optional[str]:
+    """Dosya uzantısından format tespit et (bilinmiyorsa None)"""
+    fmt = _EXTENSIONS.get(os.path.splitext(path)[1].lower())
+    return fmt if fmt in choices else None
+
+
+def _drop_empty(record: Dict[str, Any]) -> Dict[str, Any]:
+    """Boş CSV hücrelerini / null kolonları eksik alan olarak say"""
+    return {key: value for key, value in record.items() if value not in ("", None)}
+
+
+class ParseError:
+    """Parse edilemeyen girdi satırı"""
+
+    __slots__ = ("message",)
+
+    def __init__(self, message: str):
+        self.message = message
+
+
+def _parse_line(line: str) -> Any:
+    try:
+        return json.loads(line)
+    except ValueError:
+        return ParseError("Geçersiz JSON satırı")
+
+
+def read_records(path: str, fmt: str, chunk_size: int) -> Iterator[List[Any]]:
+    """
+    Dosyayı chunk_size'lık kayıt listeleri halinde okur
+
+    Dosya hiçbir zaman tamamen belleğe alınmaz. NDJSON'da parse
+    edilemeyen satırlar kayıt yerine ParseError olarak döner.
+
+    Yields:
+        Kayıt listeleri
+    """
+    if fmt == "parquet":
+        if pq is None:
+            raise ImportError(
+                "Parquet girdisi için pyarrow paketi yüklü olmalı "
+                "(pip install -r config/requirements-parquet.txt)"
+            )
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=chunk_size):
+            yield [_drop_empty(record) for record in batch.to_pylist()]
+        return
+
+    with open(path, newline="" if fmt == "csv" else None, encoding="utf-8") as f:
+        if fmt == "csv":
+            records = (_drop_empty(row) for row in csv.DictReader(f))
+        else:
+            records = (_parse_line(line) for line in f if line.strip())
+        while True:
+            chunk = list(islice(records, chunk_size))
+            if not chunk:
+                return
+            yield chunk
+
+
+# Worker process'teki model (initializer'da bir kez oluşturulur)
+_worker_model: Optional[SimpleModel] = None
+
+
+def _init_worker():
+    global _worker_model
+    _worker_model = SimpleModel()
+
+
+def score_chunk(
+    start_index: int, records: List[Any], output_format: str = "ndjson"
+) -> Tuple[str, int]:
+    """
+    Kayıt parçasını doğrulayıp tahmin eder ve çıktı formatında serialize eder
+
+    Serialize işlemi de worker'da yapılır; ana process sadece yazar.
+
+    Returns:
+        (serialize edilmiş sonuç satırları, geçerli kayıt sayısı)
+    """
+    if _worker_model is None:
+        _init_worker()
+
+    results: List[Optional[Dict[str, Any]]] = [None] * len(records)
+    valid_positions = []
+    for position, record in enumerate(records):
+        if isinstance(record, ParseError):
+            results[position] = {"error": record.message, "status": "error"}
+            continue
+        validation_result = validate_input(record)
+        if validation_result["valid"]:
+            valid_positions.append(position)
+        else:
+            results[position] = {
+                "error": validation_result["message"],
+                "errors": validation_result["errors"],
+                "status": "error",
+            }
+
+    valid_records = [records[position] for position in valid_positions]
+    predictions = _worker_model.predict_batch(valid_records)
+    for position, record, prediction in zip(
+        valid_positions, valid_records, predictions
+    ):
+        results[position] = format_response(prediction, record)
+
+    for position, result in enumerate(results):
+        result["index"] = start_index + position
+
+    if output_format == "csv":
+        buffer = io.StringIO()
+        writer = csv.DictWriter(
+            buffer, fieldnames=CSV_FIELDS, extrasaction="ignore", lineterminator="\n"
+        )
+        writer.writerows(results)
+        text = buffer.getvalue()
+    else:
+        text = "".join(
+            json.dumps(result, ensure_ascii=False) + "\n" for result in results
+        )
+    return text, len(valid_positions)
+
+
+def score_file(
+    input_path: str,
+    output,
+    input_format: str,
+    output_format: str = "ndjson",
+    chunk_size: int = 1000,
+    workers: int = 1,
+) -> Dict[str, Any]:
+    """
+    Girdi dosyasını tahmin edip sonuçları output'a girdi sırasıyla yazar
+
+    workers > 1 ise parçalar process pool'a dağıtılır. Bellek kullanımı
+    sabit kalsın diye aynı anda en fazla workers * 2 parça işlemde olur.
+
+    Returns:
+        {'records', 'valid', 'errors', 'duration_s', 'records_per_second'}
+    """
+    start = time.perf_counter()
+    total = valid = 0
+
+    if output_format == "csv":
+        output.write(",".join(CSV_FIELDS) + "\n")
+
+    def consume(text, chunk_valid, count):
+        nonlocal total, valid
+        output.write(text)
+        total += count
+        valid += chunk_valid
+
+    chunks = read_records(input_path, input_format, chunk_size)
+    if workers == 1:
+        index = 0
+        for records in chunks:
+            text, chunk_valid = score_chunk(index, records, output_format)
+            consume(text, chunk_valid, len(records))
+            index += len(records)
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+            pending = deque()
+            index = 0
+            for records in chunks:
+                if len(pending) >= workers * 2:
+                    future, count = pending.popleft()
+                    consume(*future.result(), count)
+                pending.append(
+                    (
+                        pool.submit(score_chunk, index, records, output_format),
+                        len(records),
+                    )
+                )
+                index += len(records)
+            while pending:
+                future, count = pending.popleft()
+                consume(*future.result(), count)
+
+    duration = time.perf_counter() - start
+    return {
+        "records": total,
+        "valid": valid,
+        "errors": total - valid,
+        "duration_s": round(duration, 3),
+        "records_per_second": round(total / duration, 1) if duration > 0 else 0.0,
+    }
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Dosyadan toplu tahmin",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("input", help="Girdi dosyası (.csv, .ndjson, .parquet)")
+    parser.add_argument(
+        "-o", "--output", default="-", help="Çıktı dosyası (- = stdout)"
+    )
+    parser.add_argument("--input-format", choices=INPUT_FORMATS)
+    parser.add_argument("--output-format", choices=OUTPUT_FORMATS)
+    parser.add_argument("--chunk-size", type=int, default=1000)
+    parser.add_argument(
+        "--workers", type=int, default=os.cpu_count() or 1, help="Process sayısı"
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Ana fonksiyon"""
+    args = parse_args(argv)
+
+    input_format = args.input_format or detect_format(args.input, INPUT_FORMATS)
+    if input_format is None:
+        print(
+            "❌ Girdi formatı tespit edilemedi, --input-format verin", file=sys.stderr
+        )
+        return 2
+    output_format = (
+        args.output_format or detect_format(args.output, OUTPUT_FORMATS) or "ndjson"
+    )
+    if args.chunk_size < 1 or args.workers < 1:
+        print("❌ --chunk-size ve --workers en az 1 olmalı", file=sys.stderr)
+        return 2
+
+    if args.output == "-":
+        summary = score_file(
+            args.input,
+            sys.stdout,
+            input_format,
+            output_format,
+            args.chunk_size,
+            args.workers,
+        )
+    else:
+        with open(args.output, "w", newline="", encoding="utf-8") as output:
+            summary = score_file(
+                args.input,
+                output,
+                input_format,
+                output_format,
+                args.chunk_size,
+                args.workers,
+            )
+
+    print(json.dumps(summary), file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""
+Micro-Batching - CI/CD Örneği
+Eşzamanlı gelen tekil tahmin isteklerini bir kuyrukta toplar ve ayrı bir
+worker thread'inde tek vektörel predict_batch çağrısıyla tahmin eder.
+Batch, boyut sınırına ulaşınca veya ilk isteğin bekleme süresi dolunca
+işlenir; her istek kendi sonucunu alır.
+
+Düşük yükte (son batch tek istekliyse) beklenmez, kuyrukta olanlar hemen
+işlenir; bekleme sadece eşzamanlı istek görüldüğünde devreye girer.
+"""
+
+import os
+import queue
+import threading
+import time
+import weakref
+from typing import Any, Dict, List, Optional
+
+from metrics import ShardedCounter, ShardedHistogram
+
+# Batch boyutu ve kuyruk bekleme süresi (saniye) histogram bucket'ları
+BATCH_SIZE_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128, 256)
+QUEUE_WAIT_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025)
+
+
+class _Pending:
+    """Kuyrukta sonucunu bekleyen tekil istek"""
+
+    __slots__ = ("model", "record", "enqueued", "event", "result", "error")
+
+    def __init__(self, model: Any, record: Dict[str, Any]):
+        self.model = model
+        self.record = record
+        self.enqueued = time.perf_counter()
+        self.event = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class MicroBatcher:
+    """
+    Tekil predict çağrılarını predict_batch çağrılarında birleştirir
+
+    Model request süresince çağıran tarafından tutulur (registry.acquire);
+    aynı batch'teki farklı model versiyonlarının kayıtları ayrı ayrı
+    tahmin edilir. max_batch_size 1 veya 0 ise batching kapalıdır ve
+    predict() modeli doğrudan çağırır.
+    """
+
+    def __init__(
+        self,
+        max_batch_size: Optional[int] = None,
+        max_wait: Optional[float] = None,
+        batch_sizes=None,
+        queue_wait=None,
+    ):
+        self.max_batch_size = (
+            int(os.environ.get("MICRO_BATCH_MAX_SIZE", 0))
+            if max_batch_size is None
+            else max_batch_size
+        )
+        self.max_wait = (
+            float(os.environ.get("MICRO_BATCH_MAX_WAIT_MS", 2)) / 1000
+            if max_wait is None
+            else max_wait
+        )
+        if self.max_batch_size < 0 or self.max_wait < 0:
+            raise ValueError("max_batch_size ve max_wait negatif olamaz")
+
+        # Dağılımlar için observe() olan herhangi bir histogram verilebilir
+        # (örn. Prometheus Histogram); sayaçlar /metrics özeti içindir
+        self.batch_sizes = (
+            ShardedHistogram(BATCH_SIZE_BUCKETS) if batch_sizes is None else batch_sizes
+        )
+        self.queue_wait = (
+            ShardedHistogram(QUEUE_WAIT_BUCKETS) if queue_wait is None else queue_wait
+        )
+        self.batches = ShardedCounter()
+        self.requests = ShardedCounter()
+        self.queue_wait_total = ShardedCounter()
+
+        self._reset_worker()
+        ref = weakref.ref(self)
+        os.register_at_fork(
+            after_in_child=lambda: ref() is not None and ref()._reset_worker()
+        )
+
+    def _reset_worker(self):
+        # Fork sonrası worker thread çocuğa geçmez; ilk istekte yeniden başlar
+        self._queue: "queue.SimpleQueue[Optional[_Pending]]" = queue.SimpleQueue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._last_batch_size = 1
+
+    @property
+    def enabled(self) -> bool:
+        """Micro-batching açık mı"""
+        return self.max_batch_size > 1
+
+    def predict(self, model: Any, record: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Kaydı sıradaki batch ile tahmin et ve sonucu bekle
+
+        Args:
+            model: predict/predict_batch metodları olan model
+            record: Doğrulanmış tekil kayıt
+
+        Returns:
+            model.predict() ile aynı formatta sonuç
+        """
+        if not self.enabled:
+            return model.predict(record)
+
+        self._ensure_started()
+        pending = _Pending(model, record)
+        self._queue.put(pending)
+        pending.event.wait()
+        if pending.error is not None:
+            raise pending.error
+        return pending.result
+
+    def _ensure_started(self):
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                thread = threading.Thread(
+                    target=self._run, name="micro-batcher", daemon=True
+                )
+                thread.start()
+                self._thread = thread
+
+    def stop(self, timeout: Optional[float] = None):
+        """Worker thread'ini durdur; kuyruktaki istekler önce işlenir"""
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            self._queue.put(None)
+            thread.join(timeout)
+
+    def _run(self):
+        while True:
+            batch = self._collect()
+            if batch is None:
+                return
+            self._flush(batch)
+            if batch[-1] is None:
+                return
+
+    def _collect(self) -> Optional[List[Optional[_Pending]]]:
+        """
+        Bir sonraki batch'i topla
+
+        Kuyrukta hazır olanlar hemen alınır; son batch birden fazla istek
+        içerdiyse ilk isteğin bekleme süresi dolana kadar yenileri beklenir.
+        Durdurma işareti (None) gelirse listenin sonuna eklenir.
+        """
+        first = self._queue.get()
+        if first is None:
+            return None
+        batch: List[Optional[_Pending]] = [first]
+        deadline = first.enqueued + self.max_wait
+        wait = self._last_batch_size > 1
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.perf_counter() if wait else 0
+            try:
+                if remaining > 0:
+                    item = self._queue.get(timeout=remaining)
+                else:
+                    item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            batch.append(item)
+            if item is None:
+                break
+        return batch
+
+    def _flush(self, batch: List[Optional[_Pending]]):
+        """Batch'i model bazında tahmin et ve bekleyenleri uyandır"""
+        pending = [item for item in batch if item is not None]
+        self._last_batch_size = len(pending)
+        if not pending:
+            return
+
+        started = time.perf_counter()
+        for item in pending:
+            waited = started - item.enqueued
+            self.queue_wait.observe(waited)
+            self.queue_wait_total.add(waited)
+
+        groups: Dict[int, List[_Pending]] = {}
+        for item in pending:
+            groups.setdefault(id(item.model), []).append(item)
+
+        for items in groups.values():
+            self.batch_sizes.observe(len(items))
+            self.batches.add()
+            self.requests.add(len(items))
+            try:
+                results = items[0].model.predict_batch([i.record for i in items])
+                for item, result in zip(items, results):
+                    item.result = result
+            except Exception as e:
+                for item in items:
+                    item.error = e
+            finally:
+                for item in items:
+                    item.event.set()
+
+    def stats(self) -> Dict[str, Any]:
+        """Ayarlar, batch sayısı, ortalama batch boyutu ve kuyruk beklemesi"""
+        batches = self.batches.value()
+        requests = self.requests.value()
+        return {
+            "enabled": self.enabled,
+            "max_batch_size": self.max_batch_size,
+            "max_wait_ms": round(self.max_wait * 1000, 3),
+            "batches": batches,
+            "requests": requests,
+            "mean_batch_size": round(requests / batches, 2) if batches else 0.0,
+            "mean_queue_wait_ms": (
+                round(self.queue_wait_total.value() / requests * 1000, 3)
+                if requests
+                else 0.0
+            ),
+            "pending": self._queue.qsize(),
+        }
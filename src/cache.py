@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Response Cache - CI/CD Örneği
+'value' içeren tahminler için boyut ve süre sınırlı LRU cache ve aynı
+anda gelen aynı isteklerin tek hesaplamada birleştirilmesi (single-flight)
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from metrics import ShardedCounter
+
+
+def make_cache_key(data: Dict[str, Any]) -> Optional[Hashable]:
+    """
+    Doğrulanmış payload'dan cache anahtarı üretir
+
+    Response sadece 'value' alanına bağlı olduğundan anahtar bu alandan
+    oluşur. Tip de anahtara dahildir; 50, 50.0 ve "50" response'ta farklı
+    'input_value' döndürür.
+
+    Returns:
+        Cache anahtarı veya cache'lenemeyecek payload'lar için None
+    """
+    if not isinstance(data, dict) or "value" not in data:
+        return None
+
+    value = data["value"]
+    if not isinstance(value, (int, float, str)):
+        return None
+    return (type(value).__name__, value)
+
+
+class ResponseCache:
+    """
+    Serialize edilmiş response'ları tutan LRU + TTL cache
+
+    Cache'lenen response'lar ilk hesaplandıkları andaki timestamp ve
+    confidence değerlerini taşır; TTL bu değerlerin ne kadar eski
+    olabileceğini sınırlar.
+    """
+
+    def __init__(self, max_size: int = 1024, ttl_seconds: float = 60.0):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = ShardedCounter()
+        self.misses = ShardedCounter()
+        self.evictions = ShardedCounter()
+        self.expirations = ShardedCounter()
+
+    def get(self, key: Hashable) -> Optional[bytes]:
+        """Anahtarın serialize edilmiş response'unu döndür (yoksa None)"""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry[0] > now:
+                    self._entries.move_to_end(key)
+                    self.hits.add()
+                    return entry[1]
+                del self._entries[key]
+                self.expirations.add()
+        self.misses.add()
+        return None
+
+    def put(self, key: Hashable, body: bytes):
+        """Response'u cache'e ekle, gerekirse en eski kaydı çıkar"""
+        expires_at = time.monotonic() + self.ttl_seconds
+        with self._lock:
+            self._entries[key] = (expires_at, body)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions.add()
+
+    def clear(self):
+        """Cache'i temizle"""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, Any]:
+        """Cache istatistikleri"""
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits.value(),
+            "misses": self.misses.value(),
+            "evictions": self.evictions.value(),
+            "expired": self.expirations.value(),
+        }
+
+
+class _Call:
+    """Devam eden hesaplama; bekleyenler event ile sonucu alır"""
+
+    __slots__ = ("event", "result", "error")
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    Aynı anahtar için eşzamanlı hesaplamaları tek çağrıda birleştirir
+
+    Anahtar için hesaplama sürüyorsa yeni çağıran (follower) hesaplamayı
+    tekrarlamaz, ilk çağıranın (leader) sonucunu bekler. Sonuç cache'lenmez;
+    hesaplama bitince anahtar serbest kalır. Leader hata alırsa aynı hata
+    bekleyenlere de iletilir.
+    """
+
+    def __init__(self):
+        self._calls: Dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+        self.leaders = ShardedCounter()
+        self.followers = ShardedCounter()
+
+    def do(self, key: Hashable, function: Callable[[], Any]) -> Tuple[Any, bool]:
+        """
+        function'ı anahtar için en fazla bir kez eşzamanlı çalıştır
+
+        Returns:
+            (sonuç, paylaşıldı mı) - paylaşıldı True ise sonuç başka bir
+            çağrının hesaplamasıdır
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            self.followers.add()
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+
+        self.leaders.add()
+        try:
+            call.result = function()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.event.set()
+        return call.result, False
+
+    def stats(self) -> Dict[str, Any]:
+        """Hesaplama (leader) ve birleştirilen (follower) çağrı sayıları"""
+        leaders = self.leaders.value()
+        followers = self.followers.value()
+        total = leaders + followers
+        return {
+            "in_flight": len(self._calls),
+            "computations": leaders,
+            "coalesced": followers,
+            "coalescing_ratio": round(followers / total, 4) if total else 0.0,
+        }
@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""
+Sağlık Kontrolleri - CI/CD Örneği
+Bağımlılık probe'larını eşzamanlı ve probe başına timeout ile çalıştırır,
+sonuçları arka planda periyodik olarak yenileyip saklar.
+
+asyncio sadece async probe'lar çalışırken gerekir; uygulama import süresine
+eklenmesin diye fonksiyon içinde import edilir.
+"""
+
+import inspect
+import logging
+import os
+import threading
+import time
+import weakref
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from datetime import datetime
+from typing import Any, Callable, Dict, FrozenSet, Optional, Tuple
+
+from utils import health_check_database, health_check_external_api
+
+logger = logging.getLogger(__name__)
+
+# Probe başına varsayılan timeout (saniye)
+HEALTH_PROBE_TIMEOUT = float(os.environ.get("HEALTH_PROBE_TIMEOUT", 2.0))
+
+# İsim -> probe fonksiyonu (sync veya async, bool döndürür)
+HEALTH_PROBES: Dict[str, Callable[[], Any]] = {
+    "database": health_check_database,
+    "external_api": health_check_external_api,
+}
+
+# Readiness'i etkilemeyen, sadece raporlanan probe'lar (varsayılan: rastgele
+# başarısız olan simülasyon probe'ları)
+INFORMATIONAL_PROBES = frozenset(
+    name
+    for name in os.environ.get(
+        "HEALTH_INFORMATIONAL_PROBES", "database,external_api"
+    ).split(",")
+    if name
+)
+
+
+def _call_probe(probe: Callable[[], Any]) -> Tuple[bool, float]:
+    """Probe'u çalıştır (async probe kendi event loop'unda); (sonuç, ms)"""
+    start = time.perf_counter()
+    if inspect.iscoroutinefunction(probe):
+        import asyncio
+
+        healthy = bool(asyncio.run(probe()))
+    else:
+        healthy = bool(probe())
+    return healthy, round((time.perf_counter() - start) * 1000, 2)
+
+
+class HealthMonitor:
+    """
+    Probe'ları arka planda periyodik çalıştırıp son sonucu saklar
+
+    /health her istekte probe çalıştırmak yerine son snapshot'ı döndürür.
+    Snapshot max_age saniyeden eskiyse (örn. refresh thread'i takıldıysa)
+    sonuç unhealthy sayılır.
+
+    Probe'lar kalıcı bir thread pool'da çalışır; timeout'u aşan probe
+    beklenmez ve bitene kadar yeniden başlatılmaz (takılan probe pool'u
+    doldurmaz, sonraki refresh'lerde timeout olarak raporlanır).
+    """
+
+    def __init__(
+        self,
+        probes: Optional[Dict[str, Callable[[], Any]]] = None,
+        interval: Optional[float] = None,
+        timeout: Optional[float] = None,
+        max_age: Optional[float] = None,
+        informational: Optional[FrozenSet[str]] = None,
+    ):
+        self.probes = probes
+        self.interval = (
+            float(os.environ.get("HEALTH_REFRESH_INTERVAL", 10.0))
+            if interval is None
+            else interval
+        )
+        self.timeout = timeout
+        self.max_age = (
+            float(os.environ.get("HEALTH_MAX_AGE", 30.0))
+            if max_age is None
+            else max_age
+        )
+        # (checks, monotonic zaman, ISO timestamp) - tek referans, atomik değişir
+        self._snapshot: Optional[Tuple[Dict[str, Dict[str, Any]], float, str]] = None
+        self.informational = (
+            INFORMATIONAL_PROBES if informational is None else informational
+        )
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._reset_executor()
+        ref = weakref.ref(self)
+        os.register_at_fork(
+            after_in_child=lambda: ref() is not None and ref()._reset_executor()
+        )
+
+    def _reset_executor(self):
+        # Fork sonrası pool thread'leri çocuğa geçmez; ilk refresh'te yeniden kurulur
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_size = 0
+        self._running: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+
+    def _get_executor(self, size: int) -> ThreadPoolExecutor:
+        """Her probe'a bir thread yetecek büyüklükte kalıcı pool"""
+        if self._executor is None or self._executor_size < size:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+            self._executor = ThreadPoolExecutor(
+                max_workers=size, thread_name_prefix="health-probe"
+            )
+            self._executor_size = size
+        return self._executor
+
+    def refresh(self) -> Dict[str, Dict[str, Any]]:
+        """Probe'ları şimdi çalıştır (en fazla timeout kadar) ve snapshot'ı güncelle"""
+        probes = HEALTH_PROBES if self.probes is None else self.probes
+        timeout = HEALTH_PROBE_TIMEOUT if self.timeout is None else self.timeout
+
+        with self._lock:
+            executor = self._get_executor(max(len(probes), 1))
+            futures: Dict[str, Future] = {}
+            for name, probe in probes.items():
+                running = self._running.get(name)
+                if running is None or running.done():
+                    running = self._running[name] = executor.submit(_call_probe, probe)
+                futures[name] = running
+
+            wait(futures.values(), timeout=timeout)
+            checks: Dict[str, Dict[str, Any]] = {}
+            for name, future in futures.items():
+                if not future.done():
+                    checks[name] = {
+                        "healthy": False,
+                        "error": f"timeout ({timeout}s)",
+                        "latency_ms": round(timeout * 1000, 2),
+                    }
+                elif future.exception() is not None:
+                    checks[name] = {"healthy": False, "error": str(future.exception())}
+                else:
+                    healthy, latency = future.result()
+                    checks[name] = {"healthy": healthy, "latency_ms": latency}
+
+        self._snapshot = (checks, time.monotonic(), datetime.now().isoformat())
+        return checks
+
+    def _run(self):
+        while not self._stop_event.is_set():
+            try:
+                self.refresh()
+            except Exception as e:
+                logger.error("Health refresh failed: %s", e)
+            self._stop_event.wait(self.interval)
+
+    def start(self):
+        """Arka plan refresh thread'ini başlat"""
+        if self.is_running():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="health-monitor", daemon=True
+        )
+        self._thread.start()
+        logger.info("Health monitor started (interval: %ss)", self.interval)
+
+    def stop(self, timeout: Optional[float] = None):
+        """Arka plan refresh thread'ini ve probe pool'unu durdur"""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        with self._lock:
+            if self._executor is not None:
+                # Takılan probe'lar beklenmez
+                self._executor.shutdown(wait=False)
+            self._executor = None
+            self._executor_size = 0
+            self._running = {}
+
+    def is_running(self) -> bool:
+        """Refresh thread'i çalışıyor mu"""
+        return self._thread is not None and self._thread.is_alive()
+
+    def snapshot(self) -> Optional[Dict[str, Any]]:
+        """
+        Son probe sonuçları
+
+        Returns:
+            {'checks', 'age_seconds', 'checked_at', 'stale'} veya henüz
+            kontrol yapılmadıysa None
+        """
+        snapshot = self._snapshot
+        if snapshot is None:
+            return None
+        checks, checked_at, timestamp = snapshot
+        age = time.monotonic() - checked_at
+        return {
+            "checks": checks,
+            "age_seconds": round(age, 3),
+            "checked_at": timestamp,
+            "stale": age > self.max_age,
+        }
+
+    def is_ready(self, snapshot: Optional[Dict[str, Any]] = None) -> bool:
+        """
+        Bağımlılıklar readiness için uygun mu
+
+        Snapshot güncel olmalı ve informational dışındaki tüm probe'lar
+        sağlıklı olmalı.
+        """
+        snapshot = self.snapshot() if snapshot is None else snapshot
+        if snapshot is None or snapshot["stale"]:
+            return False
+        return all(
+            check["healthy"]
+            for name, check in snapshot["checks"].items()
+            if name not in self.informational
+        )
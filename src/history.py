@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Tahmin Geçmişi - CI/CD Örneği
+Son tahminleri sabit boyutlu, array tabanlı bir ring buffer'da tutar ve
+son 1/5/15 dakikalık pencereler için hız, ortalama ve kategori dağılımı
+hesaplar. Bellek kullanımı trafikten bağımsızdır.
+"""
+
+import math
+import threading
+import time
+from array import array
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
+
+from utils import CATEGORY_THRESHOLDS
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# Pencere adı -> süre (saniye)
+HISTORY_WINDOWS = {"1m": 60, "5m": 300, "15m": 900}
+
+
+class PredictionHistory:
+    """
+    (timestamp, value, prediction) kayıtları için ring buffer
+
+    Kayıtlar üç paralel array'de (monotonic zaman, input value, tahmin)
+    tutulur; kapasite dolunca en eski kayıtların üzerine yazılır. Kilit
+    sadece slot ayırmak için kısa süre tutulur, yazma kilit dışında yapılır.
+    'value' olmayan kayıtlarda value NaN'dır.
+    """
+
+    def __init__(self, capacity: int = 10000):
+        if capacity < 1:
+            raise ValueError("capacity en az 1 olmalı")
+        self.capacity = capacity
+        self._timestamps = array("d", [-math.inf]) * capacity
+        self._values = array("d", [math.nan]) * capacity
+        self._predictions = array("d", [0.0]) * capacity
+        # Batch yazma ve okuma için kopyasız numpy görünümleri (ilk kullanımda)
+        self._numpy_views: Optional[Tuple["np.ndarray", ...]] = None
+        self._next = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return min(self._next, self.capacity)
+
+    def _views(self) -> Tuple["np.ndarray", ...]:
+        """(timestamp, value, prediction) numpy görünümleri
+
+        numpy sadece batch yazma ve pencere okuması için gerekir; import
+        maliyeti uygulama başlangıcına eklenmesin diye ilk kullanımda yüklenir.
+        """
+        views = self._numpy_views
+        if views is None:
+            import numpy as np
+
+            views = self._numpy_views = tuple(
+                np.frombuffer(buffer, dtype=np.float64)
+                for buffer in (self._timestamps, self._values, self._predictions)
+            )
+        return views
+
+    def _reserve(self, count: int) -> int:
+        with self._lock:
+            start = self._next
+            self._next += count
+        return start
+
+    def append(self, value: Optional[float], prediction: float):
+        """Tek tahmin ekle - O(1)"""
+        slot = self._reserve(1) % self.capacity
+        self._values[slot] = math.nan if value is None else value
+        self._predictions[slot] = prediction
+        # Zaman en son yazılır (yeni kayıt ancak tamamlanınca pencereye girer)
+        self._timestamps[slot] = time.monotonic()
+
+    def extend(self, values: "np.ndarray", predictions: "np.ndarray"):
+        """Batch tahminlerini ekle (value'lar NaN olabilir)"""
+        count = len(predictions)
+        if count == 0:
+            return
+        if count > self.capacity:
+            values = values[-self.capacity :]
+            predictions = predictions[-self.capacity :]
+            self._reserve(count - self.capacity)
+            count = self.capacity
+
+        now = time.monotonic()
+        start = self._reserve(count) % self.capacity
+        first = min(count, self.capacity - start)
+        self._write(start, values[:first], predictions[:first], now)
+        if first < count:
+            # Buffer sonuna taşan kısım başa yazılır
+            self._write(0, values[first:], predictions[first:], now)
+
+    def _write(self, start: int, values, predictions, now: float):
+        end = start + len(predictions)
+        timestamp_view, value_view, prediction_view = self._views()
+        value_view[start:end] = values
+        prediction_view[start:end] = predictions
+        timestamp_view[start:end] = now
+
+    def window_stats(
+        self, seconds: float, now: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """
+        Son `seconds` saniyedeki tahminlerin özeti
+
+        Returns:
+            {'count', 'rate_per_second', 'mean_prediction', 'mean_value',
+             'categories', 'complete'}; 'complete' False ise pencere
+            buffer kapasitesinden uzundur ve eski kayıtlar düşmüştür.
+        """
+        import numpy as np
+
+        now = time.monotonic() if now is None else now
+        timestamp_view, value_view, prediction_view = self._views()
+        mask = timestamp_view.copy() >= now - seconds
+        predictions = prediction_view[mask]
+        values = value_view[mask]
+        count = int(predictions.size)
+
+        categories = {}
+        remaining = np.ones(count, dtype=bool)
+        for category, threshold in CATEGORY_THRESHOLDS:
+            matched = remaining & (predictions >= threshold)
+            categories[category] = int(matched.sum())
+            remaining &= ~matched
+        categories["low"] = int(remaining.sum())
+
+        present = values[~np.isnan(values)]
+        complete = self._next <= self.capacity or not mask.all()
+        return {
+            "count": count,
+            "rate_per_second": round(count / seconds, 4),
+            "mean_prediction": round(float(predictions.mean()), 4) if count else None,
+            "mean_value": round(float(present.mean()), 4) if present.size else None,
+            "categories": categories,
+            "complete": bool(complete),
+        }
+
+    def summary(self, windows: Optional[Dict[str, float]] = None) -> Dict[str, Any]:
+        """Tüm pencerelerin özeti"""
+        windows = HISTORY_WINDOWS if windows is None else windows
+        now = time.monotonic()
+        return {
+            "capacity": self.capacity,
+            "size": len(self),
+            "windows": {
+                name: self.window_stats(seconds, now)
+                for name, seconds in windows.items()
+            },
+        }
+
+    def clear(self):
+        """Tüm kayıtları sil"""
+        with self._lock:
+            self._timestamps[:] = array("d", [-math.inf]) * self.capacity
+            self._next = 0
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Hızlı JSON Provider - CI/CD Örneği
+orjson yüklüyse Flask'in JSON encode/decode işlemleri orjson ile yapılır,
+değilse stdlib json'a düşülür.
+"""
+
+import logging
+import os
+from typing import Any, Optional
+
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson opsiyonel
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+JSON_BACKENDS = ("auto", "orjson", "stdlib")
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """
+    orjson tabanlı Flask JSON provider
+
+    Tarih, UUID ve dataclass gibi tipler stdlib provider ile aynı çıktıyı
+    versin diye Flask'in ``default`` fonksiyonuna bırakılır. orjson'un
+    desteklemediği bir durumda (örn. 64 bit üstü int) stdlib'e düşülür.
+    """
+
+    def _options(self, indent: bool = False) -> int:
+        options = (
+            orjson.OPT_NON_STR_KEYS
+            | orjson.OPT_PASSTHROUGH_DATETIME
+            | orjson.OPT_PASSTHROUGH_DATACLASS
+        )
+        if self.sort_keys:
+            options |= orjson.OPT_SORT_KEYS
+        if indent:
+            options |= orjson.OPT_INDENT_2
+        return options
+
+    def dumps_bytes(self, obj: Any, indent: bool = False) -> bytes:
+        """Objeyi UTF-8 JSON byte'larına çevir"""
+        try:
+            return orjson.dumps(obj, default=self.default, option=self._options(indent))
+        except TypeError:
+            return super().dumps(obj).encode("utf-8")
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        if kwargs:
+            # indent, cls vb. stdlib'e özgü argümanlar
+            return super().dumps(obj, **kwargs)
+        return self.dumps_bytes(obj).decode("utf-8")
+
+    def loads(self, s: Any, **kwargs: Any) -> Any:
+        if kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any):
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = (self.compact is None and self._app.debug) or self.compact is False
+        return self._app.response_class(
+            self.dumps_bytes(obj, indent=indent) + b"\n", mimetype=self.mimetype
+        )
+
+
+def create_json_provider(app, backend: Optional[str] = None) -> DefaultJSONProvider:
+    """
+    Uygulama için JSON provider oluşturur
+
+    Args:
+        app: Flask uygulaması
+        backend: 'auto', 'orjson' veya 'stdlib'
+            (verilmezse JSON_BACKEND env değişkeni, varsayılan 'auto')
+
+    Returns:
+        JSON provider instance'ı
+    """
+    backend = (backend or os.environ.get("JSON_BACKEND", "auto")).lower()
+    if backend not in JSON_BACKENDS:
+        raise ValueError(f"Geçersiz JSON backend: {backend}")
+
+    if backend == "stdlib" or (backend == "auto" and orjson is None):
+        return DefaultJSONProvider(app)
+
+    if orjson is None:
+        raise ImportError("JSON_BACKEND=orjson için orjson paketi yüklü olmalı")
+
+    return OrjsonProvider(app)
+
+
+def json_backend_name(provider: DefaultJSONProvider) -> str:
+    """Provider'ın kullandığı backend adını döndür"""
+    return "orjson" if isinstance(provider, OrjsonProvider) else "stdlib"
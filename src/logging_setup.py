@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+"""
+Log Konfigürasyonu - CI/CD Örneği
+Request thread'lerini bloklamayan, kuyruk tabanlı ve batch halinde JSON
+satırları yazan logging pipeline'ı.
+
+Request thread'i sadece log kaydını kuyruğa koyar; mesaj formatlama, JSON
+encode ve yazma işlemleri arka plandaki listener thread'inde yapılır.
+"""
+
+import atexit
+import itertools
+import json
+import logging
+import os
+import queue
+import sys
+import threading
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler
+from typing import IO, Optional
+
+# LogRecord'un standart alanları; bunların dışındakiler 'extra' kabul edilir
+_RECORD_FIELDS = set(vars(logging.makeLogRecord({}))) | {"message", "asctime"}
+_INTERNAL_FIELDS = {"sampled"}
+
+
+class JsonFormatter(logging.Formatter):
+    """Log kaydını tek satır JSON'a çevirir (extra alanlar dahil)"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "timestamp": datetime.fromtimestamp(
+                record.created, timezone.utc
+            ).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_FIELDS and key not in _INTERNAL_FIELDS:
+                entry[key] = value
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str, ensure_ascii=False)
+
+
+class SamplingFilter(logging.Filter):
+    """
+    extra={'sampled': True} ile işaretlenen kayıtların sadece bir kısmını geçirir
+
+    Örn. rate=0.01 ise işaretli kayıtların her 100'ünden biri geçer;
+    işaretsiz kayıtlar her zaman geçer.
+    """
+
+    def __init__(self, rate: float = 1.0):
+        super().__init__()
+        self.rate = rate
+        self._every = max(1, round(1 / rate)) if rate > 0 else 0
+        self._counter = itertools.count()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if not getattr(record, "sampled", False) or self._every == 1:
+            return True
+        if self._every == 0:
+            return False
+        return next(self._counter) % self._every == 0
+
+
+class NonBlockingQueueHandler(QueueHandler):
+    """
+    Kaydı formatlamadan kuyruğa koyan handler
+
+    Formatlama listener thread'ine bırakılır. Kuyruk doluysa kayıt
+    beklemeden atılır ve sayılır.
+    """
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+    def enqueue(self, record: logging.LogRecord):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class BatchingListener:
+    """
+    Kuyruktaki kayıtları toplu halde formatlayıp tek yazma ile çıktıya aktarır
+
+    Batch, batch_size kayda ulaşınca veya flush_interval saniye dolunca
+    yazılır.
+    """
+
+    _STOP = object()
+
+    def __init__(
+        self,
+        log_queue: queue.Queue,
+        stream: IO[str],
+        formatter: logging.Formatter,
+        batch_size: int = 100,
+        flush_interval: float = 0.5,
+    ):
+        self.queue = log_queue
+        self.stream = stream
+        self.formatter = formatter
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        """Listener thread'ini başlat"""
+        self._thread = threading.Thread(
+            target=self._run, name="log-listener", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        """Kalan kayıtları yazıp listener thread'ini durdur"""
+        if self._thread is not None:
+            self.queue.put(self._STOP)
+            self._thread.join()
+            self._thread = None
+
+    def _run(self):
+        while True:
+            try:
+                first = self.queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                continue
+
+            batch = [first]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            stop = any(record is self._STOP for record in batch)
+            self._write([record for record in batch if record is not self._STOP])
+            if stop:
+                return
+
+    def _write(self, records):
+        lines = []
+        for record in records:
+            try:
+                lines.append(self.formatter.format(record))
+            except Exception:
+                lines.append(
+                    json.dumps({"level": "ERROR", "message": "Log format error"})
+                )
+        if lines:
+            try:
+                self.stream.write("\n".join(lines) + "\n")
+                self.stream.flush()
+            except Exception:
+                pass
+
+
+_state = {"handler": None, "listener": None, "options": None}
+_state_lock = threading.Lock()
+
+
+def configure_logging(
+    level: Optional[str] = None,
+    batch_size: Optional[int] = None,
+    flush_interval: Optional[float] = None,
+    sample_rate: Optional[float] = None,
+    queue_size: Optional[int] = None,
+    stream: Optional[IO[str]] = None,
+) -> NonBlockingQueueHandler:
+    """
+    Root logger'ı kuyruk + batch JSON pipeline'ına bağlar
+
+    Verilmeyen ayarlar env değişkenlerinden okunur:
+    LOG_LEVEL (INFO), LOG_BATCH_SIZE (100), LOG_FLUSH_INTERVAL (0.5),
+    LOG_SAMPLE_RATE (1.0), LOG_QUEUE_SIZE (10000).
+
+    Tekrar çağrılırsa önceki pipeline durdurulup yenisi kurulur.
+
+    Returns:
+        Root logger'a eklenen queue handler
+    """
+    options = {
+        "level": (level or os.environ.get("LOG_LEVEL", "INFO")).upper(),
+        "batch_size": batch_size or int(os.environ.get("LOG_BATCH_SIZE", 100)),
+        "flush_interval": flush_interval
+        or float(os.environ.get("LOG_FLUSH_INTERVAL", 0.5)),
+        "sample_rate": (
+            float(os.environ.get("LOG_SAMPLE_RATE", 1.0))
+            if sample_rate is None
+            else sample_rate
+        ),
+        "queue_size": queue_size or int(os.environ.get("LOG_QUEUE_SIZE", 10000)),
+        "stream": stream or sys.stderr,
+    }
+
+    with _state_lock:
+        _shutdown_locked()
+        root = logging.getLogger()
+        root.setLevel(options["level"])
+
+        log_queue: queue.Queue = queue.Queue(maxsize=options["queue_size"])
+        handler = NonBlockingQueueHandler(log_queue)
+        handler.addFilter(SamplingFilter(options["sample_rate"]))
+        listener = BatchingListener(
+            log_queue,
+            options["stream"],
+            JsonFormatter(),
+            batch_size=options["batch_size"],
+            flush_interval=options["flush_interval"],
+        )
+
+        # basicConfig'in eklediği handler'ı kaldır (test/capture handler'larına
+        # dokunulmaz)
+        for existing in list(root.handlers):
+            if type(existing) is logging.StreamHandler:
+                root.removeHandler(existing)
+        root.addHandler(handler)
+        listener.start()
+
+        _state.update(handler=handler, listener=listener, options=options)
+    return handler
+
+
+def _shutdown_locked():
+    """Mevcut pipeline'ı durdur (_state_lock tutulurken çağrılır)"""
+    listener, handler = _state["listener"], _state["handler"]
+    if handler is not None:
+        logging.getLogger().removeHandler(handler)
+    if listener is not None:
+        listener.stop()
+    _state.update(handler=None, listener=None)
+
+
+def shutdown_logging():
+    """Kalan logları yazıp pipeline'ı durdur"""
+    with _state_lock:
+        _shutdown_locked()
+
+
+def _restart_after_fork():
+    """
+    Fork edilen child process'te listener thread'i yoktur; kuyruk dolup
+    loglar kaybolmasın diye pipeline yeni kuyruk ve thread ile yeniden kurulur.
+    """
+    global _state_lock
+    _state_lock = threading.Lock()
+    options = _state["options"]
+    if options is None:
+        return
+    # Parent'ın thread'i child'da çalışmaz, join edilmeden bırakılır
+    _state["listener"] = None
+    configure_logging(
+        level=options["level"],
+        batch_size=options["batch_size"],
+        flush_interval=options["flush_interval"],
+        sample_rate=options["sample_rate"],
+        queue_size=options["queue_size"],
+        stream=options["stream"],
+    )
+
+
+atexit.register(shutdown_logging)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_restart_after_fork)
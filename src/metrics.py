@@ -0,0 +1,617 @@
+#!/usr/bin/env python3
+"""
+Metrik Yardımcıları - CI/CD Örneği
+Thread-safe ve hot path'i kilitlemeyen sayaçlar, histogramlar ve
+Prometheus text formatında çıktı
+"""
+
+import threading
+import weakref
+from bisect import bisect_left
+from typing import Callable, Dict, Optional, Sequence, Tuple
+
+# Varsayılan latency bucket'ları (saniye)
+DEFAULT_LATENCY_BUCKETS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+)
+
+
+class _ShardOwner:
+    """Thread-local shard'ın sahibi; thread bitince garbage collect edilir"""
+
+    __slots__ = ("cell", "__weakref__")
+
+
+class _ShardSet:
+    """
+    Thread başına sabit uzunlukta hücre (list) tutan yapı
+
+    Her thread kendi hücresini kilitsiz günceller; okuma sırasında tüm
+    hücreler eleman bazında toplanır. Biten thread'lerin değerleri
+    kaybolmaz, toplam hücresine aktarılır.
+    """
+
+    def __init__(self, size: int):
+        self._size = size
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._shards: Dict[int, list] = {}
+        self._retired = [0] * size
+
+    def cell(self) -> list:
+        """Mevcut thread'in hücresini döndür (gerekirse oluştur)"""
+        owner = getattr(self._local, "owner", None)
+        if owner is None:
+            owner = _ShardOwner()
+            owner.cell = [0] * self._size
+            with self._lock:
+                self._shards[id(owner.cell)] = owner.cell
+            weakref.finalize(owner, self._retire, owner.cell)
+            self._local.owner = owner
+        return owner.cell
+
+    def _retire(self, cell: list):
+        """Biten thread'in değerlerini toplam hücresine aktar"""
+        with self._lock:
+            for i, value in enumerate(cell):
+                self._retired[i] += value
+            self._shards.pop(id(cell), None)
+
+    def snapshot(self) -> list:
+        """Tüm hücrelerin eleman bazında toplamını döndür"""
+        with self._lock:
+            total = list(self._retired)
+            for cell in self._shards.values():
+                for i, value in enumerate(cell):
+                    total[i] += value
+        return total
+
+    def reset(self):
+        """Tüm hücreleri sıfırla (eşzamanlı güncellemelerle yarışabilir)"""
+        with self._lock:
+            self._retired = [0] * self._size
+            for cell in self._shards.values():
+                for i in range(self._size):
+                    cell[i] = 0
+
+
+class ShardedCounter:
+    """
+    Thread başına shard tutan sayaç
+
+    Her thread kendi hücresini kilitsiz artırır; okuma sırasında tüm
+    shard'lar toplanır.
+    """
+
+    def __init__(self):
+        self._shards = _ShardSet(1)
+
+    def add(self, amount=1):
+        """Sayacı artır (kilitsiz)"""
+        self._shards.cell()[0] += amount
+
+    def value(self):
+        """Tüm shard'ların toplamını döndür"""
+        return self._shards.snapshot()[0]
+
+    def reset(self):
+        """Sayacı sıfırla (test amaçlı, eşzamanlı artırmalarla yarışabilir)"""
+        self._shards.reset()
+
+
+class ShardedHistogram:
+    """
+    Sabit bucket'lı, thread başına shard tutan histogram
+
+    Hücre düzeni: [bucket_0, ..., bucket_n, +Inf, sum]
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self._shards = _ShardSet(len(self.buckets) + 2)
+
+    def observe(self, value: float):
+        """Gözlem ekle (kilitsiz)"""
+        cell = self._shards.cell()
+        cell[bisect_left(self.buckets, value)] += 1
+        cell[-1] += value
+
+    def snapshot(self) -> Dict[str, object]:
+        """Bucket sayıları (kümülatif olmayan), toplam ve adet"""
+        total = self._shards.snapshot()
+        counts = total[:-1]
+        return {"counts": counts, "sum": total[-1], "count": sum(counts)}
+
+    def reset(self):
+        """Histogramı sıfırla (test amaçlı)"""
+        self._shards.reset()
+
+
+class StreamingStats:
+    """
+    Tek geçişte güncellenen ve birleştirilebilen dağılım istatistikleri
+
+    Ortalama ve varyans Welford algoritması ile, yüzdelikler [low, high]
+    aralığını eşit bölen sabit bucket'lı bir sketch ile hesaplanır; hiçbir
+    gözlem saklanmaz. Aralık dışındaki değerler alt/üst taşma bucket'larına
+    düşer. Yüzdelik hatası en fazla bir bucket genişliğidir.
+
+    Aynı bucket ayarına sahip iki instance merge() ile birleştirilebilir
+    (örn. thread veya worker process'lerin istatistikleri).
+
+    Thread-safe değildir; eşzamanlı kullanım için ShardedStats.
+    """
+
+    __slots__ = (
+        "low",
+        "high",
+        "bins",
+        "_scale",
+        "count",
+        "mean",
+        "_m2",
+        "min",
+        "max",
+        "counts",
+    )
+
+    def __init__(self, low: float = 0.0, high: float = 1.0, bins: int = 200):
+        if not high > low or bins < 1:
+            raise ValueError("high > low ve bins >= 1 olmalı")
+        self.low = low
+        self.high = high
+        self.bins = bins
+        self._scale = bins / (high - low)
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.min = float("inf")
+        self.max = float("-inf")
+        # [alt taşma, bucket_0 ... bucket_{bins-1}, üst taşma]
+        self.counts = [0] * (bins + 2)
+
+    def _bucket(self, value: float) -> int:
+        if value < self.low:
+            return 0
+        if value >= self.high:
+            return self.bins + 1 if value > self.high else self.bins
+        return int((value - self.low) * self._scale) + 1
+
+    def update(self, value: float):
+        """Tek gözlem ekle - O(1)"""
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+        self.counts[self._bucket(value)] += 1
+
+    def update_many(self, values: Sequence[float]):
+        """
+        Gözlem listesini tek seferde ekle (parça momentleri + merge)
+
+        Büyük numpy array'lerde hesaplama vektörel yapılır.
+        """
+        count = len(values)
+        if count == 0:
+            return
+        if hasattr(values, "dtype") and count < 64:
+            # Küçük array'lerde numpy çağrı maliyeti hesaplamadan büyük
+            values = values.tolist()
+        counts = self.counts
+        if hasattr(values, "dtype"):
+            # Çağıran numpy array verdiyse numpy zaten yüklüdür
+            import numpy as np
+
+            self._merge_moments(
+                count,
+                float(values.mean()),
+                float(values.var()) * count,
+                float(values.min()),
+                float(values.max()),
+            )
+            indices = np.floor((values - self.low) * self._scale).astype(np.int64) + 1
+            indices = np.clip(indices, 0, self.bins + 1)
+            # high'a tam eşit değerler son bucket'a (_bucket ile aynı)
+            indices[values == self.high] = self.bins
+            bucket_counts = np.bincount(indices, minlength=self.bins + 2)
+            buckets = np.flatnonzero(bucket_counts)
+            for i, bucket_count in zip(
+                buckets.tolist(), bucket_counts[buckets].tolist()
+            ):
+                counts[i] += bucket_count
+        else:
+            mean = sum(values) / count
+            self._merge_moments(
+                count,
+                mean,
+                sum((value - mean) * (value - mean) for value in values),
+                min(values),
+                max(values),
+            )
+            bucket = self._bucket
+            low, high, scale = self.low, self.high, self._scale
+            for value in values:
+                if low <= value < high:
+                    counts[int((value - low) * scale) + 1] += 1
+                else:
+                    counts[bucket(value)] += 1
+
+    def merge(self, other: "StreamingStats"):
+        """Başka bir instance'ın gözlemlerini ekle"""
+        if (other.low, other.high, other.bins) != (self.low, self.high, self.bins):
+            raise ValueError("Farklı bucket ayarına sahip istatistikler birleşemez")
+        if other.count == 0:
+            return
+        self._merge_moments(other.count, other.mean, other._m2, other.min, other.max)
+        counts = self.counts
+        for i, value in enumerate(other.counts):
+            if value:
+                counts[i] += value
+
+    def _merge_moments(
+        self, count: int, mean: float, m2: float, minimum: float, maximum: float
+    ):
+        """Parça momentlerini ekle (Chan et al. paralel varyans birleştirme)"""
+        total = self.count + count
+        delta = mean - self.mean
+        self.mean += delta * count / total
+        self._m2 += m2 + delta * delta * self.count * count / total
+        self.count = total
+        if minimum < self.min:
+            self.min = minimum
+        if maximum > self.max:
+            self.max = maximum
+
+    def variance(self) -> float:
+        """Örneklem varyansı (n - 1)"""
+        return self._m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    def quantile(self, q: float) -> float:
+        """Yaklaşık yüzdelik (0 <= q <= 1), bucket içinde lineer interpolasyon"""
+        if self.count == 0:
+            return 0.0
+        target = q * self.count
+        width = 1 / self._scale
+        cumulative = 0
+        for i, bucket_count in enumerate(self.counts):
+            if bucket_count and cumulative + bucket_count >= target:
+                if i == 0:
+                    lower, upper = self.min, self.low
+                elif i == self.bins + 1:
+                    lower, upper = self.high, self.max
+                else:
+                    lower = self.low + (i - 1) * width
+                    upper = lower + width
+                value = lower + (upper - lower) * (target - cumulative) / bucket_count
+                return min(max(value, self.min), self.max)
+            cumulative += bucket_count
+        return self.max
+
+    def summary(self, digits: int = 4) -> Dict[str, float]:
+        """count, mean, std, min, max ve p50/p95/p99"""
+        if self.count == 0:
+            return {
+                "count": 0,
+                "mean": 0,
+                "min": 0,
+                "max": 0,
+                "std": 0,
+                "p50": 0,
+                "p95": 0,
+                "p99": 0,
+            }
+        return {
+            "count": self.count,
+            "mean": round(self.mean, digits),
+            "min": self.min,
+            "max": self.max,
+            "std": round(self.variance() ** 0.5, digits),
+            "p50": round(self.quantile(0.50), digits),
+            "p95": round(self.quantile(0.95), digits),
+            "p99": round(self.quantile(0.99), digits),
+        }
+
+    def to_dict(self) -> Dict[str, object]:
+        """Process'ler arası taşınabilir durum"""
+        return {
+            "low": self.low,
+            "high": self.high,
+            "bins": self.bins,
+            "count": self.count,
+            "mean": self.mean,
+            "m2": self._m2,
+            "min": self.min,
+            "max": self.max,
+            "counts": list(self.counts),
+        }
+
+    @classmethod
+    def from_dict(cls, state: Dict[str, object]) -> "StreamingStats":
+        """to_dict() çıktısından instance oluştur"""
+        stats = cls(state["low"], state["high"], state["bins"])
+        stats.count = state["count"]
+        stats.mean = state["mean"]
+        stats._m2 = state["m2"]
+        stats.min = state["min"]
+        stats.max = state["max"]
+        stats.counts = list(state["counts"])
+        return stats
+
+
+class ShardedStats:
+    """
+    Thread başına StreamingStats tutan, kilitsiz güncellenen istatistikler
+
+    Okuma sırasında tüm shard'lar merge edilir; biten thread'lerin
+    gözlemleri kaybolmaz.
+    """
+
+    def __init__(self, low: float = 0.0, high: float = 1.0, bins: int = 200):
+        self._config = (low, high, bins)
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._shards: Dict[int, StreamingStats] = {}
+        self._retired = StreamingStats(*self._config)
+
+    def _shard(self) -> StreamingStats:
+        owner = getattr(self._local, "owner", None)
+        if owner is None:
+            owner = _ShardOwner()
+            owner.cell = StreamingStats(*self._config)
+            with self._lock:
+                self._shards[id(owner.cell)] = owner.cell
+            weakref.finalize(owner, self._retire, owner.cell)
+            self._local.owner = owner
+        return owner.cell
+
+    def _retire(self, shard: StreamingStats):
+        with self._lock:
+            self._retired.merge(shard)
+            self._shards.pop(id(shard), None)
+
+    def update(self, value: float):
+        """Gözlem ekle (kilitsiz)"""
+        self._shard().update(value)
+
+    def update_many(self, values: Sequence[float]):
+        """Gözlem listesi ekle (kilitsiz)"""
+        self._shard().update_many(values)
+
+    def snapshot(self) -> StreamingStats:
+        """Tüm shard'ların birleşimi"""
+        with self._lock:
+            total = StreamingStats.from_dict(self._retired.to_dict())
+            for shard in list(self._shards.values()):
+                total.merge(shard)
+        return total
+
+    def reset(self):
+        """Tüm gözlemleri sil (test amaçlı)"""
+        with self._lock:
+            self._retired = StreamingStats(*self._config)
+            for shard in self._shards.values():
+                shard.__init__(*self._config)
+
+
+def _format_labels(labelnames: Tuple[str, ...], values: Tuple[str, ...]) -> str:
+    """Prometheus label bloğunu oluştur"""
+    if not labelnames:
+        return ""
+    pairs = []
+    for name, value in zip(labelnames, values):
+        escaped = (
+            str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+        )
+        pairs.append(f'{name}="{escaped}"')
+    return "{" + ",".join(pairs) + "}"
+
+
+def _format_value(value: float) -> str:
+    """Prometheus sayı formatı"""
+    if isinstance(value, float) and value == float("inf"):
+        return "+Inf"
+    return repr(value) if isinstance(value, float) else str(value)
+
+
+class _Metric:
+    """Label destekli metrik ailesi için ortak taban"""
+
+    metric_type = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: Dict[Tuple[str, ...], object] = {}
+        self._lock = threading.Lock()
+        # Alt metrikleri process'ler arası tutan depo (örn. SharedMetrics);
+        # None ise alt metrikler process içidir
+        self.backend = None
+
+    def _new_child(self):
+        raise NotImplementedError
+
+    def labels(self, *values):
+        """Label değerlerine karşılık gelen alt metriği döndür"""
+        key = tuple(str(value) for value in values)
+        child = self._children.get(key)
+        if child is None:
+            if len(key) != len(self.labelnames):
+                raise ValueError(f"{self.name}: label sayısı uyumsuz")
+            with self._lock:
+                child = self._children.get(key)
+                if child is None:
+                    child = self._children[key] = (
+                        self._new_child()
+                        if self.backend is None
+                        else self.backend.series(self.name, key)
+                    )
+        return child
+
+    def _default(self):
+        return self.labels()
+
+    def reset(self):
+        """Tüm alt metrikleri sıfırla (test amaçlı)"""
+        for child in list(self._children.values()):
+            child.reset()
+
+    def collect(self):
+        """(label değerleri, alt metrik) çiftleri (backend varsa tüm process'ler)"""
+        if self.backend is not None:
+            return self.backend.collect(self.name)
+        return sorted(self._children.items())
+
+    def render(self) -> list:
+        raise NotImplementedError
+
+    def _header(self) -> list:
+        return [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.metric_type}",
+        ]
+
+
+class Counter(_Metric):
+    """Monoton artan sayaç"""
+
+    metric_type = "counter"
+
+    def _new_child(self):
+        return ShardedCounter()
+
+    def inc(self, amount=1):
+        """Label'sız sayacı artır"""
+        self._default().add(amount)
+
+    def value(self, *labelvalues):
+        """Sayacın değerini döndür"""
+        return self.labels(*labelvalues).value()
+
+    def render(self) -> list:
+        lines = self._header()
+        for key, child in self.collect():
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}{labels} {_format_value(child.value())}")
+        return lines
+
+
+class Gauge(Counter):
+    """Artıp azalabilen değer (örn. işlemdeki istek sayısı)"""
+
+    metric_type = "gauge"
+
+    def dec(self, amount=1):
+        """Label'sız gauge'u azalt"""
+        self._default().add(-amount)
+
+
+class Histogram(_Metric):
+    """Sabit bucket'lı histogram"""
+
+    metric_type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def _new_child(self):
+        return ShardedHistogram(self.buckets)
+
+    def observe(self, value: float):
+        """Label'sız histograma gözlem ekle"""
+        self._default().observe(value)
+
+    def render(self) -> list:
+        lines = self._header()
+        for key, child in self.collect():
+            snapshot = child.snapshot()
+            cumulative = 0
+            bounds = self.buckets + (float("inf"),)
+            for bound, count in zip(bounds, snapshot["counts"]):
+                cumulative += count
+                labels = _format_labels(
+                    self.labelnames + ("le",), key + (_format_value(float(bound)),)
+                )
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(snapshot['sum'])}")
+            lines.append(f"{self.name}_count{labels} {snapshot['count']}")
+        return lines
+
+
+class CallbackMetric(_Metric):
+    """Değeri okuma anında bir fonksiyondan alınan metrik"""
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        function: Callable[[], float],
+        metric_type: str = "gauge",
+    ):
+        super().__init__(name, documentation)
+        self.metric_type = metric_type
+        self.function = function
+
+    def reset(self):
+        pass
+
+    def render(self) -> list:
+        return self._header() + [f"{self.name} {_format_value(self.function())}"]
+
+
+class MetricsRegistry:
+    """Metrikleri isimle tutan ve Prometheus formatında render eden kayıt"""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def register(self, metric: _Metric) -> _Metric:
+        """Metriği kaydet; aynı isim tekrar kaydedilirse mevcut olanı döndür"""
+        with self._lock:
+            return self._metrics.setdefault(metric.name, metric)
+
+    def get(self, name: str) -> Optional[_Metric]:
+        """İsimle metrik bul"""
+        return self._metrics.get(name)
+
+    def reset(self):
+        """Tüm metrikleri sıfırla (test amaçlı)"""
+        for metric in list(self._metrics.values()):
+            metric.reset()
+
+    def render(self) -> str:
+        """Prometheus text exposition formatı (v0.0.4)"""
+        lines = []
+        for metric in list(self._metrics.values()):
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+# Uygulama genelinde kullanılan varsayılan registry
+REGISTRY = MetricsRegistry()
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
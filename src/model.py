@@ -4,26 +4,53 @@ Basit ML Model - CI/CD Test Amaçlı
 Bu model CI/CD pipeline'ı test etmek için basit tahminler yapar.
 """
 
+import os
 import random
 import time
 from datetime import datetime
 import logging
 
+from history import PredictionHistory
+from metrics import ShardedCounter, ShardedStats
+from prediction_table import PredictionTable
+
 logger = logging.getLogger(__name__)
 
 
 class SimpleModel:
     """Basit test modeli"""
 
-    def __init__(self):
-        """Model'i başlat"""
-        self.model_version = "1.0.0"
+    def __init__(self, version="1.0.0", table_mode=None):
+        """Model'i başlat
+
+        Args:
+            version: Model versiyonu
+            table_mode: Tahmin tablosu modu ('off' veya 'exact'; varsayılan
+                PREDICTION_TABLE veya 'off')
+        """
+        self.model_version = version
         self.created_at = time.time()
-        self.prediction_count = 0
+        self._prediction_counter = ShardedCounter()
+        # Tahmin değerlerinin dağılımı (tahminler saklanmadan)
+        self._prediction_stats = ShardedStats(low=0.0, high=1.0)
+        # Son tahminler (pencere bazlı drift ve hız için)
+        self.history = PredictionHistory(
+            int(os.environ.get("PREDICTION_HISTORY_SIZE", 10000))
+        )
         self.last_prediction_time = None
         self.is_loaded = True
 
-        logger.info(f"Model initialized - Version: {self.model_version}")
+        # Tam sayı value'lar için tekil predict() tahmin tablosu;
+        # predict_batch analitik hesaplar
+        if table_mode is None:
+            table_mode = os.environ.get("PREDICTION_TABLE", "off")
+        if table_mode not in ("off", "exact"):
+            raise ValueError(f"Geçersiz tablo modu: {table_mode} (off, exact)")
+        self.table = (
+            PredictionTable(self._score_values) if table_mode == "exact" else None
+        )
+
+        logger.info("Model initialized - Version: %s", self.model_version)
 
     def predict(self, data):
         """Tahmin yap"""
@@ -32,32 +59,133 @@ class SimpleModel:
             # Gerçek uygulamada burada karmaşık ML modeli olacak
 
             # Input verilerine göre basit hesaplama
+            value = None
+            category = None
             if "value" in data:
                 value = float(data["value"])
 
-                # Basit sigmoid benzeri fonksiyon
-                prediction = 1 / (1 + abs(value - 50) / 50)
-                prediction = round(prediction, 4)
+                entry = self.table.lookup(value) if self.table is not None else None
+                if entry is not None:
+                    prediction, category = entry
+                else:
+                    prediction = round(self._score_values(value), 4)
             else:
                 # Random tahmin (demo amaçlı)
                 prediction = round(random.uniform(0, 1), 4)
 
             # İstatistikleri güncelle
-            self.prediction_count += 1
+            self._prediction_counter.add()
+            self._prediction_stats.update(prediction)
+            self.history.append(value, prediction)
             self.last_prediction_time = datetime.now().isoformat()
 
-            logger.info(f"Prediction: {prediction}, Count: {self.prediction_count}")
+            logger.info("Prediction: %s", prediction, extra={"sampled": True})
 
-            return {
+            result = {
                 "prediction": prediction,
                 "confidence": round(random.uniform(0.7, 0.95), 3),
                 "model_version": self.model_version,
             }
+            if category is not None:
+                result["category"] = category
+            return result
+
+        except Exception as e:
+            logger.error("Prediction error: %s", e)
+            raise e
+
+    def predict_batch(self, records):
+        """Kayıt listesi için tek seferde (vektörel) tahmin yap
+
+        Args:
+            records: Her biri predict() ile aynı formatta dict listesi
+
+        Returns:
+            predict() çıktısıyla aynı formatta dict listesi
+        """
+        # numpy ilk batch'te (veya warm_up'ta) yüklenir; tekil tahmin kullanmaz
+        import numpy as np
+
+        try:
+            count = len(records)
+            if count == 0:
+                return []
+
+            predictions, values = self._score_batch(records)
+            confidences = np.round(np.random.uniform(0.7, 0.95, count), 3)
+
+            # İstatistikleri güncelle
+            self._prediction_counter.add(count)
+            self._prediction_stats.update_many(predictions)
+            self.history.extend(values, predictions)
+            self.last_prediction_time = datetime.now().isoformat()
+
+            logger.info("Batch prediction: %d items", count)
+
+            return [
+                {
+                    "prediction": prediction,
+                    "confidence": confidence,
+                    "model_version": self.model_version,
+                }
+                for prediction, confidence in zip(
+                    predictions.tolist(), confidences.tolist()
+                )
+            ]
 
         except Exception as e:
-            logger.error(f"Prediction error: {e}")
+            logger.error("Batch prediction error: %s", e)
             raise e
 
+    @staticmethod
+    def _score_values(values):
+        """Basit sigmoid benzeri fonksiyon (float veya numpy dizisi, yuvarlanmadan)"""
+        return 1 / (1 + abs(values - 50) / 50)
+
+    @staticmethod
+    def _score_batch(records):
+        """Kayıtların vektörel tahminleri (istatistik güncellenmez)
+
+        Returns:
+            (tahminler, input value'ları) - 'value' olmayan kayıtlarda NaN
+        """
+        import numpy as np
+
+        values = np.fromiter(
+            (
+                float(record["value"]) if "value" in record else np.nan
+                for record in records
+            ),
+            dtype=np.float64,
+            count=len(records),
+        )
+
+        predictions = SimpleModel._score_values(values)
+        missing = np.isnan(values)
+        if missing.any():
+            # Random tahmin (demo amaçlı)
+            predictions[missing] = np.random.uniform(0, 1, int(missing.sum()))
+        return np.round(predictions, 4), values
+
+    def warm_up(self, iterations=1):
+        """Sentetik tahminlerle batch yolunu istatistiklere yazmadan çalıştır
+
+        numpy import'u ve ilk çağrı maliyeti ilk request'e kalmasın diye
+        başlangıçta arka planda (veya yeni versiyon yüklenirken) çağrılır.
+
+        Args:
+            iterations: Sentetik batch tahmini tekrar sayısı
+        """
+        records = [{"value": value} for value in range(0, 101, 10)] + [{}]
+        for _ in range(max(iterations, 1)):
+            self._score_batch(records)
+        self.history.window_stats(60)
+
+    @property
+    def prediction_count(self):
+        """Toplam tahmin sayısı (tüm thread'lerin toplamı)"""
+        return self._prediction_counter.value()
+
     def is_healthy(self):
         """Model sağlık durumunu kontrol et"""
         return self.is_loaded
@@ -66,6 +194,14 @@ class SimpleModel:
         """Toplam tahmin sayısını döndür"""
         return self.prediction_count
 
+    def get_prediction_stats(self):
+        """Tahmin değerlerinin dağılım özeti (mean, std, p50/p95/p99 vb.)"""
+        return self._prediction_stats.snapshot().summary()
+
+    def get_prediction_history(self):
+        """Son 1/5/15 dakikalık tahmin hızı, ortalaması ve kategori dağılımı"""
+        return self.history.summary()
+
     def get_uptime(self):
         """Model uptime'ını saniye cinsinden döndür"""
         return int(time.time() - self.created_at)
@@ -80,7 +216,9 @@ class SimpleModel:
 
     def reset_stats(self):
         """İstatistikleri sıfırla (test amaçlı)"""
-        self.prediction_count = 0
+        self._prediction_counter.reset()
+        self._prediction_stats.reset()
+        self.history.clear()
         self.last_prediction_time = None
         logger.info("Model stats reset")
 
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Tahmin Tablosu - CI/CD Örneği
+Tam sayı 'value' tahminlerini model yüklenirken önceden hesaplanmış bir
+tabloda tutar. 'value' 0-100 aralığıyla sınırlı (validate_input) olduğundan
+tablo 101 elemanlıdır; format_response kategorisi de tabloda saklanır.
+
+Tablo değerleri tekil analitik yol ile aynı fonksiyon ve yuvarlama ile
+hesaplanır, sonuçlar birebir aynıdır. Tam sayı olmayan ve aralık dışı
+value'lar analitik hesaplanır.
+
+Tablo sadece tekil predict() içindir: batch yolu (predict_batch) birkaç
+vektörel numpy işleminden ibaret olduğundan tablo araması orada daha yavaştır
+ve analitik hesap kullanılır.
+"""
+
+from typing import Callable, Dict, Optional, Tuple
+
+from utils import INPUT_RULES, prediction_category
+
+
+class PredictionTable:
+    """Tam sayı value'lar için önceden hesaplanmış tahmin ve kategori tablosu"""
+
+    def __init__(
+        self,
+        score: Callable[[float], float],
+        low: Optional[float] = None,
+        high: Optional[float] = None,
+    ):
+        """
+        Args:
+            score: Yuvarlanmamış tahmini hesaplayan fonksiyon
+            low, high: Tablo aralığı (varsayılan INPUT_RULES 'value' sınırları)
+        """
+        self.low = float(INPUT_RULES["value"]["min"] if low is None else low)
+        self.high = float(INPUT_RULES["value"]["max"] if high is None else high)
+        # value (float) -> (tahmin, kategori); tek dict araması, bulunamayan
+        # value'lar (tam sayı olmayan, aralık dışı, NaN) için de ucuz
+        self._entries: Dict[float, Tuple[float, str]] = {}
+        for index in range(int(self.high - self.low) + 1):
+            value = self.low + index
+            prediction = round(score(value), 4)
+            self._entries[value] = (prediction, prediction_category(prediction))
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def lookup(self, value: float) -> Optional[Tuple[float, str]]:
+        """
+        Tekil value için (tahmin, kategori)
+
+        Returns:
+            Tablo dışındaki (aralık dışı veya tam sayı olmayan) value'lar için
+            None
+        """
+        return self._entries.get(value)
+
+    def describe(self):
+        """Tablo ayarları"""
+        return {"mode": "exact", "size": len(self), "range": [self.low, self.high]}
@@ -0,0 +1,444 @@
+#!/usr/bin/env python3
+"""
+Model Registry - CI/CD Örneği
+Birden fazla model versiyonunu yükler ve aktif modeli process'i yeniden
+başlatmadan değiştirir.
+
+Aktif model tek bir referanstır; request'ler onu kilitsiz okur. Değişimde
+referans atomik olarak yenisine çevrilir ve eski modelde işlemde olan
+request'lerin bitmesi beklenir (drain).
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from metrics import ShardedCounter
+from model import SimpleModel
+
+logger = logging.getLogger(__name__)
+
+
+class _Entry:
+    """Yüklü model ve üzerindeki işlemdeki request sayısı"""
+
+    __slots__ = ("version", "model", "in_flight", "loaded_at")
+
+    def __init__(self, version: str, model: Any):
+        self.version = version
+        self.model = model
+        self.in_flight = ShardedCounter()
+        self.loaded_at = time.time()
+
+
+class ModelRegistry:
+    """
+    Model versiyonlarını tutan ve aktif modeli atomik değiştiren registry
+
+    Request'ler modeli acquire() ile alır; bu sayede değişimden sonra eski
+    modelde işlemdeki request'ler takip edilip beklenebilir. Yükleme ve
+    değiştirme işlemleri (admin yolu) kendi aralarında kilitlidir, request
+    yolu kilit almaz.
+    """
+
+    def __init__(
+        self,
+        loader: Optional[Callable[[str], Any]] = None,
+        drain_timeout: Optional[float] = None,
+    ):
+        self.loader = loader or (lambda version: SimpleModel(version=version))
+        self.drain_timeout = (
+            float(os.environ.get("MODEL_DRAIN_TIMEOUT", 30.0))
+            if drain_timeout is None
+            else drain_timeout
+        )
+        self._entries: Dict[str, _Entry] = {}
+        self._active: Optional[_Entry] = None
+        self._admin_lock = threading.RLock()
+        self._listeners: List[Callable[[Any, Any], None]] = []
+
+    @property
+    def active(self) -> Any:
+        """Aktif model (kilitsiz okuma)"""
+        entry = self._active
+        if entry is None:
+            raise RuntimeError("Aktif model yok")
+        return entry.model
+
+    @property
+    def active_version(self) -> Optional[str]:
+        """Aktif model versiyonu"""
+        entry = self._active
+        return entry.version if entry is not None else None
+
+    @contextmanager
+    def acquire(self, version: Optional[str] = None) -> Iterator[Any]:
+        """
+        Modeli request süresince kullanmak için al
+
+        version verilmezse aktif model alınır. Sayaç artırıldıktan sonra
+        model hâlâ aktif/yüklü değilse (araya değişim girdiyse) tekrar
+        denenir; böylece drain modeli kullanan hiçbir request'i kaçırmaz.
+
+        Raises:
+            RuntimeError: Aktif model yoksa
+            KeyError: Verilen versiyon yüklü değilse
+        """
+        while True:
+            entry = self._lookup(version)
+            entry.in_flight.add(1)
+            try:
+                current = self._lookup(version)
+            except KeyError:
+                entry.in_flight.add(-1)
+                raise
+            if entry is current:
+                break
+            entry.in_flight.add(-1)
+        try:
+            yield entry.model
+        finally:
+            entry.in_flight.add(-1)
+
+    def _lookup(self, version: Optional[str]) -> _Entry:
+        if version is None:
+            entry = self._active
+            if entry is None:
+                raise RuntimeError("Aktif model yok")
+            return entry
+        entry = self._entries.get(version)
+        if entry is None:
+            raise KeyError(f"Model yüklü değil: {version}")
+        return entry
+
+    def add_listener(self, callback: Callable[[Any, Any], None]):
+        """Model değişiminden (drain sonrası) sonra çağrılacak fonksiyon ekle"""
+        self._listeners.append(callback)
+
+    def load(self, version: str, warm_up: bool = True) -> Any:
+        """
+        Versiyonu yükle (zaten yüklüyse mevcut modeli döndür)
+
+        warm_up True ise model (warm_up metodu varsa) registry'ye eklenmeden
+        önce ısıtılır; böylece değişimden sonraki ilk request soğuk modele
+        düşmez. Uygulama başlangıcında bu iş ModelWarmup'a bırakılır.
+        """
+        with self._admin_lock:
+            entry = self._entries.get(version)
+            if entry is None:
+                start = time.perf_counter()
+                model = self.loader(version)
+                if warm_up and hasattr(model, "warm_up"):
+                    model.warm_up()
+                entry = _Entry(version, model)
+                self._entries[version] = entry
+                logger.info(
+                    "Model loaded: %s (%.1fms)",
+                    version,
+                    (time.perf_counter() - start) * 1000,
+                )
+            return entry.model
+
+    def activate(
+        self,
+        version: str,
+        drain_timeout: Optional[float] = None,
+        warm_up: bool = True,
+    ):
+        """
+        Versiyonu aktif model yap (yüklü değilse önce yükler)
+
+        Eski modelde işlemdeki request'ler drain_timeout saniyeye kadar
+        beklenir; ardından listener'lar çağrılır. warm_up load()'a iletilir.
+
+        Returns:
+            {'active', 'previous', 'drained', 'drain_seconds'}
+        """
+        with self._admin_lock:
+            self.load(version, warm_up)
+            entry = self._entries[version]
+            previous = self._active
+            self._active = entry
+
+            drained, drain_seconds = True, 0.0
+            if previous is not None and previous is not entry:
+                drained, drain_seconds = self._drain(previous, drain_timeout)
+                for callback in self._listeners:
+                    try:
+                        callback(previous.model, entry.model)
+                    except Exception as e:
+                        logger.error("Model swap listener failed: %s", e)
+                logger.info(
+                    "Active model: %s -> %s (drained: %s, %.3fs)",
+                    previous.version,
+                    version,
+                    drained,
+                    drain_seconds,
+                )
+            return {
+                "active": version,
+                "previous": previous.version if previous is not None else None,
+                "drained": drained,
+                "drain_seconds": round(drain_seconds, 3),
+            }
+
+    def _drain(self, entry: _Entry, timeout: Optional[float]):
+        """Modeldeki işlemdeki request'lerin bitmesini bekle"""
+        timeout = self.drain_timeout if timeout is None else timeout
+        start = time.monotonic()
+        while entry.in_flight.value() > 0:
+            if time.monotonic() - start >= timeout:
+                logger.warning(
+                    "Drain timeout for model %s (%d in flight)",
+                    entry.version,
+                    entry.in_flight.value(),
+                )
+                return False, time.monotonic() - start
+            time.sleep(0.005)
+        return True, time.monotonic() - start
+
+    def unload(self, version: str, drain_timeout: Optional[float] = None) -> bool:
+        """
+        Aktif olmayan versiyonu registry'den çıkar
+
+        Returns:
+            Versiyon drain edilip çıkarıldıysa True
+
+        Raises:
+            ValueError: Aktif versiyon çıkarılmak istenirse
+        """
+        with self._admin_lock:
+            entry = self._entries.get(version)
+            if entry is None:
+                return False
+            if entry is self._active:
+                raise ValueError("Aktif model çıkarılamaz")
+            drained, _ = self._drain(entry, drain_timeout)
+            if drained:
+                del self._entries[version]
+                logger.info("Model unloaded: %s", version)
+            return drained
+
+    def versions(self) -> List[Dict[str, Any]]:
+        """Yüklü versiyonlar ve durumları"""
+        active = self._active
+        return [
+            {
+                "version": entry.version,
+                "active": entry is active,
+                "in_flight": entry.in_flight.value(),
+                "loaded_at": entry.loaded_at,
+            }
+            for entry in list(self._entries.values())
+        ]
+
+
+class ActiveModel:
+    """
+    Her erişimde registry'nin aktif modeline yönlendiren vekil
+
+    Sağlık kontrolü ve metrik okuma gibi drain gerektirmeyen yerler için;
+    tahmin yapan request'ler ModelRegistry.acquire() kullanır.
+    """
+
+    __slots__ = ("_registry",)
+
+    def __init__(self, registry: ModelRegistry):
+        self._registry = registry
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._registry.active, name)
+
+
+class ModelWarmup:
+    """
+    Aktif modeli ve ek adımları arka planda ısıtır, hazır olma durumunu tutar
+
+    Başlangıçta model ısıtılmadan yüklenir (import süresi kısa kalır);
+    ısıtma ilk request'i bekletmeden bu sınıfla yapılır ve readiness
+    is_ready() ile bu işe bağlanır. Önce model sentetik tahminlerle
+    (iterations kez) ısıtılır, ardından add_step() ile eklenen adımlar
+    (bağlantı havuzu, cache vb.) sırayla çalışır. Bir adım hata verirse
+    model hazır sayılmaz.
+    """
+
+    def __init__(self, registry: ModelRegistry, iterations: Optional[int] = None):
+        self.registry = registry
+        self.iterations = (
+            int(os.environ.get("WARMUP_ITERATIONS", 3))
+            if iterations is None
+            else iterations
+        )
+        self.duration: Optional[float] = None
+        self.error: Optional[str] = None
+        self.step_durations: Dict[str, float] = {}
+        self._steps: List[Tuple[str, Callable[[], Any]]] = []
+        self._ready = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def add_step(self, name: str, callback: Callable[[], Any]):
+        """Model ısıtmasından sonra çalışacak adım ekle"""
+        self._steps.append((name, callback))
+
+    def _warm_up_model(self):
+        model = self.registry.active
+        if self.iterations > 0 and hasattr(model, "warm_up"):
+            model.warm_up(self.iterations)
+
+    def run(self) -> bool:
+        """Isıtmayı şimdi çalıştır; başarılıysa True"""
+        start = time.perf_counter()
+        durations: Dict[str, float] = {}
+        for name, callback in [("model", self._warm_up_model), *self._steps]:
+            step_start = time.perf_counter()
+            try:
+                callback()
+            except Exception as e:
+                self.error = f"{name}: {e}"
+                logger.error("Warm-up step failed (%s): %s", name, e)
+                return False
+            durations[name] = time.perf_counter() - step_start
+        self.duration = time.perf_counter() - start
+        self.step_durations = durations
+        self.error = None
+        self._ready.set()
+        logger.info(
+            "Model warmed up: %s (%.1fms)",
+            self.registry.active_version,
+            self.duration * 1000,
+        )
+        return True
+
+    def start(self):
+        """Isıtmayı arka plan thread'inde başlat (hazırsa bir şey yapmaz)"""
+        if self.is_ready() or self.is_running():
+            return
+        self._thread = threading.Thread(
+            target=self.run, name="model-warmup", daemon=True
+        )
+        self._thread.start()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Isıtma bitene kadar bekle; hazırsa True"""
+        return self._ready.wait(timeout)
+
+    def is_ready(self) -> bool:
+        """Isıtma tamamlandı mı"""
+        return self._ready.is_set()
+
+    def is_running(self) -> bool:
+        """Isıtma thread'i çalışıyor mu"""
+        return self._thread is not None and self._thread.is_alive()
+
+    def reset(self):
+        """Hazır durumunu sıfırla (test amaçlı)"""
+        self._ready.clear()
+        self.duration = None
+        self.error = None
+        self.step_durations = {}
+
+    def status(self) -> Dict[str, Any]:
+        """{'ready', 'duration_ms', 'steps', 'error'}"""
+        return {
+            "ready": self.is_ready(),
+            "duration_ms": (
+                round(self.duration * 1000, 2) if self.duration is not None else None
+            ),
+            "steps": {
+                name: round(duration * 1000, 2)
+                for name, duration in self.step_durations.items()
+            },
+            "error": self.error,
+        }
+
+
+def read_model_version(path: str) -> Optional[str]:
+    """
+    Model konfigürasyon dosyasından versiyonu oku
+
+    Dosya {"version": "..."} formatında JSON veya sadece versiyon metni
+    olabilir.
+    """
+    with open(path, encoding="utf-8") as f:
+        content = f.read().strip()
+    if not content:
+        return None
+    if content.startswith("{"):
+        return json.loads(content).get("version")
+    return content
+
+
+class ModelFileWatcher:
+    """
+    Konfigürasyon dosyasını izleyip değiştiğinde aktif modeli değiştirir
+
+    Admin endpoint'i sadece isteği alan worker'ı etkiler; gunicorn gibi çok
+    process'li kurulumlarda tüm worker'lar bu dosyayı izleyerek aynı
+    versiyona geçer.
+    """
+
+    def __init__(
+        self, registry: ModelRegistry, path: str, interval: Optional[float] = None
+    ):
+        self.registry = registry
+        self.path = path
+        self.interval = (
+            float(os.environ.get("MODEL_WATCH_INTERVAL", 5.0))
+            if interval is None
+            else interval
+        )
+        self._mtime: Optional[float] = None
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def check(self) -> bool:
+        """Dosya değiştiyse yeni versiyona geç; geçiş yapıldıysa True"""
+        try:
+            mtime = os.stat(self.path).st_mtime
+        except FileNotFoundError:
+            return False
+        if mtime == self._mtime:
+            return False
+        self._mtime = mtime
+
+        version = read_model_version(self.path)
+        if not version or version == self.registry.active_version:
+            return False
+        self.registry.activate(version)
+        return True
+
+    def _run(self):
+        while not self._stop_event.is_set():
+            try:
+                self.check()
+            except Exception as e:
+                logger.error("Model watch failed: %s", e)
+            self._stop_event.wait(self.interval)
+
+    def start(self):
+        """İzleme thread'ini başlat"""
+        if self.is_running():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="model-watcher", daemon=True
+        )
+        self._thread.start()
+        logger.info(
+            "Model watcher started: %s (interval: %ss)", self.path, self.interval
+        )
+
+    def stop(self, timeout: Optional[float] = None):
+        """İzleme thread'ini durdur"""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def is_running(self) -> bool:
+        """İzleme thread'i çalışıyor mu"""
+        return self._thread is not None and self._thread.is_alive()
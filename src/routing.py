@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+Canary ve Shadow Trafik Yönlendirme - CI/CD Örneği
+Trafiğin bir yüzdesini aday (candidate) model versiyonuna yönlendirir ve
+istenirse kalan trafiği arka planda aday modelle de skorlayıp (shadow)
+aktif modelle arasındaki farkı ölçer. Shadow skorlama birincil response'a
+gecikme eklemez.
+"""
+
+import logging
+import os
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack, contextmanager
+from typing import Any, Dict, Iterator, NamedTuple, Optional, Tuple
+
+from metrics import REGISTRY, Counter, Histogram, ShardedStats
+from registry import ModelRegistry
+
+logger = logging.getLogger(__name__)
+
+MODEL_LATENCY = REGISTRY.register(
+    Histogram(
+        "model_prediction_latency_seconds",
+        "Model versiyonu ve rolü (primary/canary/shadow) bazında tahmin süresi",
+        ("version", "role"),
+    )
+)
+SHADOW_DIVERGENCE = REGISTRY.register(
+    Histogram(
+        "shadow_prediction_divergence",
+        "Aday model ile aktif model tahminleri arasındaki mutlak fark",
+        ("version",),
+        buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0),
+    )
+)
+SHADOW_PREDICTIONS = REGISTRY.register(
+    Counter(
+        "shadow_predictions_total",
+        "Sonuç bazında shadow tahmin sayısı (scored/dropped/error)",
+        ("version", "outcome"),
+    )
+)
+
+
+class RoutingConfig(NamedTuple):
+    """Yönlendirme ayarı (tek referans olarak atomik değişir)"""
+
+    candidate: Optional[str] = None
+    canary_percent: float = 0.0
+    shadow: bool = False
+
+
+class TrafficRouter:
+    """
+    İstekleri aktif model ile aday model arasında dağıtır
+
+    Ayar değişimi registry'deki gibi referans değişimidir; request yolu
+    kilit almaz. Shadow kuyruğu max_pending ile sınırlıdır, dolduğunda
+    shadow tahmini atlanır (birincil response beklemez).
+    """
+
+    def __init__(
+        self,
+        registry: ModelRegistry,
+        workers: Optional[int] = None,
+        max_pending: Optional[int] = None,
+    ):
+        self.registry = registry
+        self.workers = workers or int(os.environ.get("SHADOW_WORKERS", 2))
+        self.max_pending = max_pending or int(
+            os.environ.get("SHADOW_MAX_PENDING", 1000)
+        )
+        self._config = RoutingConfig()
+        self._pending = threading.BoundedSemaphore(self.max_pending)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+        self._divergence: Dict[str, ShardedStats] = {}
+
+    @property
+    def config(self) -> RoutingConfig:
+        """Geçerli yönlendirme ayarı"""
+        return self._config
+
+    def configure(
+        self,
+        candidate: Optional[str] = None,
+        canary_percent: float = 0.0,
+        shadow: bool = False,
+    ) -> RoutingConfig:
+        """
+        Yönlendirmeyi ayarla; aday versiyon yüklü değilse önce yüklenir
+
+        candidate None ise tüm trafik aktif modele gider.
+
+        Raises:
+            ValueError: canary_percent 0-100 dışındaysa
+        """
+        if not 0 <= canary_percent <= 100:
+            raise ValueError("canary_percent 0-100 arasında olmalı")
+        if candidate is not None:
+            self.registry.load(candidate)
+            self._divergence.setdefault(candidate, ShardedStats(0.0, 1.0))
+            config = RoutingConfig(candidate, float(canary_percent), bool(shadow))
+        else:
+            config = RoutingConfig()
+        self._config = config
+        logger.info(
+            "Routing: candidate=%s canary=%s%% shadow=%s",
+            config.candidate,
+            config.canary_percent,
+            config.shadow,
+        )
+        return config
+
+    @contextmanager
+    def route(self) -> Iterator[Tuple[Any, str]]:
+        """
+        İstek için model seç ve request süresince al
+
+        Yields:
+            (model, rol) - rol 'primary' veya 'canary'
+        """
+        config = self._config
+        with ExitStack() as stack:
+            model, role = None, "primary"
+            if (
+                config.candidate is not None
+                and config.canary_percent > 0
+                and random.random() * 100 < config.canary_percent
+            ):
+                try:
+                    model = stack.enter_context(self.registry.acquire(config.candidate))
+                    role = "canary"
+                except KeyError:
+                    # Aday model bu arada çıkarıldıysa aktif modele düş
+                    pass
+            if model is None:
+                model = stack.enter_context(self.registry.acquire())
+            yield model, role
+
+    def observe(
+        self,
+        model: Any,
+        role: str,
+        latency: float,
+        data: Dict[str, Any],
+        prediction: Dict[str, Any],
+    ):
+        """
+        Tahmin süresini kaydet; shadow açıksa aday modelle arka planda skorla
+        """
+        version = model.get_version()
+        MODEL_LATENCY.labels(version, role).observe(latency)
+
+        config = self._config
+        if (
+            role != "primary"
+            or not config.shadow
+            or config.candidate is None
+            or config.candidate == version
+        ):
+            return
+        if not self._pending.acquire(blocking=False):
+            SHADOW_PREDICTIONS.labels(config.candidate, "dropped").add()
+            return
+        try:
+            self._get_executor().submit(
+                self._shadow_predict, config.candidate, data, prediction["prediction"]
+            )
+        except RuntimeError:
+            # Executor kapatıldıysa
+            self._pending.release()
+            SHADOW_PREDICTIONS.labels(config.candidate, "dropped").add()
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        executor = self._executor
+        if executor is None:
+            with self._executor_lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.workers, thread_name_prefix="shadow"
+                    )
+                executor = self._executor
+        return executor
+
+    def _shadow_predict(self, version: str, data: Dict[str, Any], primary: float):
+        try:
+            with self.registry.acquire(version) as model:
+                start = time.perf_counter()
+                prediction = model.predict(data)["prediction"]
+                latency = time.perf_counter() - start
+            MODEL_LATENCY.labels(version, "shadow").observe(latency)
+            divergence = abs(prediction - primary)
+            SHADOW_DIVERGENCE.labels(version).observe(divergence)
+            stats = self._divergence.get(version)
+            if stats is not None:
+                stats.update(divergence)
+            SHADOW_PREDICTIONS.labels(version, "scored").add()
+        except Exception as e:
+            logger.warning("Shadow prediction failed (%s): %s", version, e)
+            SHADOW_PREDICTIONS.labels(version, "error").add()
+        finally:
+            self._pending.release()
+
+    def describe(self) -> Dict[str, Any]:
+        """Ayar ve aday versiyonlar için shadow sonuçları"""
+        config = self._config
+        return {
+            "active": self.registry.active_version,
+            "candidate": config.candidate,
+            "canary_percent": config.canary_percent,
+            "shadow": config.shadow,
+            "shadow_results": {
+                version: {
+                    "scored": SHADOW_PREDICTIONS.value(version, "scored"),
+                    "dropped": SHADOW_PREDICTIONS.value(version, "dropped"),
+                    "errors": SHADOW_PREDICTIONS.value(version, "error"),
+                    "divergence": stats.snapshot().summary(),
+                }
+                for version, stats in list(self._divergence.items())
+            },
+        }
+
+    def shutdown(self, wait: bool = True):
+        """Shadow executor'ünü kapat (kuyruktaki işler beklenir)"""
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Production Sunucu - CI/CD Örneği
+Flask uygulamasını gunicorn ile çok process'li ve çok thread'li çalıştırır.
+
+Kullanım:
+    python -m src.serve        (WORKDIR proje kökü iken)
+    python src/serve.py
+
+Ayarlar env değişkenleri ile yapılır:
+    HOST, PORT                  Dinlenen adres (0.0.0.0:5000)
+    SERVER_WORKERS              Worker process sayısı (CPU sayısı)
+    SERVER_THREADS              Worker başına thread sayısı (4)
+    SERVER_KEEPALIVE            Keep-alive süresi, saniye (5)
+    SERVER_BACKLOG              Bekleyen bağlantı kuyruğu (2048)
+    SERVER_TIMEOUT              Worker timeout, saniye (30)
+    SERVER_GRACEFUL_TIMEOUT     Kapanışta bekleme süresi, saniye (30)
+"""
+
+import logging
+import os
+import sys
+from typing import Any, Dict, Mapping, Optional
+
+# "python -m src.serve" ile çalıştırıldığında da src modülleri bulunsun
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from logging_setup import configure_logging  # noqa: E402
+
+logger = logging.getLogger(__name__)
+
+
+def _int_env(environ: Mapping[str, str], name: str, default: int) -> int:
+    """Pozitif tam sayı env değişkeni oku"""
+    value = int(environ.get(name, default))
+    if value < 1:
+        raise ValueError(f"{name} en az 1 olmalı")
+    return value
+
+
+def build_config(environ: Optional[Mapping[str, str]] = None) -> Dict[str, Any]:
+    """
+    Env değişkenlerinden gunicorn ayarlarını oluşturur
+
+    Args:
+        environ: Env değişkenleri (varsayılan os.environ)
+
+    Returns:
+        gunicorn ayar dictionary'si
+    """
+    environ = os.environ if environ is None else environ
+
+    host = environ.get("HOST", "0.0.0.0")
+    port = _int_env(environ, "PORT", 5000)
+    threads = _int_env(environ, "SERVER_THREADS", 4)
+
+    return {
+        "bind": f"{host}:{port}",
+        "workers": _int_env(environ, "SERVER_WORKERS", os.cpu_count() or 1),
+        "threads": threads,
+        "worker_class": "gthread" if threads > 1 else "sync",
+        "keepalive": _int_env(environ, "SERVER_KEEPALIVE", 5),
+        "backlog": _int_env(environ, "SERVER_BACKLOG", 2048),
+        "timeout": _int_env(environ, "SERVER_TIMEOUT", 30),
+        "graceful_timeout": _int_env(environ, "SERVER_GRACEFUL_TIMEOUT", 30),
+        # Model fork'tan önce master process'te yüklenir (copy-on-write)
+        "preload_app": True,
+        "accesslog": None,
+        "errorlog": "-",
+        "loglevel": environ.get("LOG_LEVEL", "info").lower(),
+    }
+
+
+def on_starting(server):
+    """Master process başlarken"""
+    logger.info("Starting production server")
+
+
+def pre_fork(server, worker):
+    """Worker fork edilmeden önce (master process)"""
+    # Paylaşımlı metrik slot'u master'da atanır; worker'lar aynı slot için yarışmaz
+    from app import shared_metrics
+
+    worker.metrics_slot = shared_metrics.reserve_slot()
+    if worker.metrics_slot is None:
+        logger.warning("No free shared metrics slot for new worker")
+
+
+def post_fork(server, worker):
+    """Worker fork edildikten sonra"""
+    # Thread'ler fork'tan sonra kopyalanmaz; her worker kendi monitor'ünü başlatır
+    from app import health_monitor, model_warmup, model_watcher, shared_metrics
+
+    if worker.metrics_slot is not None:
+        shared_metrics.attach(worker.metrics_slot)
+
+    # Master'da ısıtma bittiyse durum fork ile gelir; bitmediyse worker ısıtır
+    model_warmup.start()
+    health_monitor.start()
+    if model_watcher is not None:
+        model_watcher.start()
+    logger.info("Worker started (pid: %s)", worker.pid)
+
+
+def worker_exit(server, worker):
+    """Worker kapanırken (graceful shutdown dahil)"""
+    logger.info("Worker exiting (pid: %s)", worker.pid)
+
+
+def child_exit(server, worker):
+    """Worker çıktıktan sonra (master process, crash dahil)"""
+    # Çıkan worker'ın sayaçları container toplamında kalır, slot boşalır
+    from app import shared_metrics
+
+    slot = getattr(worker, "metrics_slot", None)
+    if slot is not None:
+        shared_metrics.retire(slot, worker.pid)
+
+
+def on_exit(server):
+    """Master process kapanırken"""
+    logger.info("Production server stopped")
+
+
+SERVER_HOOKS = {
+    "on_starting": on_starting,
+    "pre_fork": pre_fork,
+    "post_fork": post_fork,
+    "worker_exit": worker_exit,
+    "child_exit": child_exit,
+    "on_exit": on_exit,
+}
+
+
+def load_application():
+    """Flask uygulamasını (ve model'i) yükle"""
+    from app import app, model_warmup, shared_metrics
+
+    # preload_app ile master'da çalışır: model fork'tan önce ısıtılır, worker'lar
+    # yüklenmiş modülleri (numpy vb.) copy-on-write paylaşır
+    model_warmup.run()
+    # Master istek karşılamaz; paylaşımlı metrik slot'unu worker'lara bırakır
+    shared_metrics.detach()
+    return app
+
+
+def main():
+    """Ana fonksiyon"""
+    from gunicorn.app.base import BaseApplication
+
+    class ProductionApplication(BaseApplication):
+        """Gömülü gunicorn uygulaması"""
+
+        def __init__(self, options):
+            self.options = options
+            super().__init__()
+
+        def load_config(self):
+            for key, value in self.options.items():
+                self.cfg.set(key, value)
+
+        def load(self):
+            return load_application()
+
+    config = build_config()
+    config.update(SERVER_HOOKS)
+
+    configure_logging()
+    logger.info(
+        "Serving on %s with %s workers x %s threads",
+        config["bind"],
+        config["workers"],
+        config["threads"],
+    )
+
+    ProductionApplication(config).run()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,570 @@
+#!/usr/bin/env python3
+"""
+Paylaşımlı Bellek Metrikleri - CI/CD Örneği
+Çok process'li sunucuda (gunicorn) tüm worker'ların yazdığı, sabit
+düzenli sayaç ve histogram bucket'larını paylaşımlı bellekte tutar.
+/metrics hangi worker'a düşerse düşsün container'ın toplamını okur.
+
+Bellek düzeni (float64 dizisi, worker başına bir slot):
+    slot: [pid, başlangıç zamanı, değer_0, ..., değer_n]
+    slot 0: çıkan worker'ların toplandığı slot; başlığında çıkan worker
+    sayısı ve okuyucular için sıra numarası (seqlock) tutulur.
+
+Etiketli Prometheus metrikleri (families) için her slot'ta aile başına
+sabit sayıda seri yeri ve seri sayısı bulunur; seri anahtarları (label
+değerleri) ayrı bir paylaşımlı bellekte slot bazında tutulur. Okurken
+seriler anahtara göre toplanır.
+
+Her worker sadece kendi slot'una yazar (IPC yok). Slot'lar master
+process'te fork'tan önce atanır (pre_fork) ve worker çıkınca sayaç ve
+histogramları slot 0'a aktarılarak boşaltılır (child_exit); böylece
+container toplamları worker yeniden başlasa da azalmaz.
+"""
+
+import json
+import logging
+import mmap
+import os
+import threading
+import time
+import weakref
+from bisect import bisect_left
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+_HEADER = 2
+_PID, _STARTED_AT = 0, 1
+# Slot 0 başlığı
+_RETIRED_WORKERS, _SEQUENCE = 0, 1
+# Etiketli seri anahtarı (label değerlerinin JSON'u) için ayrılan byte
+_KEY_BYTES = 128
+
+
+def _pid_alive(pid: int) -> bool:
+    """Process hâlâ var mı"""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class SharedCounter:
+    """
+    Paylaşımlı sayaç/gauge için tutamaç (ShardedCounter ile aynı arayüz)
+
+    Değerler float64 tutulur; tam sayı artışlar 2**53'e kadar kesindir.
+    """
+
+    __slots__ = ("_store", "_offset")
+
+    def __init__(self, store: "SharedMetrics", offset: int):
+        self._store = store
+        self._offset = offset
+
+    def add(self, amount=1):
+        """Bu worker'ın değerini artır"""
+        self._store._add(self._offset, amount)
+
+    def value(self):
+        """Tüm worker'ların toplamı"""
+        return int(self._store._read(self._offset, 1)[0])
+
+
+class SharedHistogram:
+    """Paylaşımlı histogram için tutamaç (ShardedHistogram ile aynı arayüz)"""
+
+    __slots__ = ("_store", "_offset", "buckets")
+
+    def __init__(self, store: "SharedMetrics", offset: int, buckets: Sequence[float]):
+        self._store = store
+        self._offset = offset
+        self.buckets = tuple(buckets)
+
+    def observe(self, value: float):
+        """Bu worker'ın histogramına gözlem ekle"""
+        self._store._observe(
+            self._offset, bisect_left(self.buckets, value), len(self.buckets), value
+        )
+
+    def snapshot(self) -> Dict[str, object]:
+        """Tüm worker'ların bucket sayıları (kümülatif olmayan), toplam ve adet"""
+        total = self._store._read(self._offset, len(self.buckets) + 2)
+        counts = [int(count) for count in total[:-1]]
+        return {"counts": counts, "sum": total[-1], "count": sum(counts)}
+
+
+class _Family:
+    """Etiketli metrik ailesinin slot içindeki yeri"""
+
+    __slots__ = ("name", "index", "offset", "width", "buckets", "gauge")
+
+    def __init__(self, metric: Any, index: int, offset: int):
+        self.name = metric.name
+        self.index = index
+        self.offset = offset
+        buckets = getattr(metric, "buckets", None)
+        self.buckets = tuple(buckets) if buckets is not None else None
+        # Sayaç/gauge: [değer]; histogram: [bucket_0, ..., +Inf, sum]
+        self.width = 1 if self.buckets is None else len(self.buckets) + 2
+        self.gauge = metric.metric_type == "gauge"
+
+
+class _SeriesTotal:
+    """Serinin tüm worker'lardaki toplamı (Counter/Histogram alt metrik okuması)"""
+
+    __slots__ = ("_total",)
+
+    def __init__(self, total: List[float]):
+        self._total = total
+
+    def value(self):
+        value = self._total[0]
+        return int(value) if value.is_integer() else value
+
+    def snapshot(self) -> Dict[str, object]:
+        counts = [int(count) for count in self._total[:-1]]
+        return {"counts": counts, "sum": self._total[-1], "count": sum(counts)}
+
+
+class SharedSeries:
+    """
+    Etiketli metrik serisi için tutamaç (ShardedCounter/ShardedHistogram ile
+    aynı arayüz); metrics.Counter/Gauge/Histogram alt metriği olarak kullanılır
+    """
+
+    __slots__ = ("_store", "_family", "key")
+
+    def __init__(self, store: "SharedMetrics", family: _Family, key: Tuple[str, ...]):
+        self._store = store
+        self._family = family
+        self.key = key
+
+    def add(self, amount=1):
+        """Bu worker'ın değerini artır"""
+        self._store._series_add(self._family, self.key, 0, amount)
+
+    def observe(self, value: float):
+        """Bu worker'ın histogramına gözlem ekle"""
+        family = self._family
+        self._store._series_add(
+            family, self.key, bisect_left(family.buckets, value), 1, value
+        )
+
+    def value(self):
+        """Tüm worker'ların toplamı"""
+        return _SeriesTotal(self._store._series_total(self._family, self.key)).value()
+
+    def snapshot(self) -> Dict[str, object]:
+        """Tüm worker'ların bucket sayıları (kümülatif olmayan), toplam ve adet"""
+        total = self._store._series_total(self._family, self.key)
+        return _SeriesTotal(total).snapshot()
+
+    def reset(self):
+        """Seriyi tüm slot'larda sıfırla (test amaçlı)"""
+        self._store._series_reset(self._family, self.key)
+
+
+class SharedMetrics:
+    """
+    Worker slot'ları paylaşımlı bellekte olan metrik deposu
+
+    Bellek anonim ve paylaşımlı bir mmap'tir; fork ile worker'lara geçer
+    (gunicorn preload_app). Yazma sadece process'in kendi slot'unadır;
+    aynı worker'daki thread'ler için kısa süreli, process'e özel bir kilit
+    alınır. Slot'a bağlanmamış process'in yazdıkları yok sayılır.
+
+    Sayaç ve histogramlar worker çıkınca toplamda kalır; gauge'lar sadece
+    yaşayan worker'ların toplamıdır.
+
+    families ile verilen metrics.Counter/Gauge/Histogram metriklerinin
+    alt metrikleri (label bazında seriler) bu depoda tutulur. Worker başına
+    aile başına en fazla max_series seri yazılır; aşan seriler yok sayılır.
+    """
+
+    def __init__(
+        self,
+        counters: Sequence[str] = (),
+        gauges: Sequence[str] = (),
+        histograms: Optional[Dict[str, Sequence[float]]] = None,
+        slots: Optional[int] = None,
+        families: Sequence[Any] = (),
+        max_series: Optional[int] = None,
+    ):
+        self.slots = (
+            int(os.environ.get("METRICS_SHM_SLOTS", 64)) if slots is None else slots
+        )
+        if self.slots < 2:
+            raise ValueError("slots en az 2 olmalı")
+        self.max_series = (
+            int(os.environ.get("METRICS_SHM_MAX_SERIES", 64))
+            if max_series is None
+            else max_series
+        )
+        if self.max_series < 1:
+            raise ValueError("max_series en az 1 olmalı")
+
+        self._offsets: Dict[str, int] = {}
+        self._histogram_buckets: Dict[str, tuple] = {}
+        offset = _HEADER
+        for name in (*counters, *gauges):
+            self._offsets[name] = offset
+            offset += 1
+        for name, buckets in (histograms or {}).items():
+            self._offsets[name] = offset
+            self._histogram_buckets[name] = tuple(sorted(buckets))
+            offset += len(buckets) + 2
+        self._plain_size = offset
+        self._gauge_offsets = {self._offsets[name] for name in gauges}
+
+        self._families: Dict[str, _Family] = {}
+        for index, metric in enumerate(families):
+            family = self._families[metric.name] = _Family(metric, index, offset)
+            offset += self.max_series * family.width
+        # Slot sonunda aile başına yazılmış seri sayısı
+        self._count_offset = offset
+        self._slot_size = offset + len(self._families)
+
+        self._buffer = mmap.mmap(-1, self.slots * self._slot_size * 8)
+        self._values = memoryview(self._buffer).cast("d")
+        self._keys = mmap.mmap(
+            -1, max(1, self.slots * len(self._families) * self.max_series * _KEY_BYTES)
+        )
+        self._decoded_keys: Dict[bytes, Tuple[str, ...]] = {}
+        self.created_at = time.time()
+        self._slot: Optional[int] = None
+        self._base: Optional[int] = None
+        self._lock = threading.Lock()
+        # Bu process'in slot'undaki seri index'leri ((aile, anahtar) -> index)
+        self._series_indexes: Dict[Tuple[int, Tuple[str, ...]], int] = {}
+        self._full_families: set = set()
+        # Kayıt store'u canlı tutmasın (testlerde çok sayıda store oluşur)
+        ref = weakref.ref(self)
+        os.register_at_fork(
+            after_in_child=lambda: ref() is not None and ref()._after_fork_in_child()
+        )
+        for metric in families:
+            metric.backend = self
+
+    def _after_fork_in_child(self):
+        # Çocuk process ebeveynin slot'una yazmasın; post_fork'ta bağlanır
+        self._slot = None
+        self._base = None
+        self._lock = threading.Lock()
+        self._series_indexes = {}
+
+    # --- Tutamaçlar ---
+
+    def counter(self, name: str) -> SharedCounter:
+        """İsimle sayaç veya gauge tutamacı"""
+        if name in self._histogram_buckets or name not in self._offsets:
+            raise KeyError(name)
+        return SharedCounter(self, self._offsets[name])
+
+    def histogram(self, name: str) -> SharedHistogram:
+        """İsimle histogram tutamacı"""
+        return SharedHistogram(self, self._offsets[name], self._histogram_buckets[name])
+
+    def series(self, name: str, key: Tuple[str, ...]) -> SharedSeries:
+        """Etiketli metrik ailesinin label değerlerine karşılık gelen serisi"""
+        return SharedSeries(self, self._families[name], key)
+
+    def collect(self, name: str) -> List[Tuple[Tuple[str, ...], _SeriesTotal]]:
+        """Ailenin tüm worker'lardaki serileri (anahtara göre sıralı, toplam)"""
+        totals = self._series_totals(self._families[name])
+        return [(key, _SeriesTotal(totals[key])) for key in sorted(totals)]
+
+    # --- Slot yönetimi ---
+
+    @property
+    def slot(self) -> Optional[int]:
+        """Bu process'in slot'u (bağlı değilse None)"""
+        return self._slot
+
+    def reserve_slot(self) -> Optional[int]:
+        """
+        Boş slot bul ve ayır (master process'te, fork'tan önce çağrılır)
+
+        Slot, worker bağlanana kadar çağıran process'in pid'i ile ayrılır;
+        böylece art arda fork edilen worker'lara aynı slot verilmez.
+        Process'i artık olmayan slot'lar önce boşaltılır. Boş slot yoksa None.
+        """
+        for slot in range(1, self.slots):
+            base = slot * self._slot_size
+            pid = int(self._values[base + _PID])
+            if pid != 0 and _pid_alive(pid):
+                continue
+            if pid != 0:
+                self.retire(slot, pid)
+            self._values[base + _PID] = os.getpid()
+            return slot
+        return None
+
+    def attach(self, slot: Optional[int] = None) -> Optional[int]:
+        """
+        Bu process'i slot'a bağla (slot verilmezse boş slot aranır)
+
+        Tek process'li çalışmada (geliştirme, testler) import sırasında,
+        gunicorn'da worker'ın post_fork'unda master'ın atadığı slot ile
+        çağrılır.
+        """
+        if slot is None:
+            slot = self.reserve_slot()
+            if slot is None:
+                logger.warning("No free metrics slot; writes are dropped")
+                return None
+        base = slot * self._slot_size
+        self._values[base + _STARTED_AT] = time.time()
+        self._values[base + _PID] = os.getpid()
+        with self._lock:
+            self._series_indexes = {}
+            self._slot, self._base = slot, base
+        return slot
+
+    def detach(self):
+        """Bu process'in slot'unu boşalt (örn. istek almayan master)"""
+        if self._slot is not None:
+            slot, self._slot, self._base = self._slot, None, None
+            self.retire(slot, count=False)
+
+    def retire(self, slot: int, pid: Optional[int] = None, count: bool = True):
+        """
+        Slot'u boşalt; sayaç ve histogramları slot 0'a aktar
+
+        pid verilirse slot başka bir process'e geçmişse bir şey yapılmaz.
+        count False ise çıkan worker sayısı artırılmaz.
+        Okuyucular aktarım sırasında yarım toplam görmesin diye sıra
+        numarası tek iken okuma tekrarlanır.
+        """
+        base = slot * self._slot_size
+        if slot < 1 or (pid is not None and self._values[base + _PID] != pid):
+            return
+        values = self._values
+        values[_SEQUENCE] += 1
+        try:
+            for offset in range(_HEADER, self._plain_size):
+                if offset not in self._gauge_offsets:
+                    values[offset] += values[base + offset]
+                values[base + offset] = 0.0
+            for family in self._families.values():
+                self._retire_series(slot, family)
+            values[base + _PID] = 0.0
+            values[base + _STARTED_AT] = 0.0
+            if count:
+                values[_RETIRED_WORKERS] += 1
+        finally:
+            values[_SEQUENCE] += 1
+
+    def _retire_series(self, slot: int, family: _Family):
+        """Slot'taki serileri anahtara göre slot 0'a aktar ve slot'u boşalt"""
+        values = self._values
+        base = slot * self._slot_size
+        count_at = base + self._count_offset + family.index
+        retired = {
+            self._key_bytes(0, family, index): index
+            for index in range(int(values[self._count_offset + family.index]))
+        }
+        for index in range(int(values[count_at])):
+            start = base + family.offset + index * family.width
+            if not family.gauge:
+                raw = self._key_bytes(slot, family, index)
+                target = retired.get(raw)
+                if target is None and len(retired) < self.max_series:
+                    target = retired[raw] = len(retired)
+                    self._write_key(0, family, target, raw)
+                    values[self._count_offset + family.index] = len(retired)
+                if target is not None:
+                    target_start = family.offset + target * family.width
+                    for i in range(family.width):
+                        values[target_start + i] += values[start + i]
+            for i in range(family.width):
+                values[start + i] = 0.0
+        values[count_at] = 0.0
+
+    # --- Etiketli seriler ---
+
+    def _key_position(self, slot: int, family: _Family, index: int) -> int:
+        families = len(self._families)
+        return ((slot * families + family.index) * self.max_series + index) * _KEY_BYTES
+
+    def _key_bytes(self, slot: int, family: _Family, index: int) -> bytes:
+        position = self._key_position(slot, family, index)
+        return self._keys[position : position + _KEY_BYTES].rstrip(b"\0")
+
+    def _write_key(self, slot: int, family: _Family, index: int, raw: bytes):
+        position = self._key_position(slot, family, index)
+        self._keys[position : position + _KEY_BYTES] = raw.ljust(_KEY_BYTES, b"\0")
+
+    def _decode_key(self, raw: bytes) -> Tuple[str, ...]:
+        key = self._decoded_keys.get(raw)
+        if key is None:
+            key = self._decoded_keys[raw] = tuple(json.loads(raw))
+        return key
+
+    def _series_index(self, base: int, family: _Family, key: Tuple[str, ...]) -> int:
+        """
+        Serinin bu process'in slot'undaki index'i; yoksa kaydedilir
+
+        Anahtar sayıdan önce yazılır, okuyucu yarım anahtar görmez. Yer yoksa
+        -1 (yazma yok sayılır). self._lock tutulurken çağrılır.
+        """
+        index = self._series_indexes.get((family.index, key))
+        if index is not None:
+            return index
+        raw = json.dumps(list(key)).encode("utf-8")
+        count = int(self._values[base + self._count_offset + family.index])
+        if count >= self.max_series or len(raw) > _KEY_BYTES:
+            if family.name not in self._full_families:
+                self._full_families.add(family.name)
+                logger.warning(
+                    "No free metric series for %s; writes are dropped", family.name
+                )
+            index = -1
+        else:
+            index = count
+            self._write_key(base // self._slot_size, family, index, raw)
+            self._values[base + self._count_offset + family.index] = count + 1
+        self._series_indexes[(family.index, key)] = index
+        return index
+
+    def _series_add(
+        self,
+        family: _Family,
+        key: Tuple[str, ...],
+        position: int,
+        amount,
+        total: Optional[float] = None,
+    ):
+        base = self._base
+        if base is None:
+            return
+        with self._lock:
+            index = self._series_index(base, family, key)
+            if index < 0:
+                return
+            start = base + family.offset + index * family.width
+            self._values[start + position] += amount
+            if total is not None:
+                self._values[start + family.width - 1] += total
+
+    def _series_totals(self, family: _Family) -> Dict[Tuple[str, ...], List[float]]:
+        """Ailenin tüm slot'lardaki serileri anahtara göre toplanmış"""
+        values = self._values
+        width = family.width
+        while True:
+            sequence = values[_SEQUENCE]
+            if sequence % 2:
+                time.sleep(0)
+                continue
+            totals: Dict[Tuple[str, ...], List[float]] = {}
+            for slot in range(self.slots):
+                base = slot * self._slot_size
+                if slot and values[base + _PID] == 0:
+                    continue
+                count = int(values[base + self._count_offset + family.index])
+                for index in range(min(count, self.max_series)):
+                    key = self._decode_key(self._key_bytes(slot, family, index))
+                    start = base + family.offset + index * width
+                    total = totals.get(key)
+                    if total is None:
+                        totals[key] = values[start : start + width].tolist()
+                    else:
+                        for i in range(width):
+                            total[i] += values[start + i]
+            if values[_SEQUENCE] == sequence:
+                return totals
+
+    def _series_total(self, family: _Family, key: Tuple[str, ...]) -> List[float]:
+        return self._series_totals(family).get(key) or [0.0] * family.width
+
+    def _series_reset(self, family: _Family, key: Tuple[str, ...]):
+        """Serinin tüm slot'lardaki değerlerini sıfırla (test amaçlı)"""
+        with self._lock:
+            for slot in range(self.slots):
+                base = slot * self._slot_size
+                count = int(self._values[base + self._count_offset + family.index])
+                for index in range(count):
+                    if self._decode_key(self._key_bytes(slot, family, index)) == key:
+                        start = base + family.offset + index * family.width
+                        for i in range(family.width):
+                            self._values[start + i] = 0.0
+
+    # --- Yazma/okuma ---
+
+    def _add(self, offset: int, amount):
+        base = self._base
+        if base is None:
+            return
+        with self._lock:
+            self._values[base + offset] += amount
+
+    def _observe(self, offset: int, bucket: int, bucket_count: int, value: float):
+        base = self._base
+        if base is None:
+            return
+        with self._lock:
+            self._values[base + offset + bucket] += 1
+            self._values[base + offset + bucket_count + 1] += value
+
+    def _read(self, offset: int, size: int) -> List[float]:
+        """Tüm slot'lardaki [offset, offset+size) değerlerinin toplamı"""
+        values = self._values
+        while True:
+            sequence = values[_SEQUENCE]
+            if sequence % 2:
+                time.sleep(0)
+                continue
+            total = [0.0] * size
+            for slot in range(self.slots):
+                base = slot * self._slot_size
+                if slot and values[base + _PID] == 0:
+                    continue
+                for i in range(size):
+                    total[i] += values[base + offset + i]
+            if values[_SEQUENCE] == sequence:
+                return total
+
+    def workers(self) -> List[Dict[str, Any]]:
+        """Bağlı worker'lar ve her birinin sayaç değerleri"""
+        now = time.time()
+        result = []
+        for slot in range(1, self.slots):
+            base = slot * self._slot_size
+            pid = int(self._values[base + _PID])
+            if pid == 0:
+                continue
+            entry: Dict[str, Any] = {
+                "slot": slot,
+                "pid": pid,
+                "uptime_seconds": int(now - self._values[base + _STARTED_AT]),
+            }
+            for name, offset in self._offsets.items():
+                if name not in self._histogram_buckets:
+                    entry[name] = int(self._values[base + offset])
+            result.append(entry)
+        return result
+
+    def summary(self) -> Dict[str, Any]:
+        """Container özeti: uptime, yaşayan/çıkan worker sayısı ve worker'lar"""
+        workers = self.workers()
+        return {
+            "uptime_seconds": int(time.time() - self.created_at),
+            "active": len(workers),
+            "retired": int(self._values[_RETIRED_WORKERS]),
+            "per_worker": workers,
+        }
+
+    def reset(self):
+        """
+        Tüm değerleri sıfırla; slot bağlantıları ve seri anahtarları korunur
+        (test amaçlı)
+        """
+        with self._lock:
+            for slot in range(self.slots):
+                base = slot * self._slot_size
+                for offset in range(_HEADER, self._count_offset):
+                    self._values[base + offset] = 0.0
+            self._values[_RETIRED_WORKERS] = 0.0
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+İstek Süresi Kaydı - CI/CD Örneği
+Endpoint bazında son istek sürelerini sabit boyutlu ring buffer'larda tutar,
+eşiği aşan yavaş istekleri ayrıca saklar.
+"""
+
+import itertools
+import os
+import time
+from collections import deque
+from datetime import datetime
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from utils import log_request
+
+# (süre saniye, wall-clock zaman, method, status)
+_Sample = Tuple[float, float, str, int]
+
+
+class RequestTimingRecorder:
+    """
+    Endpoint bazında istek sürelerini kaydeder
+
+    Hot path'te lock yoktur: deque.append GIL altında atomiktir ve maxlen
+    dolunca en eski kayıt kendiliğinden düşer. sample_rate < 1 ise
+    isteklerin sadece bir kısmı ring buffer'a ve loga yazılır; eşiği aşan
+    yavaş istekler örneklemeden bağımsız olarak her zaman kaydedilir.
+    """
+
+    def __init__(
+        self,
+        buffer_size: Optional[int] = None,
+        slow_threshold_ms: Optional[float] = None,
+        sample_rate: Optional[float] = None,
+        slow_buffer_size: int = 100,
+    ):
+        self.buffer_size = buffer_size or int(
+            os.environ.get("REQUEST_TIMING_BUFFER_SIZE", 1024)
+        )
+        self.slow_threshold_ms = (
+            float(os.environ.get("SLOW_REQUEST_THRESHOLD_MS", 500))
+            if slow_threshold_ms is None
+            else slow_threshold_ms
+        )
+        self.sample_rate = (
+            float(os.environ.get("REQUEST_TIMING_SAMPLE_RATE", 1.0))
+            if sample_rate is None
+            else sample_rate
+        )
+        self._slow_threshold = self.slow_threshold_ms / 1000
+        self._every = max(1, round(1 / self.sample_rate)) if self.sample_rate > 0 else 0
+        self._counter = itertools.count()
+        self._buffers: Dict[str, Deque[_Sample]] = {}
+        self._slow: Deque[Dict[str, Any]] = deque(maxlen=slow_buffer_size)
+
+    def should_sample(self) -> bool:
+        """Bu istek ring buffer'a ve loga yazılacak mı"""
+        if self._every == 1:
+            return True
+        if self._every == 0:
+            return False
+        return next(self._counter) % self._every == 0
+
+    def record(
+        self,
+        endpoint: str,
+        method: str,
+        status: int,
+        duration: float,
+        data: Any = None,
+        sampled: Optional[bool] = None,
+    ):
+        """
+        Tamamlanan isteği kaydet
+
+        Args:
+            endpoint: URL kuralı (örn. '/predict')
+            method: HTTP method
+            status: Response status kodu
+            duration: İstek süresi (saniye, monotonic saat farkı)
+            data: Request gövdesi (log için, opsiyonel)
+            sampled: Örnekleme kararı (None ise burada verilir)
+        """
+        slow = duration >= self._slow_threshold
+        if sampled is None:
+            sampled = self.should_sample()
+        if not (sampled or slow):
+            return
+
+        now = time.time()
+        if sampled:
+            buffer = self._buffers.get(endpoint)
+            if buffer is None:
+                buffer = self._buffers.setdefault(
+                    endpoint, deque(maxlen=self.buffer_size)
+                )
+            buffer.append((duration, now, method, status))
+            log_request(endpoint, data, duration)
+
+        if slow:
+            self._slow.append(
+                {
+                    "endpoint": endpoint,
+                    "method": method,
+                    "status": status,
+                    "duration_ms": round(duration * 1000, 3),
+                    "timestamp": datetime.fromtimestamp(now).isoformat(),
+                }
+            )
+
+    def slow_requests(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Son yavaş istekler (en yenisi önce)"""
+        requests = list(self._slow)
+        requests.reverse()
+        return requests[:limit] if limit is not None else requests
+
+    def endpoint_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Ring buffer'lardaki kayıtlardan endpoint bazında süre özeti (ms)"""
+        stats = {}
+        for endpoint, buffer in list(self._buffers.items()):
+            durations = sorted(sample[0] for sample in list(buffer))
+            if not durations:
+                continue
+            count = len(durations)
+            stats[endpoint] = {
+                "samples": count,
+                "mean_ms": round(sum(durations) / count * 1000, 3),
+                "p50_ms": round(durations[(count - 1) // 2] * 1000, 3),
+                "p95_ms": round(durations[int((count - 1) * 0.95)] * 1000, 3),
+                "max_ms": round(durations[-1] * 1000, 3),
+            }
+        return stats
+
+    def reset(self):
+        """Tüm kayıtları temizle"""
+        self._buffers.clear()
+        self._slow.clear()
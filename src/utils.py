@@ -4,47 +4,139 @@ Yardımcı Fonksiyonlar - CI/CD Örneği
 Input validasyon, response formatting ve diğer utility fonksiyonlar
 """
 
+import random
 import re
 from datetime import datetime
-from typing import Dict, Any, Union
+from typing import Any, Dict, List, Sequence
 import logging
 
+from metrics import StreamingStats
+
 logger = logging.getLogger(__name__)
 
 
-def validate_input(data: Dict[str, Any]) -> Dict[str, Union[bool, str]]:
+EMAIL_PATTERN = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
+EMAIL_REGEX = re.compile(EMAIL_PATTERN)
+
+# Input alanlarının sınırları ve hata mesajları: alan -> ayarlar
+# errors: kontrol -> (reason kodu, kullanıcı mesajı)
+# validate_input kontrolleri alan bazında elle yazılmıştır (closure veya
+# üretilen kod ile genel bir doğrulayıcı ölçümlerde daha yavaştı); burada
+# sadece sınır değerleri ve hata kodları/mesajları tanımlanır. Email formatı
+# EMAIL_PATTERN ile kontrol edilir.
+INPUT_RULES: Dict[str, Dict[str, Any]] = {
+    "value": {
+        "min": 0,
+        "max": 100,
+        "errors": {
+            "type": ("value_type", "Value sayısal bir değer olmalı"),
+            "range": ("value_range", "Value 0-100 arasında olmalı"),
+        },
+    },
+    "email": {
+        "errors": {
+            "pattern": ("email_format", "Geçersiz email formatı"),
+        },
+    },
+    "name": {
+        "min_length": 2,
+        "errors": {
+            "length": ("name_length", "Name en az 2 karakter olmalı"),
+        },
+    },
+}
+
+# Tahmin kategorileri: (kategori, alt sınır), büyükten küçüğe; altı 'low'
+CATEGORY_THRESHOLDS = (("high", 0.7), ("medium", 0.4))
+
+
+def _field_error(name: str, check: str) -> Dict[str, Any]:
+    """Alan kontrolü için hata dictionary'si oluşturur"""
+    reason, message = INPUT_RULES[name]["errors"][check]
+    return {"field": name, "reason": reason, "message": message}
+
+
+# Sınırlar ve hata dict'leri modül yüklenirken bir kez hazırlanır. Hata
+# dict'leri sonuçlar arasında paylaşılır, değiştirilmemelidir.
+_NOT_DICT_ERROR = {
+    "field": None,
+    "reason": "not_dict",
+    "message": "Veri dictionary formatında olmalı",
+}
+_VALUE_MIN = INPUT_RULES["value"]["min"]
+_VALUE_MAX = INPUT_RULES["value"]["max"]
+_NAME_MIN_LENGTH = INPUT_RULES["name"]["min_length"]
+_VALUE_TYPE_ERROR = _field_error("value", "type")
+_VALUE_RANGE_ERROR = _field_error("value", "range")
+_EMAIL_ERROR = _field_error("email", "pattern")
+_NAME_ERROR = _field_error("name", "length")
+_VALID_RESULT_MESSAGE = "Veri doğrulaması başarılı"
+
+
+def _invalid(errors: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Hata listesinden geçersiz validation result oluşturur"""
+    first = errors[0]
+    return {
+        "valid": False,
+        "message": first["message"],
+        "reason": first["reason"],
+        "errors": errors,
+    }
+
+
+def validate_input(data: Any) -> Dict[str, Any]:
     """
-    Input verilerini doğrular
+    Input verilerini doğrular (sınırlar ve hata mesajları INPUT_RULES'tan)
+
+    İlk hatada durmaz, tüm alanlardaki hataları birlikte döndürür.
 
     Args:
         data: Doğrulanacak veri dictionary'si
 
     Returns:
-        validation result: {'valid': bool, 'message': str}
+        validation result: {'valid': bool, 'message': str}, geçersizse ek
+        olarak 'reason' (ilk hatanın kısa kodu) ve 'errors' (tüm hatalar)
     """
     if not isinstance(data, dict):
-        return {"valid": False, "message": "Veri dictionary formatında olmalı"}
+        return _invalid([_NOT_DICT_ERROR])
 
-    # Eğer 'value' varsa doğrula
+    errors = None
     if "value" in data:
-        try:
-            value = float(data["value"])
-            if value < 0 or value > 100:
-                return {"valid": False, "message": "Value 0-100 arasında olmalı"}
-        except (ValueError, TypeError):
-            return {"valid": False, "message": "Value sayısal bir değer olmalı"}
-
-    # Email varsa doğrula (isteğe bağlı)
-    if "email" in data:
-        if not is_valid_email(data["email"]):
-            return {"valid": False, "message": "Geçersiz email formatı"}
+        value = data["value"]
+        if type(value) is not float:
+            try:
+                value = float(value)
+            except (ValueError, TypeError):
+                value = None
+        if value is None:
+            errors = [_VALUE_TYPE_ERROR]
+        elif not _VALUE_MIN <= value <= _VALUE_MAX:
+            errors = [_VALUE_RANGE_ERROR]
+
+    if "email" in data and not is_valid_email(data["email"]):
+        errors = errors or []
+        errors.append(_EMAIL_ERROR)
+
+    if "name" in data and not is_valid_name(data["name"]):
+        errors = errors or []
+        errors.append(_NAME_ERROR)
+
+    if errors is None:
+        return {"valid": True, "message": _VALID_RESULT_MESSAGE}
+    return _invalid(errors)
+
+
+def validate_records(records: List[Any]) -> List[Dict[str, Any]]:
+    """
+    Kayıt listesini doğrular
 
-    # Name varsa doğrula (isteğe bağlı)
-    if "name" in data:
-        if not is_valid_name(data["name"]):
-            return {"valid": False, "message": "Name en az 2 karakter olmalı"}
+    Args:
+        records: Doğrulanacak kayıtlar
 
-    return {"valid": True, "message": "Veri doğrulaması başarılı"}
+    Returns:
+        Her kayıt için validate_input formatında sonuç listesi
+    """
+    return [validate_input(record) for record in records]
 
 
 def is_valid_email(email: str) -> bool:
@@ -52,8 +144,7 @@ def is_valid_email(email: str) -> bool:
     if not isinstance(email, str):
         return False
 
-    pattern = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
-    return re.match(pattern, email) is not None
+    return EMAIL_REGEX.match(email) is not None
 
 
 def is_valid_name(name: str) -> bool:
@@ -61,7 +152,7 @@ def is_valid_name(name: str) -> bool:
     if not isinstance(name, str):
         return False
 
-    return len(name.strip()) >= 2
+    return len(name.strip()) >= _NAME_MIN_LENGTH
 
 
 def format_response(
@@ -89,18 +180,23 @@ def format_response(
     if "value" in original_data:
         response["input_value"] = original_data["value"]
 
-    # Tahmin kategorisini ekle
-    prediction_value = prediction_result.get("prediction", 0)
-    if prediction_value >= 0.7:
-        response["category"] = "high"
-    elif prediction_value >= 0.4:
-        response["category"] = "medium"
-    else:
-        response["category"] = "low"
+    # Tahmin kategorisini ekle (model tablodan verdiyse tekrar hesaplanmaz)
+    category = prediction_result.get("category")
+    if category is None:
+        category = prediction_category(prediction_result.get("prediction", 0))
+    response["category"] = category
 
     return response
 
 
+def prediction_category(prediction: float) -> str:
+    """Tahmin değerinin kategorisi ('high', 'medium' veya 'low')"""
+    for category, threshold in CATEGORY_THRESHOLDS:
+        if prediction >= threshold:
+            return category
+    return "low"
+
+
 def sanitize_string(text: str, max_length: int = 100) -> str:
     """
     String'i temizler ve güvenli hale getirir
@@ -131,47 +227,53 @@ def sanitize_string(text: str, max_length: int = 100) -> str:
     return text
 
 
-def calculate_metrics(predictions: list) -> Dict[str, float]:
+def calculate_metrics(predictions: Sequence[float]) -> Dict[str, float]:
     """
     Tahmin listesinden metrikleri hesaplar
 
+    Liste tek geçişte StreamingStats ile özetlenir; p50/p95/p99 değerleri
+    listenin min-max aralığında yaklaşık hesaplanır.
+
     Args:
         predictions: Tahmin değerleri listesi
 
     Returns:
-        Hesaplanmış metrikler
+        Hesaplanmış metrikler (count, mean, min, max, std, p50, p95, p99)
     """
     if not predictions:
-        return {"count": 0, "mean": 0, "min": 0, "max": 0, "std": 0}
+        return StreamingStats().summary()
 
-    import statistics
-
-    return {
-        "count": len(predictions),
-        "mean": round(statistics.mean(predictions), 4),
-        "min": min(predictions),
-        "max": max(predictions),
-        "std": round(statistics.stdev(predictions) if len(predictions) > 1 else 0, 4),
-    }
+    low, high = min(predictions), max(predictions)
+    stats = StreamingStats(low, high if high > low else low + 1)
+    stats.update_many(predictions)
+    return stats.summary()
 
 
 def log_request(endpoint: str, data: Dict[str, Any], response_time: float):
     """
-    Request'i loglar
+    Request'i loglar (yüksek hacimli log, örneklenebilir)
 
     Args:
         endpoint: API endpoint
         data: Request data
-        response_time: Response süresi (ms)
+        response_time: Response süresi (saniye)
     """
-    log_data = {
-        "endpoint": endpoint,
-        "timestamp": datetime.now().isoformat(),
-        "response_time_ms": round(response_time * 1000, 2),
-        "data_keys": list(data.keys()) if data else [],
-    }
-
-    logger.info(f"Request logged: {log_data}")
+    # Log seviyesi kapalıysa kayıt hiç oluşturulmaz
+    if not logger.isEnabledFor(logging.INFO):
+        return
+
+    response_time_ms = round(response_time * 1000, 2)
+    logger.info(
+        "Request logged: %s %sms",
+        endpoint,
+        response_time_ms,
+        extra={
+            "endpoint": endpoint,
+            "response_time_ms": response_time_ms,
+            "data_keys": list(data.keys()) if isinstance(data, dict) else [],
+            "sampled": True,
+        },
+    )
 
 
 def health_check_database():
@@ -182,8 +284,6 @@ def health_check_database():
         bool: Database sağlık durumu
     """
     # Gerçek uygulamada database connection test edilir
-    import random
-
     return random.random() > 0.1  # %90 başarı oranı
 
 
@@ -195,8 +295,6 @@ def health_check_external_api():
         bool: Harici API sağlık durumu
     """
     # Gerçek uygulamada harici API'ye request atılır
-    import random
-
     return random.random() > 0.05  # %95 başarı oranı
 
 
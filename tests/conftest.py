@@ -0,0 +1,21 @@
+#!/usr/bin/env python3
+"""
+Ortak pytest ayarları
+"""
+
+import os
+import sys
+
+import pytest
+
+# Src dizinini path'e ekle
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+
+@pytest.fixture(scope="session", autouse=True)
+def flush_logging_pipeline():
+    """Oturum sonunda kuyruktaki logları (output capture aktifken) yaz"""
+    yield
+    from logging_setup import shutdown_logging
+
+    shutdown_logging()
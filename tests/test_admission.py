@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Admission Control Testleri - CI/CD Pipeline için
+"""
+
+import os
+import sys
+import time
+
+import pytest
+
+# Src dizinini path'e ekle
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from admission import (  # noqa: E402
+    AdmissionController,
+    ConcurrencyLimiter,
+    RateLimiter,
+    parse_request_start,
+)
+
+
+class TestRateLimiter:
+    """Token bucket testleri"""
+
+    def test_burst_then_refill(self):
+        """Burst kadar istek geçmeli, sonra token'lar rate ile dolmalı"""
+        limiter = RateLimiter(rate=2, burst=3)
+
+        assert [limiter.check("a", now=0.0) for _ in range(3)] == [0.0, 0.0, 0.0]
+        assert limiter.check("a", now=0.0) == pytest.approx(0.5)
+        assert limiter.check("a", now=0.25) == pytest.approx(0.25)
+        assert limiter.check("a", now=0.5) == 0.0
+        # Birikim burst ile sınırlı
+        assert [limiter.check("a", now=100.0) for _ in range(4)][-1] > 0
+
+    def test_clients_are_isolated(self):
+        """Bir istemcinin limiti diğerini etkilememeli"""
+        limiter = RateLimiter(rate=1, burst=1)
+
+        assert limiter.check("a", now=0.0) == 0.0
+        assert limiter.check("a", now=0.0) > 0
+        assert limiter.check("b", now=0.0) == 0.0
+
+    def test_least_recently_seen_client_evicted(self):
+        """max_clients aşılınca en uzun süredir görülmeyen istemci atılmalı"""
+        limiter = RateLimiter(rate=1, burst=1, max_clients=2)
+        limiter.check("a", now=0.0)
+        limiter.check("b", now=0.0)
+        limiter.check("a", now=0.0)
+
+        limiter.check("c", now=0.0)
+
+        assert len(limiter) == 2
+        # 'b' atıldı; tekrar geldiğinde dolu bucket ile başlar
+        assert limiter.check("b", now=0.0) == 0.0
+
+    def test_disabled(self):
+        """rate 0 iken limit uygulanmamalı"""
+        limiter = RateLimiter(rate=0)
+
+        assert not limiter.enabled
+        assert all(limiter.check("a") == 0.0 for _ in range(100))
+
+    def test_invalid_settings(self):
+        """Geçersiz ayarlar ValueError vermeli"""
+        with pytest.raises(ValueError):
+            RateLimiter(rate=-1)
+        with pytest.raises(ValueError):
+            RateLimiter(rate=1, burst=0.5)
+
+
+class TestConcurrencyLimiter:
+    """Eşzamanlılık limiti testleri"""
+
+    def test_limit_and_release(self):
+        """Limit dolunca timeout sonunda reddedilmeli, release yer açmalı"""
+        limiter = ConcurrencyLimiter(limit=2)
+
+        assert limiter.acquire(0) and limiter.acquire(0)
+        start = time.perf_counter()
+        assert limiter.acquire(0.05) is False
+        assert time.perf_counter() - start >= 0.04
+        assert limiter.in_flight == 2
+
+        limiter.release()
+        assert limiter.acquire(0) is True
+
+    def test_disabled(self):
+        """limit 0 iken her istek kabul edilmeli"""
+        limiter = ConcurrencyLimiter(limit=0)
+
+        assert all(limiter.acquire(0) for _ in range(10))
+        assert limiter.in_flight == 0
+
+
+class TestAdmissionController:
+    """Kuyruk süresi, hız ve eşzamanlılık limitlerinin birlikte uygulanması"""
+
+    @pytest.mark.parametrize(
+        "value, expected",
+        [
+            ("t=1700000000.123", 1700000000.123),
+            ("1700000000123", 1700000000.123),
+            ("t=1700000000123456", 1700000000.123456),
+            ("garbage", None),
+            (None, None),
+        ],
+    )
+    def test_parse_request_start(self, value, expected):
+        """X-Request-Start saniye/ms/µs formatları okunmalı"""
+        result = parse_request_start(value)
+        assert result == (pytest.approx(expected) if expected else None)
+
+    def test_queue_timeout(self):
+        """Proxy kuyruğunda eşikten fazla bekleyen istek 503 almalı"""
+        controller = AdmissionController(
+            RateLimiter(rate=0), ConcurrencyLimiter(limit=1), max_queue_wait=0.1
+        )
+
+        rejection = controller.admit("a", request_start=time.time() - 1)
+
+        assert (rejection.status, rejection.reason) == (503, "queue_timeout")
+        assert controller.concurrency.in_flight == 0
+
+    def test_rate_limited(self):
+        """Token'ı biten istemci Retry-After ile 429 almalı"""
+        controller = AdmissionController(RateLimiter(rate=1, burst=1))
+
+        assert controller.admit("a") is None
+        controller.release()
+        rejection = controller.admit("a")
+
+        assert (rejection.status, rejection.reason) == (429, "rate_limited")
+        assert 0 < rejection.retry_after <= 1
+
+    def test_concurrency_full(self):
+        """Kapasite doluysa bekleme bütçesi bitince 503 dönmeli"""
+        controller = AdmissionController(
+            RateLimiter(rate=0),
+            ConcurrencyLimiter(limit=1),
+            max_queue_wait=0.01,
+            retry_after=2,
+        )
+
+        assert controller.admit("a") is None
+        rejection = controller.admit("b")
+        controller.release()
+
+        assert (rejection.status, rejection.reason) == (503, "concurrency")
+        assert rejection.retry_after == 2
+        assert controller.admit("b") is None
+
+    def test_defaults_disabled(self, monkeypatch):
+        """Env verilmezse tüm limitler ve kuyruk süresi eşiği kapalı olmalı"""
+        for name in (
+            "RATE_LIMIT_PER_SECOND",
+            "MAX_CONCURRENT_PREDICTIONS",
+            "MAX_QUEUE_WAIT_MS",
+        ):
+            monkeypatch.delenv(name, raising=False)
+
+        controller = AdmissionController()
+
+        assert controller.max_queue_wait == 0
+        assert controller.admit("a", request_start=time.time() - 60) is None
+        assert controller.describe()["max_queue_wait_ms"] == 0
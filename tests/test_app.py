@@ -4,9 +4,12 @@ Basit Flask App Testleri - CI/CD Pipeline için
 Sadece çalışan temel testler
 """
 
+import io
 import json
 import os
 import sys
+import threading
+import time
 
 import pytest
 
@@ -84,6 +87,7 @@ class TestBasicEndpoints:
 
         assert "total_predictions" in data
         assert "uptime_seconds" in data
+        assert set(data["prediction_stats"]) >= {"mean", "std", "p50", "p95", "p99"}
 
     def test_404_endpoint(self, client):
         """Olmayan endpoint'i test et"""
@@ -155,6 +159,72 @@ class TestPredictEndpointExtended:
         assert data["status"] == "success"
 
 
+class TestBatchPredictEndpoint:
+    """Toplu prediction endpoint testleri"""
+
+    def test_predict_batch_valid(self, client):
+        """Geçerli kayıtlarla batch tahmin"""
+        test_data = [{"value": 10}, {"value": 50}, {"value": 90}]
+        response = client.post(
+            "/predict/batch",
+            data=json.dumps(test_data),
+            content_type="application/json",
+        )
+
+        assert response.status_code == 200
+        data = response.get_json()
+        assert data["status"] == "success"
+        assert data["count"] == 3
+        assert data["valid_count"] == 3
+        assert [item["index"] for item in data["results"]] == [0, 1, 2]
+        assert data["results"][1]["prediction"] == 1.0
+        assert data["results"][1]["category"] == "high"
+
+    def test_predict_batch_partial_errors(self, client):
+        """Geçersiz kayıtlar sadece kendi sonucunu etkiler"""
+        test_data = [{"value": 50}, {"value": 150}, "not a dict", {"value": 20}]
+        response = client.post(
+            "/predict/batch",
+            data=json.dumps(test_data),
+            content_type="application/json",
+        )
+
+        assert response.status_code == 200
+        data = response.get_json()
+        assert data["valid_count"] == 2
+        assert data["error_count"] == 2
+        assert data["results"][0]["status"] == "success"
+        assert data["results"][1]["status"] == "error"
+        assert data["results"][2]["status"] == "error"
+        assert data["results"][3]["input_value"] == 20
+
+    def test_predict_batch_not_list(self, client):
+        """Liste olmayan gövde reddedilmeli"""
+        response = client.post(
+            "/predict/batch",
+            data=json.dumps({"value": 50}),
+            content_type="application/json",
+        )
+
+        assert response.status_code == 400
+        assert response.get_json()["status"] == "error"
+
+    def test_predict_batch_too_large(self, client, monkeypatch):
+        """Limit üstü batch reddedilmeli"""
+        import app as app_module
+
+        monkeypatch.setattr(app_module, "BATCH_MAX_SIZE", 2)
+        test_data = [{"value": 1}, {"value": 2}, {"value": 3}]
+        response = client.post(
+            "/predict/batch",
+            data=json.dumps(test_data),
+            content_type="application/json",
+        )
+
+        assert response.status_code == 413
+        assert response.get_json()["status"] == "error"
+
+
 class TestErrorHandlers:
     """Hata işleyici testleri"""
 
@@ -188,6 +258,167 @@ class TestHealthEndpointExtended:
             assert "timestamp" in data
 
 
+class TestHealthSnapshot:
+    """Arka planda yenilenen bağımlılık kontrolleri ile /health"""
+
+    def test_health_with_dependency_snapshot(self, client, monkeypatch):
+        """Snapshot varsa bağımlılık sonuçları raporlanmalı"""
+        from app import health_monitor
+
+        monkeypatch.setattr(health_monitor, "probes", {"database": lambda: True})
+        monkeypatch.setattr(health_monitor, "_snapshot", None)
+        health_monitor.refresh()
+
+        response = client.get("/health")
+        data = response.get_json()
+
+        assert response.status_code == 200
+        assert data["dependencies"]["checks"]["database"]["healthy"] is True
+        assert data["dependencies"]["stale"] is False
+
+    def test_health_failing_dependency(self, client, monkeypatch):
+        """Başarısız bağımlılık 503 döndürmeli"""
+        from app import health_monitor
+
+        monkeypatch.setattr(health_monitor, "probes", {"cache": lambda: False})
+        monkeypatch.setattr(health_monitor, "_snapshot", None)
+        health_monitor.refresh()
+
+        response = client.get("/health")
+
+        assert response.status_code == 503
+        assert response.get_json()["status"] == "unhealthy"
+
+    def test_health_ignores_informational_probes(self, client, monkeypatch):
+        """Informational probe hatası raporlanmalı ama 503 döndürmemeli"""
+        from app import health_monitor
+
+        monkeypatch.setattr(
+            health_monitor,
+            "probes",
+            {"database": lambda: False, "external_api": lambda: False},
+        )
+        monkeypatch.setattr(health_monitor, "_snapshot", None)
+        health_monitor.refresh()
+
+        response = client.get("/health")
+        data = response.get_json()
+
+        assert response.status_code == 200
+        assert data["status"] == "healthy"
+        assert data["dependencies"]["checks"]["database"]["healthy"] is False
+
+    def test_health_stale_snapshot(self, client, monkeypatch):
+        """Eski snapshot 503 döndürmeli"""
+        from app import health_monitor
+
+        monkeypatch.setattr(health_monitor, "probes", {"database": lambda: True})
+        monkeypatch.setattr(health_monitor, "max_age", 0)
+        monkeypatch.setattr(health_monitor, "_snapshot", None)
+        health_monitor.refresh()
+
+        response = client.get("/health")
+
+        assert response.status_code == 503
+        assert response.get_json()["dependencies"]["stale"] is True
+
+
+class TestLivenessReadiness:
+    """/livez ve ısıtmaya bağlı /readyz"""
+
+    @pytest.fixture
+    def warmup(self, monkeypatch):
+        from app import health_monitor, model_warmup
+
+        monkeypatch.setattr(health_monitor, "probes", {"database": lambda: True})
+        monkeypatch.setattr(health_monitor, "_snapshot", None)
+        model_warmup.reset()
+        yield model_warmup
+        model_warmup.reset()
+
+    def test_livez(self, client, warmup):
+        """Liveness ısıtmadan bağımsız olarak 200 döndürmeli"""
+        response = client.get("/livez")
+
+        assert response.status_code == 200
+        assert response.get_json()["status"] == "alive"
+        assert response.get_json()["uptime_seconds"] >= 0
+
+    def test_readyz_before_warm_up(self, client, warmup):
+        """Isıtma bitmeden readiness 503 döndürmeli"""
+        response = client.get("/readyz")
+        data = response.get_json()
+
+        assert response.status_code == 503
+        assert data["status"] == "not_ready"
+        assert data["checks"]["warmup"]["ready"] is False
+        assert data["checks"]["model_loaded"] is True
+
+    def test_readyz_after_warm_up(self, client, warmup):
+        """Isıtma (model + bağımlılıklar) bitince readiness 200 döndürmeli"""
+        import app as app_module
+
+        count = app_module.model.get_prediction_count()
+        assert warmup.run() is True
+
+        response = client.get("/readyz")
+        data = response.get_json()
+
+        assert response.status_code == 200
+        assert data["status"] == "ready"
+        assert data["model_version"] == "1.0.0"
+        assert data["checks"]["dependencies"] is True
+        assert set(data["checks"]["warmup"]["steps"]) == {"model", "dependencies"}
+        # Sentetik tahminler istatistiklere yazılmamalı
+        assert app_module.model.get_prediction_count() == count
+
+    def test_readyz_failing_dependency(self, client, warmup, monkeypatch):
+        """Isıtma bitse de bağımlılık başarısızsa readiness 503 döndürmeli"""
+        from app import health_monitor
+
+        monkeypatch.setattr(health_monitor, "probes", {"cache": lambda: False})
+        assert warmup.run() is True
+
+        response = client.get("/readyz")
+
+        assert response.status_code == 503
+        assert response.get_json()["checks"]["dependencies"] is False
+
+    def test_readyz_ignores_simulated_probes(self, client, warmup, monkeypatch):
+        """Simülasyon probe'larının hatası readiness'i düşürmemeli"""
+        from app import health_monitor
+
+        monkeypatch.setattr(
+            health_monitor,
+            "probes",
+            {"database": lambda: False, "external_api": lambda: False},
+        )
+        assert warmup.run() is True
+
+        response = client.get("/readyz")
+
+        assert response.status_code == 200
+        assert response.get_json()["checks"]["dependencies"] is True
+        # /health sonuçları raporlar ama 503 döndürmez
+        health = client.get("/health")
+        assert health.status_code == 200
+        assert (
+            health.get_json()["dependencies"]["checks"]["database"]["healthy"] is False
+        )
+
+    def test_readyz_unhealthy_model(self, client, warmup):
+        """Model sağlıksızsa readiness 503, liveness 200 olmalı"""
+        import app as app_module
+
+        warmup.run()
+        app_module.model.simulate_error()
+        try:
+            assert client.get("/readyz").status_code == 503
+            assert client.get("/livez").status_code == 200
+        finally:
+            app_module.model.recover()
+
+
 class TestMetricsEndpointExtended:
     """Genişletilmiş metrik endpoint testleri"""
 
@@ -214,6 +445,25 @@ class TestMetricsEndpointExtended:
         assert "model_version" in data
         assert "uptime_seconds" in data
 
+    def test_metrics_are_container_wide(self, client):
+        """Tahmin ve istek sayıları paylaşımlı bellekten okunmalı"""
+        import app as app_module
+
+        before = client.get("/metrics").get_json()
+        # Response cache'e düşmeyen bir değer (cache hit tahmin sayılmaz)
+        client.post("/predict", json={"value": 17.25})
+        client.post("/predict/batch", json=[{"value": 1}, {"value": 2}])
+        data = client.get("/metrics").get_json()
+
+        assert data["total_predictions"] == before["total_predictions"] + 3
+        # Arada /predict, /predict/batch ve ilk /metrics istekleri tamamlandı
+        assert data["requests"]["total"] == before["requests"]["total"] + 3
+        assert data["requests"]["in_flight"] == 1
+        assert data["workers"]["active"] == 1
+        worker = data["workers"]["per_worker"][0]
+        assert worker["pid"] == os.getpid()
+        assert worker["slot"] == app_module.shared_metrics.slot
+
     def test_metrics_endpoint_structure(self, client):
         """Metrik endpoint yapı testi"""
         response = client.get("/metrics")
@@ -231,6 +481,630 @@ class TestMetricsEndpointExtended:
             assert field in data
 
 
+class TrackingStream(io.BytesIO):
+    """Ne kadar okunduğunu takip eden input stream"""
+
+    def __init__(self, data):
+        super().__init__(data)
+        self.max_read = 0
+
+    def readline(self, size=-1):
+        line = super().readline(size)
+        self.max_read = max(self.max_read, self.tell())
+        return line
+
+
+def ndjson(records):
+    return "".join(json.dumps(record) + "\n" for record in records).encode()
+
+
+def parse_ndjson(body):
+    return [json.loads(line) for line in body.decode().splitlines()]
+
+
+class TestStreamPredictEndpoint:
+    """NDJSON stream prediction endpoint testleri"""
+
+    def test_predict_stream(self, client):
+        """Kayıtlar sırayla tahmin edilmeli, son satır özet olmalı"""
+        body = ndjson([{"value": 10}, {"value": 150}, {"value": 50}])
+        body += b"\n{bozuk json\n"
+        response = client.post(
+            "/predict/stream", data=body, content_type="application/x-ndjson"
+        )
+
+        assert response.status_code == 200
+        assert response.mimetype == "application/x-ndjson"
+        lines = parse_ndjson(response.get_data())
+        assert [line.get("index") for line in lines[:-1]] == [0, 1, 2, 3]
+        assert [line["status"] for line in lines[:-1]] == [
+            "success",
+            "error",
+            "success",
+            "error",
+        ]
+        assert lines[2]["prediction"] == 1.0
+        assert lines[3]["error"] == "Geçersiz JSON satırı"
+        assert lines[-1] == {
+            "status": "complete",
+            "count": 4,
+            "valid_count": 2,
+            "error_count": 2,
+        }
+
+    def test_predict_stream_wrong_content_type(self, client):
+        """NDJSON olmayan istekler reddedilmeli"""
+        response = client.post(
+            "/predict/stream", data=b"{}", content_type="application/json"
+        )
+
+        assert response.status_code == 400
+
+    def test_predict_stream_is_incremental(self, client, monkeypatch):
+        """Sonuçlar gövde tamamen okunmadan stream edilmeli"""
+        import app as app_module
+
+        monkeypatch.setattr(app_module, "STREAM_CHUNK_SIZE", 10)
+        input_stream = TrackingStream(ndjson([{"value": 42}] * 1000))
+        response = client.post(
+            "/predict/stream",
+            input_stream=input_stream,
+            content_type="application/x-ndjson",
+            buffered=False,
+        )
+
+        chunks = response.response
+        first_chunk = next(iter(chunks))
+        assert len(parse_ndjson(first_chunk)) == 10
+        assert input_stream.max_read < len(input_stream.getvalue()) / 10
+
+        rest = b"".join(chunks)
+        response.close()
+        lines = parse_ndjson(first_chunk + rest)
+        assert len(lines) == 1001
+        assert lines[-1]["valid_count"] == 1000
+
+    def test_predict_stream_line_too_long(self, client, monkeypatch):
+        """Limiti aşan satır hata döndürmeli, sonraki satırlar işlenmeli"""
+        import app as app_module
+
+        monkeypatch.setattr(app_module, "STREAM_MAX_LINE_BYTES", 32)
+        body = ndjson([{"value": 1, "name": "x" * 100}, {"value": 2}])
+        response = client.post(
+            "/predict/stream", data=body, content_type="application/x-ndjson"
+        )
+
+        lines = parse_ndjson(response.get_data())
+        assert lines[0]["status"] == "error"
+        assert lines[1]["status"] == "success"
+        assert lines[1]["input_value"] == 2
+
+
+class TestResponseCache:
+    """Response cache entegrasyon testleri"""
+
+    def test_cached_prediction(self, client, monkeypatch):
+        """Aynı value ikinci istekte cache'ten dönmeli"""
+        import app as app_module
+        from cache import ResponseCache
+
+        monkeypatch.setattr(app_module, "response_cache", ResponseCache(max_size=8))
+        initial_count = app_module.model.get_prediction_count()
+
+        test_data = {"value": 42}
+        first = client.post(
+            "/predict", data=json.dumps(test_data), content_type="application/json"
+        )
+        second = client.post(
+            "/predict", data=json.dumps(test_data), content_type="application/json"
+        )
+
+        assert second.status_code == 200
+        assert second.content_type == "application/json"
+        assert second.get_data() == first.get_data()
+        assert app_module.model.get_prediction_count() == initial_count + 1
+
+        stats = client.get("/metrics").get_json()["response_cache"]
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+
+        text = client.get("/metrics/prometheus").get_data(as_text=True)
+        assert "response_cache_hits_total 1" in text
+
+    def test_cache_disabled_by_default(self, client):
+        """Varsayılan olarak cache kapalı"""
+        data = client.get("/metrics").get_json()
+
+        assert data["response_cache"] is None
+
+
+class TestRequestCoalescing:
+    """Eşzamanlı aynı /predict isteklerinin birleştirilmesi"""
+
+    def test_concurrent_identical_requests_share_prediction(self, monkeypatch):
+        """Aynı anda gelen aynı istekler tek tahmin ve aynı response almalı"""
+        import app as app_module
+        from cache import SingleFlight
+
+        coalescer = SingleFlight()
+        monkeypatch.setattr(app_module, "request_coalescer", coalescer)
+        observed = []
+        monkeypatch.setattr(
+            app_module.traffic_router,
+            "observe",
+            lambda model, role, latency, data, prediction: observed.append(role),
+        )
+        total_before = app_module.SHARED_PREDICTIONS.value()
+        active = app_module.model_registry.active
+        original_predict = active.predict
+        release = threading.Event()
+        calls = []
+
+        def slow_predict(data):
+            calls.append(data)
+            release.wait(5)
+            return original_predict(data)
+
+        monkeypatch.setattr(active, "predict", slow_predict)
+        responses = []
+
+        def post():
+            with app.test_client() as thread_client:
+                responses.append(thread_client.post("/predict", json={"value": 63.5}))
+
+        threads = [threading.Thread(target=post) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        deadline = time.monotonic() + 5
+        while coalescer.followers.value() < 3 and time.monotonic() < deadline:
+            time.sleep(0.001)
+        release.set()
+        for thread in threads:
+            thread.join(5)
+
+        assert len(calls) == 1
+        assert [r.status_code for r in responses] == [200] * 4
+        assert len({r.get_data() for r in responses}) == 1
+        # Bekleyen istekler de servis edilen tahmin olarak sayılmalı
+        assert app_module.SHARED_PREDICTIONS.value() - total_before == 4
+        assert observed == ["primary"] * 4
+
+        with app.test_client() as client:
+            stats = client.get("/metrics").get_json()["coalescing"]
+            text = client.get("/metrics/prometheus").get_data(as_text=True)
+        assert stats["computations"] == 1
+        assert stats["coalesced"] == 3
+        assert stats["coalescing_ratio"] == 0.75
+        assert "predict_coalesced_requests_total 3" in text
+
+    def test_coalescing_disabled(self, client, monkeypatch):
+        """Birleştirme kapalıysa (varsayılan) istekler normal işlenmeli"""
+        import app as app_module
+
+        assert app_module.request_coalescer is None
+        monkeypatch.setattr(app_module, "request_coalescer", None)
+
+        response = client.post("/predict", json={"value": 11})
+
+        assert response.status_code == 200
+        assert client.get("/metrics").get_json()["coalescing"] is None
+
+
+class TestMicroBatching:
+    """/predict micro-batching entegrasyon testleri"""
+
+    def test_predict_through_micro_batcher(self, client, monkeypatch):
+        """Micro-batching açıkken /predict aynı response'u döndürmeli"""
+        import app as app_module
+        from batching import MicroBatcher
+
+        batcher = MicroBatcher(max_batch_size=8, max_wait=0.001)
+        monkeypatch.setattr(app_module, "micro_batcher", batcher)
+        try:
+            response = client.post("/predict", json={"value": 25})
+        finally:
+            batcher.stop(timeout=5)
+
+        assert response.status_code == 200
+        data = response.get_json()
+        assert data["prediction"] == 0.6667
+        assert data["input_value"] == 25
+
+        stats = client.get("/metrics").get_json()["micro_batching"]
+        assert stats["enabled"] is True
+        assert stats["batches"] == 1
+        assert stats["requests"] == 1
+
+    def test_micro_batching_disabled_by_default(self, client):
+        """Varsayılan olarak micro-batching kapalı"""
+        stats = client.get("/metrics").get_json()["micro_batching"]
+        text = client.get("/metrics/prometheus").get_data(as_text=True)
+
+        assert stats["enabled"] is False
+        assert "# TYPE predict_micro_batch_size histogram" in text
+        assert "# TYPE predict_micro_batch_queue_wait_seconds histogram" in text
+
+
+class TestSlowRequests:
+    """İstek süresi kaydı ve debug endpoint testleri"""
+
+    def test_requests_are_timed(self, client, monkeypatch):
+        """Tamamlanan istekler endpoint bazında kaydedilmeli"""
+        import app as app_module
+        from timing import RequestTimingRecorder
+
+        monkeypatch.setattr(
+            app_module,
+            "request_timings",
+            RequestTimingRecorder(slow_threshold_ms=0, sample_rate=1.0),
+        )
+        client.post(
+            "/predict", data=json.dumps({"value": 42}), content_type="application/json"
+        )
+
+        data = client.get("/debug/slow-requests").get_json()
+        assert data["threshold_ms"] == 0
+        assert data["endpoints"]["/predict"]["samples"] == 1
+        assert data["slow_requests"][0]["endpoint"] == "/predict"
+        assert data["slow_requests"][0]["method"] == "POST"
+        assert data["slow_requests"][0]["status"] == 200
+
+    def test_limit(self, client, monkeypatch):
+        """limit parametresi listeyi sınırlamalı"""
+        import app as app_module
+        from timing import RequestTimingRecorder
+
+        monkeypatch.setattr(
+            app_module,
+            "request_timings",
+            RequestTimingRecorder(slow_threshold_ms=0, sample_rate=1.0),
+        )
+        for _ in range(3):
+            client.get("/health")
+
+        data = client.get("/debug/slow-requests?limit=2").get_json()
+        assert len(data["slow_requests"]) == 2
+
+
+class TestAdmissionControl:
+    """Tahmin endpoint'lerinde hız/eşzamanlılık limiti ve hızlı red"""
+
+    @pytest.fixture
+    def limits(self, monkeypatch):
+        """Limitleri testte ayarlanabilen admission controller"""
+        import app as app_module
+        from admission import AdmissionController, ConcurrencyLimiter, RateLimiter
+
+        def configure(rate=0, burst=None, concurrency=0, max_queue_wait=0.0):
+            controller = AdmissionController(
+                RateLimiter(rate=rate, burst=burst or max(1, rate)),
+                ConcurrencyLimiter(limit=concurrency),
+                max_queue_wait=max_queue_wait,
+                retry_after=3,
+            )
+            monkeypatch.setattr(app_module, "admission", controller)
+            return controller
+
+        return configure
+
+    def test_rate_limit_returns_429(self, client, limits, monkeypatch):
+        """Token'ı biten istemci Retry-After ile 429 almalı"""
+        import app as app_module
+
+        monkeypatch.setattr(app_module, "API_KEYS", frozenset({"client-a", "b"}))
+        limits(rate=1, burst=2)
+        headers = {"X-API-Key": "client-a"}
+
+        statuses = [
+            client.post("/predict", json={"value": 1}, headers=headers).status_code
+            for _ in range(2)
+        ]
+        response = client.post("/predict", json={"value": 1}, headers=headers)
+
+        assert statuses == [200, 200]
+        assert response.status_code == 429
+        assert response.headers["Retry-After"] == "1"
+        assert response.get_json()["reason"] == "rate_limited"
+        # Başka istemci etkilenmemeli
+        other = client.post("/predict", json={"value": 1}, headers={"X-API-Key": "b"})
+        assert other.status_code == 200
+
+    def test_rotating_api_key_does_not_bypass_rate_limit(self, client, limits):
+        """Tanımsız X-API-Key değiştirmek limiti aşmamalı; limit IP bazında"""
+        limits(rate=1, burst=2)
+
+        statuses = [
+            client.post(
+                "/predict", json={"value": 1}, headers={"X-API-Key": f"key-{i}"}
+            ).status_code
+            for i in range(4)
+        ]
+        other_ip = client.post(
+            "/predict",
+            json={"value": 1},
+            headers={"X-API-Key": "key-9"},
+            environ_base={"REMOTE_ADDR": "10.0.0.2"},
+        )
+
+        assert statuses == [200, 200, 429, 429]
+        assert other_ip.status_code == 200
+
+    def test_concurrency_limit_returns_503(self, client, limits):
+        """Kapasite doluysa istek beklemeden 503 almalı, sağlık endpoint'i değil"""
+        controller = limits(concurrency=1)
+        assert controller.concurrency.acquire(0)
+        try:
+            response = client.post("/predict/batch", json=[{"value": 1}])
+            livez = client.get("/livez")
+        finally:
+            controller.concurrency.release()
+
+        assert response.status_code == 503
+        assert response.headers["Retry-After"] == "3"
+        assert response.get_json()["reason"] == "concurrency"
+        assert livez.status_code == 200
+
+    def test_queue_timeout_returns_503(self, client, limits):
+        """Proxy kuyruğunda çok bekleyen istek 503 almalı"""
+        limits(concurrency=1, max_queue_wait=0.1)
+
+        response = client.post(
+            "/predict",
+            json={"value": 1},
+            headers={"X-Request-Start": f"t={time.time() - 5:.3f}"},
+        )
+
+        assert response.status_code == 503
+        assert response.get_json()["reason"] == "queue_timeout"
+
+    def test_slot_released_after_request(self, client, limits):
+        """Kabul edilen isteğin yeri (stream dahil) istek bitince bırakılmalı"""
+        controller = limits(concurrency=1)
+
+        for _ in range(3):
+            assert client.post("/predict", json={"value": 1}).status_code == 200
+            response = client.post(
+                "/predict/stream",
+                data=ndjson([{"value": 1}, {"value": 2}]),
+                content_type="application/x-ndjson",
+            )
+            assert parse_ndjson(response.data)[-1]["status"] == "complete"
+
+        assert controller.concurrency.in_flight == 0
+
+    def test_shed_metrics(self, client, limits):
+        """Reddedilen istekler metriklerde sebep bazında sayılmalı"""
+        limits(rate=1, burst=1)
+        before = client.get("/metrics").get_json()["requests"]
+
+        for _ in range(3):
+            client.post("/predict", json={"value": 1}, headers={"X-API-Key": "x"})
+
+        data = client.get("/metrics").get_json()
+        text = client.get("/metrics/prometheus").get_data(as_text=True)
+        assert data["requests"]["shed"] == before["shed"] + 2
+        # Yük nedeniyle red hata sayılmamalı
+        assert data["requests"]["errors"] == before["errors"]
+        assert (
+            'http_requests_shed_total{endpoint="/predict",reason="rate_limited"}'
+            in text
+        )
+
+
+class TestMetricsHistory:
+    """Tahmin geçmişi endpoint testleri"""
+
+    def test_metrics_history(self, client):
+        """Son tahminler pencere istatistiklerinde görünmeli"""
+        import app as app_module
+
+        app_module.model.reset_stats()
+        client.post(
+            "/predict/batch",
+            data=json.dumps([{"value": 50}, {"value": 10}, {"value": 0}]),
+            content_type="application/json",
+        )
+
+        response = client.get("/metrics/history")
+
+        assert response.status_code == 200
+        data = response.get_json()
+        last_minute = data["windows"]["1m"]
+        assert data["size"] == 3
+        assert last_minute["count"] == 3
+        assert last_minute["categories"] == {"high": 1, "medium": 2, "low": 0}
+        assert last_minute["mean_value"] == 20
+
+
+class TestModelAdmin:
+    """Model registry admin endpoint testleri"""
+
+    @pytest.fixture
+    def admin(self, monkeypatch):
+        """Admin token'ı ayarla, test sonunda varsayılan modele dön"""
+        import app as app_module
+
+        monkeypatch.setattr(app_module, "ADMIN_TOKEN", "secret")
+        yield {"Authorization": "Bearer secret"}
+        app_module.model_registry.activate("1.0.0")
+
+    def test_admin_disabled_without_token(self, client):
+        """ADMIN_TOKEN yoksa admin endpoint'leri kapalı olmalı"""
+        response = client.get("/admin/models")
+
+        assert response.status_code == 404
+
+    def test_admin_requires_token(self, client, admin):
+        """Yanlış token reddedilmeli"""
+        response = client.get(
+            "/admin/models", headers={"Authorization": "Bearer wrong"}
+        )
+
+        assert response.status_code == 401
+
+    def test_hot_swap(self, client, admin, monkeypatch):
+        """Yeni versiyon aktif olunca tahminler onunla yapılmalı, cache temizlenmeli"""
+        import app as app_module
+        from cache import ResponseCache
+
+        monkeypatch.setattr(app_module, "response_cache", ResponseCache(max_size=8))
+        test_data = json.dumps({"value": 42})
+        client.post("/predict", data=test_data, content_type="application/json")
+
+        response = client.post(
+            "/admin/models", json={"version": "2.0.0"}, headers=admin
+        )
+
+        assert response.status_code == 200
+        assert response.get_json()["active"] == "2.0.0"
+        assert response.get_json()["previous"] == "1.0.0"
+        assert len(app_module.response_cache) == 0
+
+        data = client.post(
+            "/predict", data=test_data, content_type="application/json"
+        ).get_json()
+        assert data["model_version"] == "2.0.0"
+        assert client.get("/metrics").get_json()["model_version"] == "2.0.0"
+
+        listed = client.get("/admin/models", headers=admin).get_json()
+        assert listed["active"] == "2.0.0"
+
+    def test_load_without_activate_and_unload(self, client, admin):
+        """Yüklenen ama aktif olmayan versiyon çıkarılabilmeli"""
+        response = client.post(
+            "/admin/models", json={"version": "1.5.0", "activate": False}, headers=admin
+        )
+        assert response.status_code == 200
+        assert response.get_json()["active"] == "1.0.0"
+
+        assert client.delete("/admin/models/1.0.0", headers=admin).status_code == 409
+        assert client.delete("/admin/models/1.5.0", headers=admin).status_code == 200
+        assert client.delete("/admin/models/1.5.0", headers=admin).status_code == 404
+
+    def test_canary_routing(self, client, admin):
+        """%100 canary'de tahminler aday modelle yapılmalı, aktif model değişmemeli"""
+        import app as app_module
+
+        try:
+            response = client.put(
+                "/admin/routing",
+                json={"candidate": "1.1.0", "canary_percent": 100},
+                headers=admin,
+            )
+            assert response.status_code == 200
+            assert response.get_json()["candidate"] == "1.1.0"
+
+            data = client.post(
+                "/predict",
+                data=json.dumps({"value": 42}),
+                content_type="application/json",
+            ).get_json()
+            assert data["model_version"] == "1.1.0"
+            assert app_module.model_registry.active_version == "1.0.0"
+        finally:
+            app_module.traffic_router.configure(None)
+
+        routing = client.get("/admin/routing", headers=admin).get_json()
+        assert routing["candidate"] is None
+
+    def test_invalid_routing(self, client, admin):
+        """Geçersiz yönlendirme ayarı reddedilmeli"""
+        response = client.put(
+            "/admin/routing",
+            json={"candidate": "1.1.0", "canary_percent": 150},
+            headers=admin,
+        )
+
+        assert response.status_code == 400
+
+    def test_missing_version(self, client, admin):
+        """version alanı zorunlu"""
+        response = client.post("/admin/models", json={}, headers=admin)
+
+        assert response.status_code == 400
+
+
+class TestPrometheusEndpoint:
+    """Prometheus metrik endpoint testleri"""
+
+    def test_prometheus_content_type(self, client):
+        """Text exposition formatı dönmeli"""
+        response = client.get("/metrics/prometheus")
+
+        assert response.status_code == 200
+        assert response.content_type.startswith("text/plain")
+        assert "version=0.0.4" in response.content_type
+
+    def test_prometheus_request_counts(self, client):
+        """Endpoint/status bazında istek sayıları ve latency"""
+        client.post(
+            "/predict", data=json.dumps({"value": 50}), content_type="application/json"
+        )
+        client.get("/nonexistent")
+
+        text = client.get("/metrics/prometheus").get_data(as_text=True)
+
+        assert (
+            'http_requests_total{endpoint="/predict",method="POST",status="200"}'
+            in text
+        )
+        assert (
+            'http_requests_total{endpoint="unmatched",method="GET",status="404"}'
+            in (text)
+        )
+        assert 'prediction_latency_seconds_bucket{endpoint="/predict",le="+Inf"}' in (
+            text
+        )
+        assert "http_requests_in_flight" in text
+        assert "model_predictions_total" in text
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="fork gerekli")
+    def test_prometheus_container_totals(self, client):
+        """Prometheus metrikleri tüm worker'ların toplamını göstermeli"""
+        import app as app_module
+
+        def failures():
+            text = client.get("/metrics/prometheus").get_data(as_text=True)
+            line = 'validation_failures_total{reason="value_range"} '
+            return next(
+                (
+                    int(row[len(line) :])
+                    for row in text.splitlines()
+                    if row.startswith(line)
+                ),
+                0,
+            )
+
+        before = failures()
+        shared_metrics = app_module.shared_metrics
+        slot = shared_metrics.reserve_slot()
+        pid = os.fork()
+        if pid == 0:
+            # Başka bir worker
+            shared_metrics.attach(slot)
+            with app.test_client() as worker_client:
+                for _ in range(3):
+                    worker_client.post("/predict", json={"value": 150})
+            os._exit(0)
+        os.waitpid(pid, 0)
+
+        assert failures() == before + 3
+        shared_metrics.retire(slot, pid)
+        assert failures() == before + 3
+
+    def test_prometheus_validation_failures(self, client):
+        """Validasyon hataları sebep bazında sayılmalı"""
+        client.post(
+            "/predict", data=json.dumps({"value": 150}), content_type="application/json"
+        )
+        client.post("/predict", data="not json")
+
+        text = client.get("/metrics/prometheus").get_data(as_text=True)
+
+        assert 'validation_failures_total{reason="value_range"}' in text
+        assert 'validation_failures_total{reason="content_type"}' in text
+
+
 class TestHomeEndpointExtended:
     """Genişletilmiş ana sayfa testleri"""
 
@@ -289,13 +1163,23 @@ class TestApplicationIntegration:
 
     def test_concurrent_predictions(self, client):
         """Eşzamanlı tahmin testleri"""
+        from concurrent.futures import ThreadPoolExecutor
+
         test_values = [10, 30, 50, 70, 90]
 
-        for value in test_values:
-            test_data = {"value": value}
-            response = client.post(
-                "/predict", data=json.dumps(test_data), content_type="application/json"
-            )
+        def predict(value):
+            # Her thread kendi test client'ını kullanır
+            with app.test_client() as thread_client:
+                return thread_client.post(
+                    "/predict",
+                    data=json.dumps({"value": value}),
+                    content_type="application/json",
+                )
+
+        with ThreadPoolExecutor(max_workers=len(test_values)) as executor:
+            responses = list(executor.map(predict, test_values * 4))
+
+        for response in responses:
             assert response.status_code == 200
             data = response.get_json()
             assert "prediction" in data
@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+ASGI Uygulaması Testleri - CI/CD Pipeline için
+"""
+
+import asyncio
+import json
+import os
+import sys
+
+# Src dizinini path'e ekle
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import asgi  # noqa: E402
+
+
+def call_asgi(method, path, body=b"", headers=None):
+    """ASGI uygulamasını çağır, (status, headers, body) döndür"""
+    scope = {
+        "type": "http",
+        "method": method,
+        "path": path,
+        "query_string": b"",
+        "headers": headers or [],
+        "http_version": "1.1",
+    }
+    messages = [{"type": "http.request", "body": body, "more_body": False}]
+    sent = []
+
+    async def receive():
+        return messages.pop(0)
+
+    async def send(message):
+        sent.append(message)
+
+    asyncio.run(asgi.app(scope, receive, send))
+    start = sent[0]
+    body = b"".join(message["body"] for message in sent[1:])
+    return start["status"], dict(start["headers"]), body
+
+
+class TestAsgiApp:
+    """ASGI uygulama testleri"""
+
+    def test_health_report(self, monkeypatch):
+        """/health snapshot ve ısıtma durumunu raporlamalı, probe çalıştırmamalı"""
+        from app import health_monitor
+
+        calls = []
+
+        def probe():
+            calls.append(1)
+            return True
+
+        monkeypatch.setattr(
+            health_monitor, "probes", {"database": probe, "cache": probe}
+        )
+        monkeypatch.setattr(health_monitor, "_snapshot", None)
+        health_monitor.refresh()
+
+        status, headers, body = call_asgi("GET", "/health")
+        call_asgi("GET", "/health")
+        data = json.loads(body)
+
+        assert status == 200
+        assert headers[b"content-type"] == b"application/json"
+        assert set(data["dependencies"]["checks"]) == {"database", "cache"}
+        assert data["model_loaded"] is True
+        assert "model_warmed_up" in data
+        assert len(calls) == 2  # sadece refresh
+
+    def test_health_unhealthy_dependency(self, monkeypatch):
+        """Snapshot'ta bağımlılık hatası 503 döndürmeli"""
+        from app import health_monitor
+
+        monkeypatch.setattr(health_monitor, "probes", {"cache": lambda: False})
+        monkeypatch.setattr(health_monitor, "_snapshot", None)
+        health_monitor.refresh()
+
+        status, _, body = call_asgi("GET", "/health")
+
+        assert status == 503
+        assert json.loads(body)["status"] == "unhealthy"
+
+    def test_predict_proxied_to_flask(self):
+        """Diğer endpoint'ler Flask'e aktarılmalı"""
+        status, _, body = call_asgi(
+            "POST",
+            "/predict",
+            body=json.dumps({"value": 50}).encode(),
+            headers=[(b"content-type", b"application/json")],
+        )
+
+        assert status == 200
+        assert json.loads(body)["prediction"] == 1.0
+
+    def test_stream_is_not_buffered(self, monkeypatch):
+        """/predict/stream çıktısı istek gövdesinin tamamı beklenmeden gelmeli"""
+        import app as app_module
+
+        monkeypatch.setattr(app_module, "STREAM_CHUNK_SIZE", 2)
+        line = json.dumps({"value": 50}).encode() + b"\n"
+        scope = {
+            "type": "http",
+            "method": "POST",
+            "path": "/predict/stream",
+            "query_string": b"",
+            "headers": [(b"content-type", b"application/x-ndjson")],
+            "http_version": "1.1",
+        }
+
+        async def scenario():
+            first_result = asyncio.Event()
+            received = []
+            sent = []
+
+            async def receive():
+                received.append(1)
+                if len(received) == 3:
+                    # İlk iki kaydın sonucu gelmeden gövdenin kalanı gönderilmez
+                    await asyncio.wait_for(first_result.wait(), 5)
+                    return {"type": "http.request", "body": line * 2}
+                return {"type": "http.request", "body": line, "more_body": True}
+
+            async def send(message):
+                sent.append(message)
+                if message.get("body"):
+                    first_result.set()
+
+            await asyncio.wait_for(asgi.app(scope, receive, send), 10)
+            return sent
+
+        sent = asyncio.run(scenario())
+
+        assert sent[0]["status"] == 200
+        bodies = [message for message in sent[1:] if message["body"]]
+        assert len(bodies) == 3
+        assert all(message["more_body"] for message in bodies)
+        assert sent[-1] == {"type": "http.response.body", "body": b""}
+        lines = b"".join(message["body"] for message in bodies).splitlines()
+        assert [json.loads(row)["prediction"] for row in lines[:4]] == [1.0] * 4
+        assert json.loads(lines[-1])["count"] == 4
+
+    def test_not_found_proxied(self):
+        """Olmayan endpoint Flask 404 döndürmeli"""
+        status, _, body = call_asgi("GET", "/nonexistent")
+
+        assert status == 404
+        assert json.loads(body)["status"] == "error"
+
+    def test_lifespan(self):
+        """Lifespan startup/shutdown"""
+        messages = [{"type": "lifespan.startup"}, {"type": "lifespan.shutdown"}]
+        sent = []
+
+        async def receive():
+            return messages.pop(0)
+
+        async def send(message):
+            sent.append(message["type"])
+
+        asyncio.run(asgi.app({"type": "lifespan"}, receive, send))
+
+        assert sent == ["lifespan.startup.complete", "lifespan.shutdown.complete"]
+
+    def test_lifespan_keeps_readiness_fresh(self, monkeypatch):
+        """Lifespan health monitor'ü başlatmalı; /readyz HEALTH_MAX_AGE sonrası 200"""
+        from app import health_monitor, model_warmup
+
+        monkeypatch.setattr(health_monitor, "probes", {"cache": lambda: True})
+        monkeypatch.setattr(health_monitor, "interval", 0.02)
+        monkeypatch.setattr(health_monitor, "max_age", 0.1)
+        monkeypatch.setattr(health_monitor, "_snapshot", None)
+        model_warmup.reset()
+
+        async def scenario():
+            shutdown = asyncio.Event()
+            messages = [{"type": "lifespan.startup"}, {"type": "lifespan.shutdown"}]
+            sent = []
+
+            async def receive():
+                if len(messages) == 1:
+                    await shutdown.wait()
+                return messages.pop(0)
+
+            async def send(message):
+                sent.append(message["type"])
+
+            lifespan = asyncio.create_task(
+                asgi.app({"type": "lifespan"}, receive, send)
+            )
+            while not sent:
+                await asyncio.sleep(0.01)
+            assert health_monitor.is_running()
+            assert await asyncio.to_thread(model_warmup.wait, 5)
+
+            # max_age'in birkaç katı bekle
+            await asyncio.sleep(0.3)
+            status, _, body = await asyncio.to_thread(call_asgi, "GET", "/readyz")
+
+            shutdown.set()
+            await lifespan
+            return status, json.loads(body), sent
+
+        try:
+            status, data, sent = asyncio.run(scenario())
+        finally:
+            model_warmup.reset()
+
+        assert status == 200
+        assert data["checks"]["dependencies"] is True
+        assert sent == ["lifespan.startup.complete", "lifespan.shutdown.complete"]
+        assert not health_monitor.is_running()
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Offline Toplu Tahmin Testleri - CI/CD Pipeline için
+"""
+
+import csv
+import io
+import json
+import os
+import sys
+
+import pytest
+
+# Src dizinini path'e ekle
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from batch_score import (  # noqa: E402
+    detect_format,
+    main,
+    read_records,
+    score_file,
+)
+
+
+@pytest.fixture
+def csv_file(tmp_path):
+    path = tmp_path / "input.csv"
+    path.write_text("value,name\n10,Ali\n150,Veli\n50,\n,Ayşe\n", encoding="utf-8")
+    return str(path)
+
+
+@pytest.fixture
+def ndjson_file(tmp_path):
+    path = tmp_path / "input.ndjson"
+    lines = [json.dumps({"value": i % 120}) for i in range(250)]
+    lines.insert(3, "{bozuk")
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return str(path)
+
+
+def parse_ndjson(text):
+    return [json.loads(line) for line in text.splitlines()]
+
+
+class TestReadRecords:
+    """Girdi okuma testleri"""
+
+    def test_detect_format(self):
+        """Format uzantıdan tespit edilmeli"""
+        assert detect_format("a.CSV", ("csv", "ndjson")) == "csv"
+        assert detect_format("a.jsonl", ("csv", "ndjson")) == "ndjson"
+        assert detect_format("a.txt", ("csv", "ndjson")) is None
+
+    def test_csv_chunks(self, csv_file):
+        """CSV parçalar halinde okunmalı, boş hücreler eksik alan sayılmalı"""
+        chunks = list(read_records(csv_file, "csv", chunk_size=3))
+
+        assert [len(chunk) for chunk in chunks] == [3, 1]
+        assert chunks[0][2] == {"value": "50"}
+        assert chunks[1][0] == {"name": "Ayşe"}
+
+
+class TestScoreFile:
+    """Dosya tahmin testleri"""
+
+    def test_csv_to_ndjson(self, csv_file):
+        """Sonuçlar girdi sırasıyla ve hatalar yerinde yazılmalı"""
+        output = io.StringIO()
+        summary = score_file(csv_file, output, "csv", chunk_size=2)
+
+        results = parse_ndjson(output.getvalue())
+        assert [result["index"] for result in results] == [0, 1, 2, 3]
+        assert [result["status"] for result in results] == [
+            "success",
+            "error",
+            "success",
+            "success",
+        ]
+        assert results[2]["prediction"] == 1.0
+        assert summary["records"] == 4
+        assert summary["valid"] == 3
+        assert summary["errors"] == 1
+
+    def test_ndjson_to_csv(self, ndjson_file):
+        """CSV çıktısı başlık ve her kayıt için bir satır içermeli"""
+        output = io.StringIO()
+        score_file(ndjson_file, output, "ndjson", "csv", chunk_size=100)
+
+        rows = list(csv.DictReader(io.StringIO(output.getvalue())))
+        assert len(rows) == 251
+        assert rows[3]["status"] == "error"
+        assert rows[3]["error"] == "Geçersiz JSON satırı"
+        assert rows[4]["input_value"] == "3"
+
+    def test_process_pool_preserves_order(self, ndjson_file):
+        """Process pool ile sonuçlar tek process ile aynı sırada olmalı"""
+        single, pooled = io.StringIO(), io.StringIO()
+        score_file(ndjson_file, single, "ndjson", chunk_size=10, workers=1)
+        summary = score_file(ndjson_file, pooled, "ndjson", chunk_size=10, workers=2)
+
+        def key(result):
+            return result["index"], result["status"], result.get("prediction")
+
+        assert [key(r) for r in parse_ndjson(pooled.getvalue())] == [
+            key(r) for r in parse_ndjson(single.getvalue())
+        ]
+        assert summary["records"] == 251
+
+    def test_parquet(self, tmp_path):
+        """Parquet girdisi (pyarrow yüklüyse)"""
+        pa = pytest.importorskip("pyarrow")
+        pq = pytest.importorskip("pyarrow.parquet")
+        path = str(tmp_path / "input.parquet")
+        pq.write_table(pa.table({"value": [10, 50, None]}), path)
+
+        output = io.StringIO()
+        summary = score_file(path, output, "parquet", chunk_size=2)
+
+        assert summary["valid"] == 3
+        assert parse_ndjson(output.getvalue())[1]["prediction"] == 1.0
+
+
+class TestMain:
+    """Komut satırı testleri"""
+
+    def test_main_writes_output(self, csv_file, tmp_path, capsys):
+        """Çıktı dosyaya yazılmalı, özet stderr'e"""
+        output_path = tmp_path / "results.ndjson"
+        exit_code = main([csv_file, "-o", str(output_path), "--workers", "1"])
+
+        assert exit_code == 0
+        assert len(parse_ndjson(output_path.read_text(encoding="utf-8"))) == 4
+        assert json.loads(capsys.readouterr().err)["records"] == 4
+
+    def test_main_unknown_format(self, tmp_path):
+        """Tespit edilemeyen format hata kodu döndürmeli"""
+        path = tmp_path / "input.txt"
+        path.write_text("")
+
+        assert main([str(path)]) == 2
@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+Micro-Batching Testleri - CI/CD Pipeline için
+"""
+
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+# Src dizinini path'e ekle
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from batching import MicroBatcher  # noqa: E402
+from model import SimpleModel  # noqa: E402
+
+
+class BlockingModel:
+    """İlk predict_batch çağrısında bekleyen, batch boyutlarını kaydeden model"""
+
+    def __init__(self, error=None):
+        self.batches = []
+        self.started = threading.Event()
+        self.release = threading.Event()
+        self.error = error
+
+    def predict(self, data):
+        return {"prediction": data["value"], "batched": False}
+
+    def predict_batch(self, records):
+        self.batches.append(len(records))
+        if len(self.batches) == 1:
+            self.started.set()
+            self.release.wait(5)
+        if self.error is not None:
+            raise self.error
+        return [{"prediction": record["value"]} for record in records]
+
+
+@pytest.fixture
+def batcher():
+    """Testten sonra worker thread'i durdurulan batcher"""
+    created = []
+
+    def factory(**kwargs):
+        created.append(MicroBatcher(**kwargs))
+        return created[-1]
+
+    yield factory
+    for instance in created:
+        instance.stop(timeout=5)
+
+
+def submit(batcher, model, values, results):
+    """Her value için ayrı thread'de predict çağır"""
+    threads = []
+    for value in values:
+
+        def call(value=value):
+            try:
+                results[value] = batcher.predict(model, {"value": value})
+            except Exception as e:
+                results[value] = e
+
+        threads.append(threading.Thread(target=call))
+        threads[-1].start()
+    return threads
+
+
+def wait_for_queue(batcher, size):
+    """Kuyrukta size kadar istek birikmesini bekle"""
+    deadline = time.monotonic() + 5
+    while batcher.stats()["pending"] < size and time.monotonic() < deadline:
+        time.sleep(0.001)
+
+
+class TestMicroBatcher:
+    """Micro-batcher testleri"""
+
+    def test_disabled_calls_predict_directly(self, batcher):
+        """max_batch_size <= 1 ise model.predict kullanılmalı"""
+        model = BlockingModel()
+
+        result = batcher(max_batch_size=0).predict(model, {"value": 3})
+
+        assert result == {"prediction": 3, "batched": False}
+        assert model.batches == []
+
+    def test_queued_requests_share_one_batch(self, batcher):
+        """Worker meşgulken gelen istekler tek predict_batch'te işlenmeli"""
+        model = BlockingModel()
+        micro = batcher(max_batch_size=8, max_wait=0.001)
+        results = {}
+
+        threads = submit(micro, model, [0], results)
+        model.started.wait(5)
+        threads += submit(micro, model, [1, 2, 3, 4, 5], results)
+        wait_for_queue(micro, 5)
+        model.release.set()
+        for thread in threads:
+            thread.join(5)
+
+        assert model.batches == [1, 5]
+        assert results == {value: {"prediction": value} for value in range(6)}
+        stats = micro.stats()
+        assert stats["batches"] == 2
+        assert stats["requests"] == 6
+        assert stats["mean_batch_size"] == 3.0
+        assert stats["mean_queue_wait_ms"] > 0
+
+    def test_max_batch_size(self, batcher):
+        """Batch boyutu max_batch_size'ı aşmamalı"""
+        model = BlockingModel()
+        micro = batcher(max_batch_size=4, max_wait=0.001)
+        results = {}
+
+        threads = submit(micro, model, [0], results)
+        model.started.wait(5)
+        threads += submit(micro, model, range(1, 11), results)
+        wait_for_queue(micro, 10)
+        model.release.set()
+        for thread in threads:
+            thread.join(5)
+
+        assert model.batches == [1, 4, 4, 2]
+        assert len(results) == 11
+
+    def test_error_reaches_every_waiter(self, batcher):
+        """predict_batch hatası batch'teki tüm isteklere iletilmeli"""
+        model = BlockingModel(error=ValueError("bozuk"))
+        micro = batcher(max_batch_size=8, max_wait=0.001)
+        results = {}
+
+        threads = submit(micro, model, [0], results)
+        model.started.wait(5)
+        threads += submit(micro, model, [1, 2], results)
+        wait_for_queue(micro, 2)
+        model.release.set()
+        for thread in threads:
+            thread.join(5)
+
+        assert all(isinstance(result, ValueError) for result in results.values())
+        # Hata worker thread'ini durdurmamalı
+        model.error = None
+        assert micro.predict(model, {"value": 7}) == {"prediction": 7}
+
+    def test_models_are_scored_separately(self, batcher):
+        """Farklı model versiyonlarının kayıtları ayrı batch'lerde işlenmeli"""
+        blocking, first, second = BlockingModel(), BlockingModel(), BlockingModel()
+        first.batches.append(0)  # ilk çağrıda bekleme yapmasın
+        second.batches.append(0)
+        micro = batcher(max_batch_size=8, max_wait=0.001)
+        results = {}
+
+        threads = submit(micro, blocking, [0], results)
+        blocking.started.wait(5)
+        threads += submit(micro, first, [1, 2], results)
+        threads += submit(micro, second, [3], results)
+        wait_for_queue(micro, 3)
+        blocking.release.set()
+        for thread in threads:
+            thread.join(5)
+
+        assert first.batches == [0, 2]
+        assert second.batches == [0, 1]
+        assert results[3] == {"prediction": 3}
+
+    def test_matches_single_predictions(self, batcher):
+        """Batch tahminleri tekil predict ile aynı olmalı"""
+        model = SimpleModel()
+        micro = batcher(max_batch_size=16, max_wait=0.001)
+        results = {}
+
+        for thread in submit(micro, model, [0, 12.5, 50, 99.9, 100], results):
+            thread.join(5)
+
+        for value, result in results.items():
+            assert result["prediction"] == model.predict({"value": value})["prediction"]
+            assert result["model_version"] == model.get_version()
+
+    def test_stop_restarts_on_next_request(self, batcher):
+        """Durdurulan batcher sonraki istekte yeniden başlamalı"""
+        model = SimpleModel()
+        micro = batcher(max_batch_size=4, max_wait=0.001)
+
+        micro.predict(model, {"value": 10})
+        micro.stop(timeout=5)
+
+        assert micro.predict(model, {"value": 10})["prediction"] == 0.5556
+        assert micro.stats()["requests"] == 2
+
+    def test_invalid_settings(self):
+        """Negatif ayarlar reddedilmeli"""
+        with pytest.raises(ValueError):
+            MicroBatcher(max_batch_size=-1)
+        with pytest.raises(ValueError):
+            MicroBatcher(max_batch_size=4, max_wait=-0.001)
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Response Cache Testleri - CI/CD Pipeline için
+"""
+
+import os
+import sys
+import threading
+import time
+
+# Src dizinini path'e ekle
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import pytest  # noqa: E402
+from cache import ResponseCache, SingleFlight, make_cache_key  # noqa: E402
+
+
+class TestCacheKey:
+    """Cache anahtarı testleri"""
+
+    def test_key_for_value(self):
+        """Aynı value aynı anahtarı üretmeli"""
+        assert make_cache_key({"value": 50}) == make_cache_key(
+            {"value": 50, "name": "Test User"}
+        )
+
+    def test_key_includes_type(self):
+        """Farklı tiplerde value farklı anahtar üretmeli"""
+        assert make_cache_key({"value": 50}) != make_cache_key({"value": 50.0})
+        assert make_cache_key({"value": 50}) != make_cache_key({"value": "50"})
+        assert make_cache_key({"value": 1}) != make_cache_key({"value": True})
+
+    def test_key_without_value(self):
+        """Value olmayan payload cache'lenmemeli"""
+        assert make_cache_key({}) is None
+        assert make_cache_key({"name": "Test"}) is None
+        assert make_cache_key(None) is None
+
+
+class TestResponseCache:
+    """LRU/TTL cache testleri"""
+
+    def test_get_put(self):
+        """Hit ve miss sayımı"""
+        cache = ResponseCache(max_size=2)
+
+        assert cache.get("a") is None
+        cache.put("a", b"1")
+        assert cache.get("a") == b"1"
+
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["size"] == 1
+
+    def test_lru_eviction(self):
+        """En az kullanılan kayıt çıkarılmalı"""
+        cache = ResponseCache(max_size=2)
+        cache.put("a", b"1")
+        cache.put("b", b"2")
+        cache.get("a")  # 'a' en son kullanılan olur
+        cache.put("c", b"3")
+
+        assert cache.get("b") is None
+        assert cache.get("a") == b"1"
+        assert cache.get("c") == b"3"
+        assert cache.stats()["evictions"] == 1
+
+    def test_ttl_expiry(self):
+        """Süresi dolan kayıt dönmemeli"""
+        cache = ResponseCache(max_size=2, ttl_seconds=0.01)
+        cache.put("a", b"1")
+        time.sleep(0.02)
+
+        assert cache.get("a") is None
+        assert cache.stats()["expired"] == 1
+        assert len(cache) == 0
+
+    def test_clear(self):
+        """Cache temizleme"""
+        cache = ResponseCache()
+        cache.put("a", b"1")
+        cache.clear()
+
+        assert len(cache) == 0
+
+
+class TestSingleFlight:
+    """Eşzamanlı aynı hesaplamaların birleştirilmesi"""
+
+    def _start_followers(self, flight, key, count, results):
+        """Leader hesaplarken aynı anahtarla bekleyen thread'ler başlat"""
+        threads = [
+            threading.Thread(
+                target=lambda: results.append(flight.do(key, lambda: "tekrar"))
+            )
+            for _ in range(count)
+        ]
+        for thread in threads:
+            thread.start()
+        deadline = time.monotonic() + 5
+        while flight.followers.value() < count and time.monotonic() < deadline:
+            time.sleep(0.001)
+        return threads
+
+    def test_concurrent_calls_share_result(self):
+        """Hesaplama sürerken gelen çağrılar aynı sonucu almalı"""
+        flight = SingleFlight()
+        release = threading.Event()
+        results = []
+        calls = []
+
+        def compute():
+            calls.append(1)
+            release.wait(5)
+            return b"sonuc"
+
+        leader = threading.Thread(
+            target=lambda: results.append(flight.do("k", compute))
+        )
+        leader.start()
+        while not calls:
+            time.sleep(0.001)
+        followers = self._start_followers(flight, "k", 3, results)
+        release.set()
+        for thread in [leader, *followers]:
+            thread.join(5)
+
+        assert len(calls) == 1
+        assert (
+            sorted(results, key=lambda r: r[1])
+            == [(b"sonuc", False)] + [(b"sonuc", True)] * 3
+        )
+        stats = flight.stats()
+        assert stats["computations"] == 1
+        assert stats["coalesced"] == 3
+        assert stats["coalescing_ratio"] == 0.75
+        assert stats["in_flight"] == 0
+
+    def test_error_is_shared(self):
+        """Leader'ın hatası bekleyenlere de iletilmeli"""
+        flight = SingleFlight()
+        release = threading.Event()
+        started = threading.Event()
+        errors = []
+
+        def compute():
+            started.set()
+            release.wait(5)
+            raise ValueError("bozuk")
+
+        def call(function):
+            try:
+                flight.do("k", function)
+            except ValueError as e:
+                errors.append(str(e))
+
+        leader = threading.Thread(target=call, args=(compute,))
+        leader.start()
+        started.wait(5)
+        follower = threading.Thread(target=call, args=(lambda: "tekrar",))
+        follower.start()
+        while flight.followers.value() < 1:
+            time.sleep(0.001)
+        release.set()
+        leader.join(5)
+        follower.join(5)
+
+        assert errors == ["bozuk", "bozuk"]
+        assert flight.stats()["in_flight"] == 0
+
+    def test_sequential_calls_are_not_coalesced(self):
+        """Sonuç saklanmaz; biten hesaplamadan sonra yeniden hesaplanır"""
+        flight = SingleFlight()
+
+        assert flight.do("k", lambda: 1) == (1, False)
+        assert flight.do("k", lambda: 2) == (2, False)
+        assert flight.stats()["coalesced"] == 0
+
+    def test_key_released_after_error(self):
+        """Hata sonrası anahtar serbest kalmalı"""
+        flight = SingleFlight()
+
+        with pytest.raises(RuntimeError):
+            flight.do("k", lambda: (_ for _ in ()).throw(RuntimeError("x")))
+
+        assert flight.do("k", lambda: "ok") == ("ok", False)
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Arka Plan Sağlık Kontrolü Testleri - CI/CD Pipeline için
+"""
+
+import os
+import sys
+import threading
+import time
+
+# Src dizinini path'e ekle
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from health import HealthMonitor  # noqa: E402
+
+
+class TestHealthMonitor:
+    """HealthMonitor testleri"""
+
+    def test_no_snapshot_before_refresh(self):
+        """İlk kontrolden önce snapshot yok"""
+        monitor = HealthMonitor(probes={"db": lambda: True})
+
+        assert monitor.snapshot() is None
+
+    def test_refresh(self):
+        """Refresh probe sonuçlarını saklamalı"""
+        monitor = HealthMonitor(probes={"db": lambda: True, "api": lambda: False})
+
+        monitor.refresh()
+        snapshot = monitor.snapshot()
+
+        assert snapshot["checks"]["db"]["healthy"] is True
+        assert snapshot["checks"]["api"]["healthy"] is False
+        assert snapshot["stale"] is False
+        assert snapshot["age_seconds"] >= 0
+
+    def test_stale_snapshot(self):
+        """max_age'i aşan snapshot stale olmalı"""
+        monitor = HealthMonitor(probes={"db": lambda: True}, max_age=0.01)
+
+        monitor.refresh()
+        time.sleep(0.02)
+
+        assert monitor.snapshot()["stale"] is True
+
+    def test_background_refresh(self):
+        """Arka plan thread'i snapshot'ı periyodik yenilemeli"""
+        calls = []
+
+        def probe():
+            calls.append(1)
+            return True
+
+        monitor = HealthMonitor(probes={"db": probe}, interval=0.01)
+        monitor.start()
+        try:
+            deadline = time.monotonic() + 2
+            while len(calls) < 3 and time.monotonic() < deadline:
+                time.sleep(0.01)
+            assert monitor.is_running()
+        finally:
+            monitor.stop(timeout=1)
+
+        assert len(calls) >= 3
+        assert monitor.snapshot() is not None
+        assert not monitor.is_running()
+
+    def test_hanging_probe_times_out(self):
+        """Takılan probe refresh'i timeout'tan uzun bloklamamalı"""
+        release = threading.Event()
+        calls = []
+
+        def hanging_probe():
+            calls.append(1)
+            release.wait(5)
+            return True
+
+        monitor = HealthMonitor(
+            probes={"slow": hanging_probe, "db": lambda: True}, timeout=0.05
+        )
+        try:
+            start = time.monotonic()
+            checks = monitor.refresh()
+            monitor.refresh()
+
+            assert time.monotonic() - start < 1
+            assert checks["slow"]["healthy"] is False
+            assert "timeout" in checks["slow"]["error"]
+            assert checks["db"]["healthy"] is True
+            # Bitmemiş probe yeniden başlatılmaz
+            assert len(calls) == 1
+        finally:
+            release.set()
+            monitor.stop(timeout=1)
+
+    def test_probe_error(self):
+        """Hata veren probe unhealthy ve hata mesajıyla raporlanmalı"""
+
+        def failing_probe():
+            raise ConnectionError("bağlantı reddedildi")
+
+        monitor = HealthMonitor(probes={"db": failing_probe})
+
+        checks = monitor.refresh()
+
+        assert checks["db"] == {"healthy": False, "error": "bağlantı reddedildi"}
+
+    def test_async_probe(self):
+        """Async probe'lar da çalıştırılmalı"""
+
+        async def probe():
+            return True
+
+        monitor = HealthMonitor(probes={"db": probe})
+
+        assert monitor.refresh()["db"]["healthy"] is True
+
+    def test_informational_probes_do_not_gate_readiness(self):
+        """Informational probe'lar is_ready'yi etkilememeli"""
+        monitor = HealthMonitor(
+            probes={"db": lambda: True, "simulated": lambda: False},
+            informational=frozenset({"simulated"}),
+        )
+        assert monitor.is_ready() is False
+
+        monitor.refresh()
+        assert monitor.is_ready() is True
+
+        monitor.informational = frozenset()
+        assert monitor.is_ready() is False
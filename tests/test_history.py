@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Tahmin Geçmişi Testleri - CI/CD Pipeline için
+"""
+
+import math
+import os
+import sys
+
+import numpy as np
+import pytest
+
+# Src dizinini path'e ekle
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import history as history_module  # noqa: E402
+from history import PredictionHistory  # noqa: E402
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """history modülünün monotonic saatini elle ilerlet"""
+    state = {"now": 1000.0}
+    monkeypatch.setattr(history_module.time, "monotonic", lambda: state["now"])
+    return state
+
+
+class TestPredictionHistory:
+    """PredictionHistory testleri"""
+
+    def test_window_stats(self, clock):
+        """Pencere dışındaki kayıtlar sayılmamalı"""
+        history = PredictionHistory(capacity=100)
+        history.append(50, 1.0)
+        clock["now"] += 120
+        history.append(10, 0.5)
+        history.append(None, 0.1)
+
+        last_minute = history.window_stats(60)
+        assert last_minute["count"] == 2
+        assert last_minute["rate_per_second"] == round(2 / 60, 4)
+        assert last_minute["mean_prediction"] == 0.3
+        assert last_minute["mean_value"] == 10
+        assert last_minute["categories"] == {"high": 0, "medium": 1, "low": 1}
+        assert last_minute["complete"] is True
+
+        assert history.window_stats(300)["count"] == 3
+
+    def test_empty_window(self):
+        """Boş pencere"""
+        stats = PredictionHistory(capacity=10).window_stats(60)
+
+        assert stats["count"] == 0
+        assert stats["mean_prediction"] is None
+        assert stats["categories"] == {"high": 0, "medium": 0, "low": 0}
+
+    def test_bounded_memory(self, clock):
+        """Kapasite aşılınca en eski kayıtların üzerine yazılmalı"""
+        history = PredictionHistory(capacity=5)
+        for i in range(12):
+            history.append(i, i / 100)
+
+        stats = history.window_stats(60)
+        assert len(history) == 5
+        assert stats["count"] == 5
+        assert stats["mean_value"] == 9
+        assert stats["complete"] is False
+
+    def test_extend_wraps_around(self, clock):
+        """Batch ekleme buffer sonundan başa taşmalı"""
+        history = PredictionHistory(capacity=8)
+        history.extend(np.arange(5.0), np.full(5, 0.5))
+        history.extend(np.array([10.0, math.nan, 30.0, 40.0]), np.full(4, 0.9))
+
+        stats = history.window_stats(60)
+        assert stats["count"] == 8
+        assert stats["categories"] == {"high": 4, "medium": 4, "low": 0}
+        assert stats["mean_value"] == pytest.approx(
+            (1 + 2 + 3 + 4 + 10 + 30 + 40) / 7, abs=1e-4
+        )
+
+    def test_extend_larger_than_capacity(self, clock):
+        """Kapasiteden büyük batch'in sadece son kayıtları kalmalı"""
+        history = PredictionHistory(capacity=4)
+        history.extend(np.arange(10.0), np.full(10, 0.2))
+
+        assert history.window_stats(60)["mean_value"] == 7.5
+
+    def test_summary_and_clear(self, clock):
+        """Özet tüm pencereleri içermeli, clear kayıtları silmeli"""
+        history = PredictionHistory(capacity=10)
+        history.append(50, 1.0)
+
+        summary = history.summary()
+        assert summary["size"] == 1
+        assert set(summary["windows"]) == {"1m", "5m", "15m"}
+
+        history.clear()
+        assert len(history) == 0
+        assert history.window_stats(60)["count"] == 0
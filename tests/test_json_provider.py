@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+JSON Provider Testleri - CI/CD Pipeline için
+"""
+
+import os
+import sys
+from datetime import datetime
+
+import pytest
+from flask import Flask
+
+# Src dizinini path'e ekle
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from json_provider import (  # noqa: E402
+    OrjsonProvider,
+    create_json_provider,
+    json_backend_name,
+    orjson,
+)
+
+requires_orjson = pytest.mark.skipif(orjson is None, reason="orjson yüklü değil")
+
+
+@pytest.fixture
+def flask_app():
+    """Boş Flask uygulaması"""
+    return Flask(__name__)
+
+
+class TestCreateJsonProvider:
+    """Provider seçimi testleri"""
+
+    def test_stdlib_backend(self, flask_app):
+        """stdlib backend seçimi"""
+        provider = create_json_provider(flask_app, "stdlib")
+
+        assert json_backend_name(provider) == "stdlib"
+
+    @requires_orjson
+    def test_orjson_backend(self, flask_app):
+        """orjson backend seçimi"""
+        provider = create_json_provider(flask_app, "orjson")
+
+        assert isinstance(provider, OrjsonProvider)
+        assert json_backend_name(provider) == "orjson"
+
+    def test_backend_from_env(self, flask_app, monkeypatch):
+        """JSON_BACKEND env değişkeni"""
+        monkeypatch.setenv("JSON_BACKEND", "stdlib")
+
+        assert json_backend_name(create_json_provider(flask_app)) == "stdlib"
+
+    def test_invalid_backend(self, flask_app):
+        """Geçersiz backend hata vermeli"""
+        with pytest.raises(ValueError):
+            create_json_provider(flask_app, "simplejson")
+
+
+@requires_orjson
+class TestOrjsonProvider:
+    """orjson provider çıktılarının stdlib ile uyumluluğu"""
+
+    def test_roundtrip(self, flask_app):
+        """Encode/decode"""
+        provider = OrjsonProvider(flask_app)
+        data = {"b": 1, "a": [1.5, None, True], "ç": "İç server hatası"}
+
+        assert provider.loads(provider.dumps(data)) == data
+        assert provider.loads(b'{"value": 50}') == {"value": 50}
+
+    def test_matches_stdlib(self, flask_app):
+        """Key sırası ve tarih formatı stdlib ile aynı olmalı"""
+        orjson_provider = create_json_provider(flask_app, "orjson")
+        stdlib_provider = create_json_provider(flask_app, "stdlib")
+        data = {"z": 1, "a": datetime(2024, 1, 2, 3, 4, 5)}
+
+        assert orjson_provider.loads(orjson_provider.dumps(data)) == (
+            stdlib_provider.loads(stdlib_provider.dumps(data))
+        )
+
+    def test_large_int_fallback(self, flask_app):
+        """orjson'un desteklemediği değerler stdlib ile encode edilmeli"""
+        provider = OrjsonProvider(flask_app)
+
+        assert provider.loads(provider.dumps({"n": 2**70})) == {"n": 2**70}
+
+    def test_response(self, flask_app):
+        """Response gövdesi ve mimetype"""
+        flask_app.json = OrjsonProvider(flask_app)
+
+        with flask_app.app_context():
+            response = flask_app.json.response({"status": "success"})
+
+        assert response.mimetype == "application/json"
+        assert response.get_data() == b'{"status":"success"}\n'
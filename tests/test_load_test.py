@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Yük Testi Aracı Testleri - CI/CD Pipeline için
+"""
+
+import os
+import socket
+import sys
+
+import pytest
+
+# Benchmarks ve src dizinlerini path'e ekle
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "benchmarks"))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from load_test import (  # noqa: E402
+    SCENARIOS,
+    client_requester,
+    compare_to_baseline,
+    http_requester,
+    percentile,
+    run_scenario,
+    start_local_server,
+)
+
+
+def make_report(rps, p99):
+    """Tek senaryolu rapor"""
+    return {
+        "scenarios": {"predict": {"throughput_rps": rps, "latency_ms": {"p99": p99}}}
+    }
+
+
+class TestReportHelpers:
+    """Rapor yardımcı fonksiyon testleri"""
+
+    def test_percentile(self):
+        """Nearest-rank yüzdelik"""
+        values = [float(i) for i in range(1, 101)]
+
+        assert percentile(values, 50) == 50.0
+        assert percentile(values, 99) == 99.0
+        assert percentile(values, 100) == 100.0
+        assert percentile([], 50) == 0.0
+
+    def test_compare_no_regression(self):
+        """Eşik içindeki değişim regresyon değil"""
+        assert (
+            compare_to_baseline(make_report(950, 10.5), make_report(1000, 10), 20) == []
+        )
+
+    def test_compare_throughput_regression(self):
+        """Throughput düşüşü regresyon"""
+        regressions = compare_to_baseline(
+            make_report(700, 10), make_report(1000, 10), 20
+        )
+
+        assert len(regressions) == 1
+        assert "throughput" in regressions[0]
+
+    def test_compare_latency_regression(self):
+        """p99 artışı regresyon"""
+        regressions = compare_to_baseline(
+            make_report(1000, 15), make_report(1000, 10), 20
+        )
+
+        assert len(regressions) == 1
+        assert "p99" in regressions[0]
+
+
+class TestRunScenario:
+    """Senaryo çalıştırma testleri"""
+
+    def test_client_mode(self):
+        """Test client ile eşzamanlı istekler"""
+        report = run_scenario(
+            client_requester("predict"), SCENARIOS["predict"][3], 40, 4, warmup=1
+        )
+
+        assert report["requests"] == 40
+        assert report["errors"] == 0
+        assert report["throughput_rps"] > 0
+        assert report["latency_ms"]["p50"] <= report["latency_ms"]["p99"]
+
+    def test_server_mode(self):
+        """Gerçek local sunucu ile istekler"""
+        server, base_url = start_local_server()
+        try:
+            report = run_scenario(
+                http_requester(base_url, "predict_invalid"),
+                SCENARIOS["predict_invalid"][3],
+                20,
+                2,
+                warmup=1,
+            )
+        finally:
+            server.shutdown()
+
+        assert report["requests"] == 20
+        assert report["errors"] == 0
+
+    def test_unreachable_target(self):
+        """Hedefe ulaşılamazsa ısınma hatası yükselmeli, takılmamalı"""
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            port = sock.getsockname()[1]
+
+        with pytest.raises(OSError):
+            run_scenario(
+                http_requester(f"http://127.0.0.1:{port}", "health"),
+                SCENARIOS["health"][3],
+                4,
+                2,
+                warmup=1,
+            )
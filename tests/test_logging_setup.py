@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+Log Pipeline Testleri - CI/CD Pipeline için
+"""
+
+import io
+import json
+import logging
+import os
+import queue
+import sys
+import threading
+
+import pytest
+
+# Src dizinini path'e ekle
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import logging_setup  # noqa: E402
+from logging_setup import (  # noqa: E402
+    BatchingListener,
+    JsonFormatter,
+    NonBlockingQueueHandler,
+    SamplingFilter,
+    configure_logging,
+    shutdown_logging,
+)
+
+
+class CountingStream(io.StringIO):
+    """write çağrılarını sayan stream"""
+
+    def __init__(self):
+        super().__init__()
+        self.writes = 0
+
+    def write(self, text):
+        self.writes += 1
+        return super().write(text)
+
+
+class StrSpy:
+    """str() çağrısını ve çağıran thread'i kaydeden obje"""
+
+    def __init__(self):
+        self.threads = []
+
+    def __str__(self):
+        self.threads.append(threading.current_thread().name)
+        return "spy"
+
+
+@pytest.fixture
+def pipeline():
+    """Test stream'ine yazan pipeline; test sonunda varsayılan ayara döner"""
+    stream = CountingStream()
+    configure_logging(level="INFO", stream=stream, flush_interval=0.01)
+    yield stream
+    configure_logging()
+
+
+def make_record(msg="hello", **extra):
+    record = logging.makeLogRecord({"name": "test", "levelname": "INFO", "msg": msg})
+    record.__dict__.update(extra)
+    return record
+
+
+class TestJsonFormatter:
+    """JSON formatter testleri"""
+
+    def test_format_with_extra(self):
+        """Extra alanlar JSON'a eklenmeli, dahili alanlar eklenmemeli"""
+        line = JsonFormatter().format(
+            make_record("Request logged", endpoint="/predict", sampled=True)
+        )
+        entry = json.loads(line)
+
+        assert entry["message"] == "Request logged"
+        assert entry["level"] == "INFO"
+        assert entry["endpoint"] == "/predict"
+        assert "sampled" not in entry
+
+
+class TestSamplingFilter:
+    """Örnekleme filtresi testleri"""
+
+    def test_sampled_records(self):
+        """İşaretli kayıtların 1/N'i geçmeli"""
+        sampling = SamplingFilter(rate=0.1)
+        passed = sum(sampling.filter(make_record(sampled=True)) for _ in range(1000))
+
+        assert passed == 100
+
+    def test_unmarked_records_pass(self):
+        """İşaretsiz kayıtlar her zaman geçmeli"""
+        sampling = SamplingFilter(rate=0.0)
+
+        assert sampling.filter(make_record()) is True
+        assert sampling.filter(make_record(sampled=True)) is False
+
+
+class TestQueueHandler:
+    """Kuyruk handler testleri"""
+
+    def test_drops_when_full(self):
+        """Kuyruk doluysa kayıt atılmalı (bloklamadan)"""
+        handler = NonBlockingQueueHandler(queue.Queue(maxsize=1))
+        handler.handle(make_record())
+        handler.handle(make_record())
+
+        assert handler.dropped == 1
+
+    def test_does_not_format_on_caller_thread(self):
+        """Mesaj formatlama request thread'inde yapılmamalı"""
+        log_queue = queue.Queue()
+        handler = NonBlockingQueueHandler(log_queue)
+        spy = StrSpy()
+        record = make_record("value: %s")
+        record.args = (spy,)
+
+        handler.handle(record)
+
+        assert spy.threads == []
+        assert log_queue.get_nowait() is record
+
+
+class TestBatchingListener:
+    """Batch listener testleri"""
+
+    def test_writes_in_batches(self):
+        """Kuyruktaki kayıtlar tek yazmada çıkmalı"""
+        log_queue = queue.Queue()
+        stream = CountingStream()
+        for i in range(10):
+            log_queue.put(make_record(f"message {i}"))
+
+        listener = BatchingListener(log_queue, stream, JsonFormatter(), batch_size=100)
+        listener.start()
+        listener.stop()
+
+        lines = stream.getvalue().splitlines()
+        assert len(lines) == 10
+        assert json.loads(lines[9])["message"] == "message 9"
+        assert stream.writes == 1
+
+
+class TestConfigureLogging:
+    """Pipeline konfigürasyon testleri"""
+
+    def test_logs_reach_stream_as_json(self, pipeline):
+        """Loglar JSON satırı olarak yazılmalı"""
+        logging.getLogger("test.pipeline").info("hello %s", "world", extra={"k": 1})
+        shutdown_logging()
+
+        entry = json.loads(pipeline.getvalue().splitlines()[-1])
+        assert entry["message"] == "hello world"
+        assert entry["k"] == 1
+
+    def test_formatting_happens_on_listener_thread(self, pipeline):
+        """Lazy formatlama listener thread'inde yapılmalı"""
+        spy = StrSpy()
+        logging.getLogger("test.pipeline").info("value: %s", spy)
+        shutdown_logging()
+
+        # pytest'in capture handler'ı kendi formatlamasını ana thread'de yapar
+        assert "log-listener" in spy.threads
+
+    def test_disabled_level_costs_nothing(self, pipeline):
+        """Kapalı seviyedeki loglar formatlanmamalı"""
+        spy = StrSpy()
+        logging.getLogger("test.pipeline").debug("value: %s", spy)
+        shutdown_logging()
+
+        assert spy.threads == []
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="fork desteklenmiyor")
+    def test_pipeline_restarts_after_fork(self, tmp_path):
+        """Fork edilen process'te loglar yazılmaya devam etmeli"""
+        log_file = open(tmp_path / "log.jsonl", "w")
+        try:
+            configure_logging(level="INFO", stream=log_file, flush_interval=0.01)
+            pid = os.fork()
+            if pid == 0:
+                logging.getLogger("test.child").info("from child")
+                logging_setup.shutdown_logging()
+                os._exit(0)
+            os.waitpid(pid, 0)
+            shutdown_logging()
+        finally:
+            log_file.close()
+            configure_logging()
+
+        messages = [
+            json.loads(line)["message"]
+            for line in (tmp_path / "log.jsonl").read_text().splitlines()
+        ]
+        assert "from child" in messages
@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+"""
+Metrik Yardımcıları Testleri - CI/CD Pipeline için
+"""
+
+import os
+import random
+import statistics
+import sys
+import threading
+
+import numpy as np
+import pytest
+
+# Src dizinini path'e ekle
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from metrics import (  # noqa: E402
+    CallbackMetric,
+    Counter,
+    Gauge,
+    Histogram,
+    MetricsRegistry,
+    ShardedCounter,
+    ShardedHistogram,
+    ShardedStats,
+    StreamingStats,
+)
+
+
+class TestShardedCounter:
+    """Sharded sayaç testleri"""
+
+    def test_counter_add(self):
+        """Tek thread'de artırma"""
+        counter = ShardedCounter()
+        counter.add()
+        counter.add(4)
+
+        assert counter.value() == 5
+
+    def test_counter_concurrent_add(self):
+        """Eşzamanlı artırmalar kaybolmamalı"""
+        counter = ShardedCounter()
+
+        def worker():
+            for _ in range(10000):
+                counter.add()
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert counter.value() == 80000
+
+    def test_counter_keeps_finished_thread_values(self):
+        """Biten thread'lerin değerleri toplamda kalmalı"""
+        counter = ShardedCounter()
+
+        for _ in range(50):
+            thread = threading.Thread(target=counter.add, args=(2,))
+            thread.start()
+            thread.join()
+
+        assert counter.value() == 100
+        # Biten thread'lerin shard'ları temizlenmiş olmalı
+        assert len(counter._shards._shards) < 50
+
+    def test_counter_reset(self):
+        """Sıfırlama"""
+        counter = ShardedCounter()
+        counter.add(3)
+        counter.reset()
+
+        assert counter.value() == 0
+
+
+class TestPrometheusMetrics:
+    """Prometheus metrik tipleri ve render testleri"""
+
+    def test_counter_with_labels(self):
+        """Label'lı sayaç render"""
+        counter = Counter("test_requests_total", "Test", ("endpoint", "status"))
+        counter.labels("/predict", 200).add()
+        counter.labels("/predict", 200).add(2)
+        counter.labels("/health", 503).add()
+
+        lines = counter.render()
+
+        assert "# TYPE test_requests_total counter" in lines
+        assert 'test_requests_total{endpoint="/predict",status="200"} 3' in lines
+        assert 'test_requests_total{endpoint="/health",status="503"} 1' in lines
+
+    def test_counter_label_count_mismatch(self):
+        """Yanlış label sayısı hata vermeli"""
+        counter = Counter("test_mismatch_total", "Test", ("a", "b"))
+
+        try:
+            counter.labels("x")
+            assert False, "ValueError beklenmişti"
+        except ValueError:
+            pass
+
+    def test_gauge_inc_dec(self):
+        """Gauge artırma/azaltma"""
+        gauge = Gauge("test_in_flight", "Test")
+        gauge.inc()
+        gauge.inc()
+        gauge.dec()
+
+        assert gauge.value() == 1
+        assert "test_in_flight 1" in gauge.render()
+
+    def test_histogram_buckets(self):
+        """Histogram kümülatif bucket'ları"""
+        histogram = Histogram("test_latency_seconds", "Test", buckets=(0.1, 1.0))
+        for value in (0.05, 0.1, 0.5, 2.0):
+            histogram.observe(value)
+
+        lines = histogram.render()
+
+        assert 'test_latency_seconds_bucket{le="0.1"} 2' in lines
+        assert 'test_latency_seconds_bucket{le="1.0"} 3' in lines
+        assert 'test_latency_seconds_bucket{le="+Inf"} 4' in lines
+        assert "test_latency_seconds_count 4" in lines
+        assert "test_latency_seconds_sum 2.65" in lines
+
+    def test_histogram_concurrent_observe(self):
+        """Eşzamanlı gözlemler kaybolmamalı"""
+        histogram = ShardedHistogram(buckets=(1.0,))
+
+        def worker():
+            for _ in range(5000):
+                histogram.observe(0.5)
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        snapshot = histogram.snapshot()
+        assert snapshot["count"] == 20000
+        assert snapshot["counts"] == [20000, 0]
+
+    def test_label_value_escaping(self):
+        """Label değerlerindeki özel karakterler kaçırılmalı"""
+        counter = Counter("test_escape_total", "Test", ("reason",))
+        counter.labels('a"b').add()
+
+        assert 'test_escape_total{reason="a\\"b"} 1' in counter.render()
+
+    def test_registry_render(self):
+        """Registry tüm metrikleri render etmeli"""
+        registry = MetricsRegistry()
+        registry.register(Counter("a_total", "A")).inc()
+        registry.register(CallbackMetric("b_value", "B", lambda: 42))
+
+        text = registry.render()
+
+        assert "a_total 1" in text
+        assert "b_value 42" in text
+        assert text.endswith("\n")
+
+    def test_registry_register_same_name(self):
+        """Aynı isimle kayıt mevcut metriği döndürmeli"""
+        registry = MetricsRegistry()
+        first = registry.register(Counter("dup_total", "A"))
+        second = registry.register(Counter("dup_total", "A"))
+
+        assert first is second
+
+
+class TestStreamingStats:
+    """Streaming dağılım istatistikleri testleri"""
+
+    def test_matches_exact_statistics(self):
+        """Mean/std tam değerlerle, yüzdelikler bucket hassasiyetinde eşleşmeli"""
+        rng = random.Random(42)
+        values = [rng.random() for _ in range(10000)]
+        stats = StreamingStats(bins=200)
+        for value in values:
+            stats.update(value)
+
+        summary = stats.summary(digits=10)
+        exact = statistics.quantiles(values, n=100, method="inclusive")
+        assert summary["count"] == 10000
+        assert summary["mean"] == pytest.approx(statistics.mean(values), abs=1e-9)
+        assert summary["std"] == pytest.approx(statistics.stdev(values), abs=1e-9)
+        assert summary["min"] == min(values)
+        assert summary["max"] == max(values)
+        for key, index in (("p50", 49), ("p95", 94), ("p99", 98)):
+            assert summary[key] == pytest.approx(exact[index], abs=1 / 200)
+
+    def test_update_many_matches_update(self):
+        """Liste, numpy array ve tekil güncellemeler aynı sonucu vermeli"""
+        values = [0.0, 0.25, 0.5, 0.5, 1.0, -0.5, 1.5] * 20
+        single, listed, vectorized = (
+            StreamingStats(),
+            StreamingStats(),
+            StreamingStats(),
+        )
+        for value in values:
+            single.update(value)
+        listed.update_many(values)
+        vectorized.update_many(np.array(values))
+
+        assert listed.counts == single.counts == vectorized.counts
+        assert listed.summary() == single.summary() == vectorized.summary()
+
+    def test_merge(self):
+        """Birleştirilmiş parçalar tek seferde hesaplananla aynı olmalı"""
+        values = [i / 1000 for i in range(1000)]
+        whole, first, second = StreamingStats(), StreamingStats(), StreamingStats()
+        whole.update_many(values)
+        first.update_many(values[:300])
+        second.update_many(values[300:])
+
+        first.merge(StreamingStats.from_dict(second.to_dict()))
+
+        assert first.count == whole.count
+        assert first.mean == pytest.approx(whole.mean)
+        assert first.variance() == pytest.approx(whole.variance())
+        assert first.counts == whole.counts
+
+    def test_merge_incompatible(self):
+        """Farklı bucket ayarları birleştirilememeli"""
+        with pytest.raises(ValueError):
+            StreamingStats(bins=10).merge(StreamingStats(bins=20))
+
+    def test_empty_summary(self):
+        """Boş istatistik sıfır döndürmeli"""
+        assert StreamingStats().summary()["count"] == 0
+        assert StreamingStats().summary()["p99"] == 0
+
+    def test_sharded_stats_concurrent(self):
+        """Eşzamanlı güncellemeler kaybolmamalı (biten thread'ler dahil)"""
+        stats = ShardedStats()
+
+        def worker():
+            for _ in range(2000):
+                stats.update(0.5)
+            stats.update_many([0.25] * 1000)
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        del threads
+
+        snapshot = stats.snapshot()
+        assert snapshot.count == 12000
+        assert snapshot.mean == pytest.approx((8000 * 0.5 + 4000 * 0.25) / 12000)
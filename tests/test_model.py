@@ -5,6 +5,9 @@ Basit Model Testleri - CI/CD Pipeline için
 
 import os
 import sys
+import threading
+
+import pytest
 
 # Src dizinini path'e ekle
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
@@ -179,6 +182,101 @@ class TestSimpleModel:
             pass  # Beklenen durum
 
 
+class TestModelBatchPrediction:
+    """Toplu (vektörel) tahmin testleri"""
+
+    def test_predict_batch_matches_predict(self):
+        """Batch tahminleri tekil tahminlerle aynı olmalı"""
+        model = SimpleModel()
+        records = [{"value": v} for v in [0, 10, 25, 50, 75, 99.5, 100]]
+
+        results = model.predict_batch(records)
+
+        assert len(results) == len(records)
+        for record, result in zip(records, results):
+            assert result["prediction"] == model.predict(record)["prediction"]
+            assert 0.7 <= result["confidence"] <= 0.95
+            assert result["model_version"] == model.get_version()
+
+    def test_predict_batch_without_value(self):
+        """Value olmayan kayıtlar için random tahmin"""
+        model = SimpleModel()
+
+        results = model.predict_batch([{}, {"value": 50}])
+
+        assert 0 <= results[0]["prediction"] <= 1
+        assert results[1]["prediction"] == 1.0
+
+    def test_predict_batch_updates_count(self):
+        """Batch tahmin sayısını kayıt sayısı kadar artırmalı"""
+        model = SimpleModel()
+
+        model.predict_batch([{"value": 1}, {"value": 2}, {"value": 3}])
+
+        assert model.get_prediction_count() == 3
+        assert model.get_last_prediction_time() is not None
+
+    def test_prediction_stats(self):
+        """Tekil ve batch tahminler dağılım istatistiklerine eklenmeli"""
+        model = SimpleModel()
+
+        model.predict({"value": 50})
+        model.predict_batch([{"value": 0}, {"value": 100}])
+        stats = model.get_prediction_stats()
+
+        assert stats["count"] == 3
+        assert stats["max"] == 1.0
+        assert stats["min"] == 0.5
+        assert stats["mean"] == pytest.approx(2 / 3, abs=1e-4)
+
+        model.reset_stats()
+        assert model.get_prediction_stats()["count"] == 0
+
+    def test_predict_batch_empty(self):
+        """Boş batch"""
+        model = SimpleModel()
+
+        assert model.predict_batch([]) == []
+        assert model.get_prediction_count() == 0
+
+    def test_predict_batch_invalid_value(self):
+        """Geçersiz value tipi batch'te de hata vermeli"""
+        model = SimpleModel()
+
+        try:
+            model.predict_batch([{"value": "invalid"}])
+            assert False, "Exception beklenmişti"
+        except ValueError:
+            pass
+
+
+class TestModelConcurrency:
+    """Eşzamanlı tahmin sayacı testleri"""
+
+    def test_prediction_count_exact_under_threads(self):
+        """Çok thread'li yük altında tahmin sayısı tam olmalı"""
+        model = SimpleModel()
+        thread_count = 8
+        predictions_per_thread = 1000
+        barrier = threading.Barrier(thread_count)
+
+        def worker():
+            barrier.wait()
+            for i in range(predictions_per_thread):
+                model.predict({"value": i % 101})
+            model.predict_batch([{"value": 10}, {"value": 20}])
+
+        threads = [threading.Thread(target=worker) for _ in range(thread_count)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert model.get_prediction_count() == thread_count * (
+            predictions_per_thread + 2
+        )
+
+
 class TestModelMainFunction:
     """Model main fonksiyon testleri"""
 
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Tahmin Tablosu Testleri - CI/CD Pipeline için
+Tablonun analitik tahmin yolu ile aynı sonuçları verdiğini doğrular.
+"""
+
+import os
+import sys
+
+import pytest
+
+# Src dizinini path'e ekle
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from model import SimpleModel  # noqa: E402
+from prediction_table import PredictionTable  # noqa: E402
+from utils import format_response, prediction_category  # noqa: E402
+
+
+def analytic(value):
+    """Tablo olmadan tekil tahmin"""
+    return round(SimpleModel._score_values(value), 4)
+
+
+class TestPredictionTable:
+    """Tablo arama testleri"""
+
+    def test_matches_analytic(self):
+        """Tam sayı value'lar analitik sonuçla birebir aynı olmalı"""
+        table = PredictionTable(SimpleModel._score_values)
+
+        assert len(table) == 101
+        for value in range(101):
+            expected = analytic(float(value))
+            assert table.lookup(float(value)) == (
+                expected,
+                prediction_category(expected),
+            )
+
+    def test_skips_non_integers(self):
+        """Tam sayı olmayan ve aralık dışı value'lar tabloda yok"""
+        table = PredictionTable(SimpleModel._score_values)
+
+        for value in (12.5, -1.0, 101.0, float("nan"), 1e300):
+            assert table.lookup(value) is None
+        assert table.lookup(100.0) == (0.5, prediction_category(0.5))
+
+
+class TestModelWithTable:
+    """Tablo açık model testleri"""
+
+    def test_predictions_match_analytic_model(self):
+        """Tablolu model tahminleri ve response kategorileri analitik ile aynı"""
+        analytic_model = SimpleModel()
+        model = SimpleModel(table_mode="exact")
+        records = [{"value": v} for v in [0, 10, 25, 40, 50, 12.5, 99.99, 100]]
+
+        for record in records:
+            result = model.predict(record)
+            reference = analytic_model.predict(record)
+            assert result["prediction"] == reference["prediction"]
+            assert (
+                format_response(result, record)["category"]
+                == format_response(reference, record)["category"]
+            )
+
+    def test_batch_uses_analytic_path(self):
+        """predict_batch tablo açıkken de analitik hesaplamalı"""
+        model = SimpleModel(table_mode="exact")
+
+        results = model.predict_batch([{}, {"value": 50}, {"value": 7.5}])
+
+        assert 0 <= results[0]["prediction"] <= 1
+        assert results[1]["prediction"] == 1.0
+        assert results[2]["prediction"] == analytic(7.5)
+        assert all("category" not in result for result in results)
+
+    def test_records_without_value(self):
+        """Value olmayan kayıtlar tablo açıkken de random tahmin almalı"""
+        model = SimpleModel(table_mode="exact")
+
+        result = model.predict({})
+
+        assert 0 <= result["prediction"] <= 1
+        assert "category" not in result
+
+    def test_table_from_environment(self, monkeypatch):
+        """PREDICTION_TABLE env ile açılabilmeli"""
+        monkeypatch.setenv("PREDICTION_TABLE", "exact")
+
+        model = SimpleModel()
+
+        assert model.table.describe() == {
+            "mode": "exact",
+            "size": 101,
+            "range": [0.0, 100.0],
+        }
+
+    def test_invalid_mode(self):
+        """Geçersiz tablo modu reddedilmeli"""
+        with pytest.raises(ValueError):
+            SimpleModel(table_mode="interpolated")
+
+    def test_table_disabled_by_default(self):
+        """Varsayılan olarak tablo kapalı, sonuçta kategori yok"""
+        model = SimpleModel()
+
+        assert model.table is None
+        assert "category" not in model.predict({"value": 50})
@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+"""
+Model Registry Testleri - CI/CD Pipeline için
+"""
+
+import os
+import sys
+import threading
+
+import pytest
+
+# Src dizinini path'e ekle
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from registry import (  # noqa: E402
+    ActiveModel,
+    ModelFileWatcher,
+    ModelRegistry,
+    ModelWarmup,
+    read_model_version,
+)
+
+
+class WarmUpModel:
+    """warm_up çağrılarını sayan test modeli"""
+
+    def __init__(self, version, fail=False):
+        self.version = version
+        self.fail = fail
+        self.warm_up_calls = 0
+
+    def warm_up(self, iterations=1):
+        self.warm_up_calls += iterations
+        if self.fail:
+            raise RuntimeError("warm-up failed")
+
+
+class TestModelRegistry:
+    """ModelRegistry testleri"""
+
+    def test_activate_and_proxy(self):
+        """Aktif model değişince vekil yeni modele yönlenmeli"""
+        registry = ModelRegistry()
+        registry.activate("1.0.0")
+        proxy = ActiveModel(registry)
+
+        result = registry.activate("2.0.0")
+
+        assert result["active"] == "2.0.0"
+        assert result["previous"] == "1.0.0"
+        assert result["drained"] is True
+        assert proxy.get_version() == "2.0.0"
+        assert {entry["version"] for entry in registry.versions()} == {
+            "1.0.0",
+            "2.0.0",
+        }
+
+    def test_load_is_idempotent(self):
+        """Aynı versiyon ikinci kez yüklenmemeli"""
+        registry = ModelRegistry()
+
+        assert registry.load("1.0.0") is registry.load("1.0.0")
+
+    def test_no_active_model(self):
+        """Aktif model yokken acquire hata vermeli"""
+        registry = ModelRegistry()
+
+        with pytest.raises(RuntimeError):
+            with registry.acquire():
+                pass
+
+    def test_activate_drains_in_flight(self):
+        """Değişim eski modeldeki request bitene kadar beklemeli"""
+        registry = ModelRegistry()
+        registry.activate("1.0.0")
+        acquired, release = threading.Event(), threading.Event()
+        used = []
+
+        def request():
+            with registry.acquire() as model:
+                acquired.set()
+                release.wait(5)
+                used.append(model.get_version())
+
+        thread = threading.Thread(target=request)
+        thread.start()
+        acquired.wait(5)
+        threading.Timer(0.05, release.set).start()
+
+        result = registry.activate("2.0.0")
+        thread.join()
+
+        assert result["drained"] is True
+        assert result["drain_seconds"] >= 0.04
+        assert used == ["1.0.0"]
+        with registry.acquire() as model:
+            assert model.get_version() == "2.0.0"
+
+    def test_drain_timeout(self):
+        """Drain süresi aşılırsa değişim yine de yapılmalı"""
+        registry = ModelRegistry()
+        registry.activate("1.0.0")
+        release = threading.Event()
+        acquired = threading.Event()
+
+        def request():
+            with registry.acquire():
+                acquired.set()
+                release.wait(5)
+
+        thread = threading.Thread(target=request)
+        thread.start()
+        acquired.wait(5)
+
+        result = registry.activate("2.0.0", drain_timeout=0.02)
+        release.set()
+        thread.join()
+
+        assert result["drained"] is False
+        assert registry.active_version == "2.0.0"
+
+    def test_listener_called_on_swap(self):
+        """Listener'lar değişimden sonra eski ve yeni model ile çağrılmalı"""
+        registry = ModelRegistry()
+        registry.activate("1.0.0")
+        calls = []
+        registry.add_listener(
+            lambda old, new: calls.append((old.get_version(), new.get_version()))
+        )
+
+        registry.activate("1.0.0")
+        registry.activate("2.0.0")
+
+        assert calls == [("1.0.0", "2.0.0")]
+
+    def test_unload(self):
+        """Aktif olmayan versiyon çıkarılabilmeli, aktif olan çıkarılamamalı"""
+        registry = ModelRegistry()
+        registry.activate("1.0.0")
+        registry.activate("2.0.0")
+
+        with pytest.raises(ValueError):
+            registry.unload("2.0.0")
+        assert registry.unload("1.0.0") is True
+        assert registry.unload("1.0.0") is False
+        assert [entry["version"] for entry in registry.versions()] == ["2.0.0"]
+
+    def test_load_warms_up_model(self):
+        """warm_up=False verilmedikçe model yüklenirken ısıtılmalı"""
+        registry = ModelRegistry(loader=WarmUpModel)
+
+        assert registry.load("1.0.0").warm_up_calls == 1
+        assert registry.load("1.0.0").warm_up_calls == 1
+        assert registry.load("2.0.0", warm_up=False).warm_up_calls == 0
+
+    def test_failed_warm_up_is_not_loaded(self):
+        """Isıtması başarısız olan versiyon registry'ye eklenmemeli"""
+        registry = ModelRegistry(loader=lambda v: WarmUpModel(v, fail=True))
+
+        with pytest.raises(RuntimeError):
+            registry.activate("1.0.0")
+        assert registry.versions() == []
+        assert registry.active_version is None
+
+
+class TestModelWarmup:
+    """ModelWarmup testleri"""
+
+    def test_background_warm_up(self):
+        """Arka planda ısıtma bitince model hazır olmalı"""
+        registry = ModelRegistry()
+        registry.activate("1.0.0", warm_up=False)
+        warmup = ModelWarmup(registry)
+        assert warmup.status() == {
+            "ready": False,
+            "duration_ms": None,
+            "steps": {},
+            "error": None,
+        }
+
+        warmup.start()
+
+        assert warmup.wait(timeout=10)
+        assert warmup.status()["duration_ms"] >= 0
+        assert set(warmup.status()["steps"]) == {"model"}
+        # Isıtma tahmin istatistiklerine yazmamalı
+        assert registry.active.get_prediction_count() == 0
+        assert registry.active.get_prediction_history()["size"] == 0
+
+    def test_failed_warm_up_is_not_ready(self):
+        """Isıtma hata verirse model hazır sayılmamalı"""
+        registry = ModelRegistry(loader=lambda v: WarmUpModel(v, fail=True))
+        registry.activate("1.0.0", warm_up=False)
+        warmup = ModelWarmup(registry)
+
+        assert warmup.run() is False
+        assert not warmup.is_ready()
+        assert warmup.status()["error"] == "model: warm-up failed"
+
+        registry.active.fail = False
+        assert warmup.run() is True
+        assert warmup.status()["error"] is None
+
+    def test_iterations_and_steps(self):
+        """Model iterations kez ısıtılmalı, ardından adımlar sırayla çalışmalı"""
+        registry = ModelRegistry(loader=WarmUpModel)
+        registry.activate("1.0.0", warm_up=False)
+        warmup = ModelWarmup(registry, iterations=5)
+        calls = []
+        warmup.add_step("cache", lambda: calls.append("cache"))
+        warmup.add_step("pool", lambda: calls.append("pool"))
+
+        assert warmup.run() is True
+
+        assert registry.active.warm_up_calls == 5
+        assert calls == ["cache", "pool"]
+        assert list(warmup.status()["steps"]) == ["model", "cache", "pool"]
+
+    def test_failing_step_blocks_readiness(self):
+        """Ek adım hata verirse model hazır sayılmamalı"""
+        registry = ModelRegistry(loader=WarmUpModel)
+        registry.activate("1.0.0", warm_up=False)
+        warmup = ModelWarmup(registry, iterations=0)
+
+        def broken_pool():
+            raise ConnectionError("pool unavailable")
+
+        warmup.add_step("pool", broken_pool)
+
+        assert warmup.run() is False
+        assert registry.active.warm_up_calls == 0
+        assert warmup.status()["error"] == "pool: pool unavailable"
+
+
+class TestModelFileWatcher:
+    """Dosya izleyici testleri"""
+
+    def test_read_model_version(self, tmp_path):
+        """JSON ve düz metin formatları"""
+        path = tmp_path / "model.json"
+        path.write_text('{"version": "1.2.0"}')
+        assert read_model_version(str(path)) == "1.2.0"
+
+        path.write_text("1.3.0\n")
+        assert read_model_version(str(path)) == "1.3.0"
+
+    def test_check_swaps_on_change(self, tmp_path):
+        """Dosyadaki versiyon değişince aktif model değişmeli"""
+        registry = ModelRegistry()
+        registry.activate("1.0.0")
+        path = tmp_path / "model.json"
+        watcher = ModelFileWatcher(registry, str(path), interval=0.01)
+
+        assert watcher.check() is False
+
+        path.write_text('{"version": "1.1.0"}')
+        assert watcher.check() is True
+        assert registry.active_version == "1.1.0"
+        assert watcher.check() is False
+
+    def test_background_watch(self, tmp_path):
+        """Arka plan thread'i değişikliği uygulamalı"""
+        registry = ModelRegistry()
+        registry.activate("1.0.0")
+        path = tmp_path / "model.txt"
+        path.write_text("3.0.0")
+        watcher = ModelFileWatcher(registry, str(path), interval=0.01)
+
+        watcher.start()
+        try:
+            for _ in range(200):
+                if registry.active_version == "3.0.0":
+                    break
+                threading.Event().wait(0.01)
+        finally:
+            watcher.stop(timeout=1)
+
+        assert registry.active_version == "3.0.0"
+        assert not watcher.is_running()
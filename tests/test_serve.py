@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Production Sunucu Testleri - CI/CD Pipeline için
+"""
+
+import os
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+# Src dizinini path'e ekle
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from serve import SERVER_HOOKS, build_config, load_application  # noqa: E402
+
+
+class TestBuildConfig:
+    """Env değişkenlerinden sunucu ayarları"""
+
+    def test_defaults(self):
+        """Varsayılan ayarlar"""
+        config = build_config({})
+
+        assert config["bind"] == "0.0.0.0:5000"
+        assert config["workers"] == (os.cpu_count() or 1)
+        assert config["threads"] == 4
+        assert config["worker_class"] == "gthread"
+        assert config["preload_app"] is True
+
+    def test_env_overrides(self):
+        """Env değişkenleri ayarları değiştirmeli"""
+        config = build_config(
+            {
+                "HOST": "127.0.0.1",
+                "PORT": "8080",
+                "SERVER_WORKERS": "3",
+                "SERVER_THREADS": "1",
+                "SERVER_KEEPALIVE": "10",
+                "SERVER_BACKLOG": "512",
+                "SERVER_GRACEFUL_TIMEOUT": "15",
+            }
+        )
+
+        assert config["bind"] == "127.0.0.1:8080"
+        assert config["workers"] == 3
+        assert config["threads"] == 1
+        assert config["worker_class"] == "sync"
+        assert config["keepalive"] == 10
+        assert config["backlog"] == 512
+        assert config["graceful_timeout"] == 15
+
+    def test_invalid_values(self):
+        """Geçersiz değerler hata vermeli"""
+        with pytest.raises(ValueError):
+            build_config({"SERVER_WORKERS": "0"})
+        with pytest.raises(ValueError):
+            build_config({"SERVER_THREADS": "many"})
+
+
+class TestServerApplication:
+    """Sunucu uygulama yükleme testleri"""
+
+    def test_load_application(self, monkeypatch):
+        """Flask uygulaması yüklenebilmeli ve model fork'tan önce ısıtılmalı"""
+        from app import health_monitor, model_warmup, shared_metrics
+
+        monkeypatch.setattr(health_monitor, "probes", {"database": lambda: True})
+        monkeypatch.setattr(health_monitor, "_snapshot", None)
+        model_warmup.reset()
+        try:
+            application = load_application()
+
+            assert application.name == "app"
+            assert model_warmup.is_ready()
+            # Master paylaşımlı metrik slot'unu worker'lara bırakmalı
+            assert shared_metrics.slot is None
+        finally:
+            model_warmup.reset()
+            shared_metrics.attach()
+
+    def test_hooks_are_callable(self):
+        """gunicorn hook'ları tanımlı olmalı"""
+        assert set(SERVER_HOOKS) == {
+            "on_starting",
+            "pre_fork",
+            "post_fork",
+            "worker_exit",
+            "child_exit",
+            "on_exit",
+        }
+        assert all(callable(hook) for hook in SERVER_HOOKS.values())
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="fork gerekli")
+    def test_metrics_slot_lifecycle(self):
+        """Worker'ın slot'u master'da atanmalı, çıkınca sayaçları toplamda kalmalı"""
+        from app import SHARED_PREDICTIONS, shared_metrics
+
+        worker = SimpleNamespace()
+        SERVER_HOOKS["pre_fork"](None, worker)
+        assert worker.metrics_slot not in (None, shared_metrics.slot)
+        before = SHARED_PREDICTIONS.value()
+        retired = shared_metrics.summary()["retired"]
+
+        pid = os.fork()
+        if pid == 0:
+            # post_fork'un metrik kısmı (thread başlatmadan)
+            shared_metrics.attach(worker.metrics_slot)
+            SHARED_PREDICTIONS.add(7)
+            os._exit(0)
+        os.waitpid(pid, 0)
+        worker.pid = pid
+        assert SHARED_PREDICTIONS.value() == before + 7
+
+        SERVER_HOOKS["child_exit"](None, worker)
+
+        assert SHARED_PREDICTIONS.value() == before + 7
+        assert shared_metrics.summary()["retired"] == retired + 1
+        assert all(entry["pid"] != pid for entry in shared_metrics.workers())
@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""
+Paylaşımlı Bellek Metrikleri Testleri - CI/CD Pipeline için
+"""
+
+import os
+import sys
+
+import pytest
+
+# Src dizinini path'e ekle
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from metrics import Counter, Gauge, Histogram  # noqa: E402
+from shared_metrics import SharedMetrics  # noqa: E402
+
+requires_fork = pytest.mark.skipif(not hasattr(os, "fork"), reason="fork gerekli")
+
+
+@pytest.fixture
+def store():
+    """Tek process'e bağlı küçük store"""
+    store = SharedMetrics(
+        counters=("requests",),
+        gauges=("in_flight",),
+        histograms={"duration": (0.1, 1.0)},
+        slots=4,
+    )
+    store.attach()
+    return store
+
+
+def run_worker(store, slot, requests=0, in_flight=0, observations=()):
+    """Fork edilen process'te slot'a bağlanıp yaz; pid döndür"""
+    pid = os.fork()
+    if pid == 0:
+        store.attach(slot)
+        store.counter("requests").add(requests)
+        store.counter("in_flight").add(in_flight)
+        for value in observations:
+            store.histogram("duration").observe(value)
+        os._exit(0)
+    os.waitpid(pid, 0)
+    return pid
+
+
+class TestSharedMetrics:
+    """SharedMetrics testleri"""
+
+    def test_counter_and_histogram(self, store):
+        """Sayaç ve histogram ShardedCounter/ShardedHistogram gibi davranmalı"""
+        store.counter("requests").add()
+        store.counter("requests").add(2)
+        histogram = store.histogram("duration")
+        for value in (0.05, 0.5, 5.0):
+            histogram.observe(value)
+
+        assert store.counter("requests").value() == 3
+        assert histogram.snapshot() == {"counts": [1, 1, 1], "sum": 5.55, "count": 3}
+
+    def test_unknown_metric(self, store):
+        """Tanımsız isim veya yanlış tip KeyError vermeli"""
+        with pytest.raises(KeyError):
+            store.counter("missing")
+        with pytest.raises(KeyError):
+            store.counter("duration")
+
+    def test_unattached_writes_are_dropped(self):
+        """Slot'a bağlı olmayan process'in yazdıkları yok sayılmalı"""
+        store = SharedMetrics(counters=("requests",), slots=2)
+
+        store.counter("requests").add(5)
+
+        assert store.slot is None
+        assert store.counter("requests").value() == 0
+
+    def test_slots_exhausted(self):
+        """Boş slot kalmayınca attach None döndürmeli"""
+        store = SharedMetrics(counters=("requests",), slots=2)
+
+        assert store.attach() == 1
+        assert store.reserve_slot() is None
+        assert store.attach() is None
+
+    @requires_fork
+    def test_aggregates_across_processes(self, store):
+        """Farklı process'lerin yazdıkları tek okumada toplanmalı"""
+        store.counter("requests").add(1)
+        slot = store.reserve_slot()
+        pid = run_worker(store, slot, requests=10, in_flight=2, observations=(0.5,))
+
+        assert store.counter("requests").value() == 11
+        assert store.counter("in_flight").value() == 2
+        assert store.histogram("duration").snapshot()["count"] == 1
+        workers = {entry["slot"]: entry for entry in store.workers()}
+        assert workers[slot]["pid"] == pid
+        assert workers[slot]["requests"] == 10
+
+    @requires_fork
+    def test_fork_does_not_inherit_slot(self, store):
+        """Fork edilen process bağlanmadan ebeveynin slot'una yazmamalı"""
+        pid = os.fork()
+        if pid == 0:
+            store.counter("requests").add(100)
+            os._exit(0 if store.slot is None else 1)
+        _, status = os.waitpid(pid, 0)
+
+        assert os.WEXITSTATUS(status) == 0
+        assert store.counter("requests").value() == 0
+
+    @requires_fork
+    def test_retire_keeps_counters_drops_gauges(self, store):
+        """Çıkan worker'ın sayaçları kalmalı, gauge'ları düşmeli"""
+        slot = store.reserve_slot()
+        pid = run_worker(store, slot, requests=4, in_flight=3, observations=(0.05,))
+
+        store.retire(slot, pid)
+
+        assert store.counter("requests").value() == 4
+        assert store.counter("in_flight").value() == 0
+        assert store.histogram("duration").snapshot()["counts"] == [1, 0, 0]
+        assert store.summary()["retired"] == 1
+        assert [entry["slot"] for entry in store.workers()] == [store.slot]
+
+    @requires_fork
+    def test_dead_worker_slot_is_reclaimed(self, store):
+        """child_exit çalışmasa da ölü process'in slot'u yeniden kullanılmalı"""
+        slot = store.reserve_slot()
+        run_worker(store, slot, requests=6)
+
+        # Worker öldü ama slot hâlâ onun; bir sonraki atama slot'u geri alır
+        assert store.reserve_slot() == slot
+        assert store.counter("requests").value() == 6
+        assert store.summary()["retired"] == 1
+
+    def test_retire_ignores_reassigned_slot(self, store):
+        """pid uyuşmazsa (slot başka process'e geçtiyse) retire bir şey yapmamalı"""
+        store.counter("requests").add(2)
+
+        store.retire(store.slot, pid=-1)
+
+        assert store.summary()["active"] == 1
+        assert store.summary()["retired"] == 0
+        assert store.counter("requests").value() == 2
+
+    def test_detach(self, store):
+        """detach slot'u boşaltmalı, çıkan worker sayılmamalı"""
+        store.counter("requests").add(3)
+
+        store.detach()
+
+        summary = store.summary()
+        assert store.slot is None
+        assert (summary["active"], summary["retired"]) == (0, 0)
+        assert store.counter("requests").value() == 3
+
+
+class TestSharedFamilies:
+    """Etiketli Prometheus metriklerinin paylaşımlı bellekte tutulması"""
+
+    @pytest.fixture
+    def families(self):
+        """Paylaşımlı store'a bağlı sayaç, gauge ve histogram"""
+        requests = Counter("requests_total", "İstekler", ("status",))
+        in_flight = Gauge("in_flight", "İşlemdeki istekler")
+        duration = Histogram("duration_seconds", "Süre", buckets=(0.1, 1.0))
+        store = SharedMetrics(families=(requests, in_flight, duration), slots=4)
+        store.attach()
+        return store, requests, in_flight, duration
+
+    def test_single_process(self, families):
+        """Tek process'te metrikler normal sayaç/histogram gibi davranmalı"""
+        _, requests, in_flight, duration = families
+
+        requests.labels("200").add(2)
+        in_flight.inc()
+        for value in (0.05, 0.5, 5.0):
+            duration.observe(value)
+
+        assert requests.value("200") == 2
+        assert in_flight.value() == 1
+        assert duration.labels().snapshot() == {
+            "counts": [1, 1, 1],
+            "sum": 5.55,
+            "count": 3,
+        }
+        assert 'requests_total{status="200"} 2' in requests.render()
+
+    @requires_fork
+    def test_series_are_summed_across_processes(self, families):
+        """Farklı worker'ların serileri label bazında toplanmalı"""
+        store, requests, in_flight, duration = families
+        requests.labels("200").add(1)
+        slot = store.reserve_slot()
+
+        pid = os.fork()
+        if pid == 0:
+            store.attach(slot)
+            requests.labels("200").add(2)
+            requests.labels("500").add(1)
+            in_flight.inc(3)
+            duration.observe(0.5)
+            os._exit(0)
+        os.waitpid(pid, 0)
+
+        assert [(key, child.value()) for key, child in requests.collect()] == [
+            (("200",), 3),
+            (("500",), 1),
+        ]
+        assert in_flight.value() == 3
+        assert 'duration_seconds_bucket{le="1.0"} 1' in duration.render()
+
+        store.retire(slot, pid)
+
+        # Sayaç ve histogram toplamda kalır, gauge düşer
+        assert requests.value("200") == 3
+        assert requests.value("500") == 1
+        assert in_flight.value() == 0
+        assert duration.labels().snapshot()["count"] == 1
+
+    def test_series_limit(self):
+        """max_series aşılınca yeni seriler yok sayılmalı"""
+        requests = Counter("limited_total", "İstekler", ("status",))
+        store = SharedMetrics(families=(requests,), slots=2, max_series=1)
+        store.attach()
+
+        requests.labels("200").add()
+        requests.labels("500").add()
+
+        assert [key for key, _ in requests.collect()] == [("200",)]
+        assert requests.value("500") == 0
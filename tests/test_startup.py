@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Başlangıç Süresi Testleri - CI/CD Pipeline için
+Uygulama temiz bir Python process'inde import edilir; ölçüm test
+oturumunda zaten yüklenmiş modüllerden etkilenmez.
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+SRC_DIR = os.path.join(os.path.dirname(__file__), "..", "src")
+
+# Import + ilk request için bütçe (yavaş CI makineleri için env ile artırılabilir)
+STARTUP_BUDGET_MS = float(os.environ.get("STARTUP_BUDGET_MS", 2000))
+
+STARTUP_SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+import app as app_module
+imported = time.perf_counter()
+response = app_module.app.test_client().post("/predict", json={"value": 42})
+first_request = time.perf_counter()
+print(json.dumps({
+    "status": response.status_code,
+    "import_ms": (imported - start) * 1000,
+    "time_to_first_request_ms": (first_request - start) * 1000,
+    "loaded": [name for name in ("numpy", "asyncio") if name in sys.modules],
+    "warmed_up": app_module.model_warmup.is_ready(),
+}))
+"""
+
+
+def run_startup():
+    """Temiz process'te uygulamayı başlat ve ilk request'i at"""
+    result = subprocess.run(
+        [sys.executable, "-c", STARTUP_SCRIPT],
+        cwd=SRC_DIR,
+        env=dict(os.environ, LOG_LEVEL="WARNING"),
+        capture_output=True,
+        text=True,
+        check=True,
+        timeout=60,
+    )
+    return json.loads(result.stdout.splitlines()[-1])
+
+
+class TestStartup:
+    """Soğuk başlangıç testleri"""
+
+    def test_startup_within_budget(self):
+        """Import + ilk request bütçe içinde kalmalı"""
+        # İlk çalıştırma diskten okuma ve bytecode derleme maliyetini içerir
+        timings = min(
+            (run_startup() for _ in range(3)),
+            key=lambda t: t["time_to_first_request_ms"],
+        )
+
+        assert timings["status"] == 200
+        assert timings["time_to_first_request_ms"] < STARTUP_BUDGET_MS, timings
+
+    def test_rarely_used_modules_are_lazy(self):
+        """Tekil tahmin numpy/asyncio yüklemeden çalışmalı"""
+        timings = run_startup()
+
+        assert timings["loaded"] == []
+        # Isıtma import sırasında değil main/serve tarafından başlatılır
+        assert timings["warmed_up"] is False
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+İstek Süresi Kaydı Testleri - CI/CD Pipeline için
+"""
+
+import os
+import sys
+
+# Src dizinini path'e ekle
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from timing import RequestTimingRecorder  # noqa: E402
+
+
+class TestRequestTimingRecorder:
+    """RequestTimingRecorder testleri"""
+
+    def test_ring_buffer_is_bounded(self):
+        """Buffer boyutu aşılınca en eski kayıtlar düşmeli"""
+        recorder = RequestTimingRecorder(buffer_size=10, sample_rate=1.0)
+        for i in range(25):
+            recorder.record("/predict", "POST", 200, i / 1000)
+
+        stats = recorder.endpoint_stats()["/predict"]
+        assert stats["samples"] == 10
+        assert stats["max_ms"] == 24.0
+        assert stats["p50_ms"] == 19.0
+
+    def test_slow_requests(self):
+        """Eşiği aşan istekler en yenisi önce listelenmeli"""
+        recorder = RequestTimingRecorder(slow_threshold_ms=100, sample_rate=1.0)
+        recorder.record("/predict", "POST", 200, 0.01)
+        recorder.record("/predict", "POST", 200, 0.2)
+        recorder.record("/health", "GET", 503, 0.5)
+
+        slow = recorder.slow_requests()
+        assert [item["endpoint"] for item in slow] == ["/health", "/predict"]
+        assert slow[0]["status"] == 503
+        assert slow[0]["duration_ms"] == 500.0
+        assert recorder.slow_requests(limit=1) == slow[:1]
+
+    def test_sampling(self):
+        """Örneklemede slow istekler yine de kaydedilmeli"""
+        recorder = RequestTimingRecorder(slow_threshold_ms=100, sample_rate=0.1)
+        for _ in range(100):
+            recorder.record("/predict", "POST", 200, 0.001)
+        recorder.record("/predict", "POST", 200, 0.3, sampled=False)
+
+        assert recorder.endpoint_stats()["/predict"]["samples"] == 10
+        assert len(recorder.slow_requests()) == 1
+
+    def test_sampling_disabled(self):
+        """sample_rate=0 ise sadece yavaş istekler kaydedilmeli"""
+        recorder = RequestTimingRecorder(slow_threshold_ms=100, sample_rate=0)
+        recorder.record("/predict", "POST", 200, 0.001)
+
+        assert recorder.endpoint_stats() == {}
+        assert recorder.slow_requests() == []
+
+    def test_reset(self):
+        """Reset tüm kayıtları temizlemeli"""
+        recorder = RequestTimingRecorder(slow_threshold_ms=0, sample_rate=1.0)
+        recorder.record("/predict", "POST", 200, 0.001)
+        recorder.reset()
+
+        assert recorder.endpoint_stats() == {}
+        assert recorder.slow_requests() == []
@@ -97,6 +97,19 @@ class TestResponseFormatting:
         assert result["prediction"] == 0.9
         assert result["status"] == "success"
 
+    def test_format_response_uses_model_category(self):
+        """Model kategoriyi verdiyse (tahmin tablosu) tekrar hesaplanmamalı"""
+        prediction_result = {
+            "prediction": 0.9,
+            "confidence": 0.95,
+            "model_version": "1.0",
+            "category": "medium",
+        }
+
+        result = format_response(prediction_result, {"value": 95})
+
+        assert result["category"] == "medium"
+
     def test_format_response_contains_timestamp(self):
         """Response timestamp kontrolü"""
         prediction_result = {
@@ -204,6 +217,51 @@ class TestInputValidationExtended:
         assert result["valid"] is False
 
 
+class TestSchemaValidation:
+    """INPUT_RULES sınırları ve hata kodları ile validasyon testleri"""
+
+    def test_validate_input_returns_all_errors(self):
+        """Tüm hatalar tek seferde dönmeli"""
+        result = validate_input({"value": 150, "email": "invalid", "name": "A"})
+
+        assert result["valid"] is False
+        assert result["message"] == "Value 0-100 arasında olmalı"
+        assert result["reason"] == "value_range"
+        assert [error["reason"] for error in result["errors"]] == [
+            "value_range",
+            "email_format",
+            "name_length",
+        ]
+        assert result["errors"][1]["field"] == "email"
+
+    def test_validate_input_numeric_string(self):
+        """Sayıya çevrilebilen string geçerli olmalı"""
+        assert validate_input({"value": "50"})["valid"] is True
+        assert validate_input({"value": "abc"})["reason"] == "value_type"
+        assert validate_input({"value": None})["reason"] == "value_type"
+
+    def test_validate_input_not_finite(self):
+        """NaN ve sonsuz değerler aralık dışı sayılmalı"""
+        assert validate_input({"value": float("nan")})["valid"] is False
+        assert validate_input({"value": float("inf")})["valid"] is False
+
+    def test_validate_records(self):
+        """Kayıt listesi doğrulama"""
+        from utils import validate_records
+
+        results = validate_records([{"value": 10}, {"value": -1}, []])
+
+        assert [result["valid"] for result in results] == [True, False, False]
+        assert results[2]["reason"] == "not_dict"
+
+    def test_validate_input_string_field_types(self):
+        """String olmayan email/name kendi hata koduyla reddedilmeli"""
+        assert validate_input({"email": 42})["reason"] == "email_format"
+        assert validate_input({"name": ["Test"]})["reason"] == "name_length"
+        assert validate_input({"name": "  A  "})["reason"] == "name_length"
+        assert validate_input({"name": " Ab "})["valid"] is True
+
+
 class TestStringSanitization:
     """String temizleme testleri"""
 
@@ -247,6 +305,19 @@ class TestStringSanitization:
         assert sanitize_string(123) == ""
 
 
+class TestPredictionCategory:
+    """Tahmin kategorisi testleri"""
+
+    def test_prediction_category(self):
+        """Eşik değerleri üst kategoriye dahil"""
+        from utils import prediction_category
+
+        assert prediction_category(0.7) == "high"
+        assert prediction_category(0.69) == "medium"
+        assert prediction_category(0.4) == "medium"
+        assert prediction_category(0.39) == "low"
+
+
 class TestMetricsCalculation:
     """Metrik hesaplama testleri"""
 
@@ -261,7 +332,8 @@ class TestMetricsCalculation:
         assert result["mean"] == 0.52
         assert result["min"] == 0.1
         assert result["max"] == 0.9
-        assert "std" in result
+        assert result["std"] == 0.3347
+        assert 0.3 <= result["p50"] <= 0.8
 
     def test_calculate_metrics_empty(self):
         """Boş liste metrik hesaplama"""